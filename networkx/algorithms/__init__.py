@@ -21,6 +21,7 @@ from networkx.algorithms.dominating import *
 from networkx.algorithms.efficiency import *
 from networkx.algorithms.euler import *
 from networkx.algorithms.graphical import *
+from networkx.algorithms.graph_hashing import *
 from networkx.algorithms.hierarchy import *
 from networkx.algorithms.hybrid import *
 from networkx.algorithms.link_analysis import *
@@ -92,8 +93,11 @@ from networkx.algorithms.connectivity import minimum_edge_cut
 from networkx.algorithms.connectivity import minimum_node_cut
 from networkx.algorithms.connectivity import node_connectivity
 from networkx.algorithms.connectivity import node_disjoint_paths
+from networkx.algorithms.connectivity import karger_stein
 from networkx.algorithms.connectivity import stoer_wagner
+from networkx.algorithms.flow import FlowSession
 from networkx.algorithms.flow import capacity_scaling
+from networkx.algorithms.flow import cost_scaling
 from networkx.algorithms.flow import cost_of_flow
 from networkx.algorithms.flow import gomory_hu_tree
 from networkx.algorithms.flow import max_flow_min_cost
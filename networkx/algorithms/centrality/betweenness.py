@@ -11,12 +11,14 @@
 from __future__ import division
 from heapq import heappush, heappop
 from itertools import count
+from math import ceil, floor, log, sqrt
 
 import networkx as nx
 from networkx.utils import py_random_state
 
 __all__ = ['betweenness_centrality', 'edge_betweenness_centrality',
-           'edge_betweenness']
+           'edge_betweenness', 'approximate_betweenness_centrality',
+           'DynamicBetweennessCentrality']
 
 
 @py_random_state(5)
@@ -220,6 +222,395 @@ def edge_betweenness_centrality(G, k=None, normalized=True, weight=None,
                              directed=G.is_directed())
     return betweenness
 
+
+@py_random_state(5)
+def approximate_betweenness_centrality(G, epsilon=0.01, delta=0.1,
+                                       normalized=True, weight=None,
+                                       seed=None):
+    r"""Approximate the betweenness centrality of all nodes with a
+    guaranteed accuracy.
+
+    Shortest paths between uniformly random pairs of nodes are sampled,
+    and the betweenness of each node is estimated by the fraction of
+    sampled paths going through it [1]_. With probability at least
+    $1 - \delta$, every estimate is within the returned error of the
+    betweenness computed by :func:`betweenness_centrality`.
+
+    Sampling stops as soon as the observed paths prove that the required
+    accuracy is reached, which usually happens much earlier than after
+    the number of samples that the worst case requires [2]_.
+
+    Parameters
+    ----------
+    G : graph
+      A NetworkX graph.
+
+    epsilon : float, optional (default=0.01)
+      Required accuracy of the estimates, as a fraction of the $n(n-1)$
+      ordered pairs of nodes. For normalized values the returned error
+      is at most ``epsilon * n / (n - 2)``. Must be in (0, 1).
+
+    delta : float, optional (default=0.1)
+      Allowed probability that some estimate is not within the error.
+      Must be in (0, 1).
+
+    normalized : bool, optional
+      If True the betweenness values are normalized by `2/((n-1)(n-2))`
+      for graphs, and `1/((n-1)(n-2))` for directed graphs where `n`
+      is the number of nodes in G.
+
+    weight : None or string, optional (default=None)
+      If None, all edge weights are considered equal.
+      Otherwise holds the name of the edge attribute used as weight.
+
+    seed : integer, random_state, or None (default)
+        Indicator of random number generation state.
+        See :ref:`Randomness<randomness>`.
+
+    Returns
+    -------
+    betweenness : dictionary
+       Dictionary of nodes with approximate betweenness centrality as the
+       value.
+
+    error : float
+       Bound on the absolute error of every value in `betweenness`,
+       holding with probability at least ``1 - delta``. It is expressed in
+       the same scale as the values.
+
+    Raises
+    ------
+    ValueError
+       If `epsilon` or `delta` is not in (0, 1).
+
+    Examples
+    --------
+    >>> G = nx.path_graph(5)
+    >>> bc, error = nx.approximate_betweenness_centrality(G, epsilon=0.05,
+    ...                                                   seed=42)
+    >>> exact = nx.betweenness_centrality(G)
+    >>> all(abs(bc[v] - exact[v]) <= error for v in G)
+    True
+
+    See Also
+    --------
+    betweenness_centrality
+
+    Notes
+    -----
+    The number of samples is at most
+
+    .. math::
+
+       \frac{1}{2\epsilon^2}\left(\lfloor \log_2 (VD - 2) \rfloor + 1 +
+       \ln \frac{2}{\delta}\right)
+
+    where $VD$ is an upper bound on the number of nodes of a shortest
+    path, as shown by Riondato and Kornaropoulos [1]_. For undirected,
+    unweighted graphs $VD$ is estimated from one breadth-first search in
+    each connected component, otherwise it is the size of the largest
+    (weakly) connected component.
+
+    Before this number is reached, sampling is checked after half, a
+    quarter, and so on, of the samples. At these checkpoints the error
+    on each node is bounded with Bernstein's inequality, which depends on
+    the estimate of the node itself and is therefore much smaller for
+    the many nodes of low betweenness [2]_. Half of the probability
+    `delta` is spent on these checkpoints, by a union bound over nodes
+    and checkpoints, and half on the final guarantee.
+
+    Without weights, each path is sampled with a balanced bidirectional
+    breadth-first search from both ends [2]_, which usually visits only a
+    small part of the graph. With weights, Dijkstra's algorithm is run
+    from the source until the target is reached.
+
+    For weighted graphs the edge weights must be greater than zero.
+    Zero edge weights can produce an infinite number of equal length
+    paths between pairs of nodes.
+
+    References
+    ----------
+    .. [1] Matteo Riondato and Evgenios M. Kornaropoulos:
+       Fast approximation of betweenness centrality through sampling.
+       Data Mining and Knowledge Discovery 30(2):438-475, 2016.
+       https://doi.org/10.1007/s10618-015-0423-0
+    .. [2] Michele Borassi and Emanuele Natale:
+       KADABRA is an ADaptive Algorithm for Betweenness via Random
+       Approximation. ACM Journal of Experimental Algorithmics 24, 2019.
+       https://doi.org/10.1145/3284359
+    """
+    if not 0 < epsilon < 1:
+        raise ValueError('epsilon must be in (0, 1)')
+    if not 0 < delta < 1:
+        raise ValueError('delta must be in (0, 1)')
+    n = len(G)
+    betweenness = dict.fromkeys(G, 0.0)
+    # Scale from the fraction of paths to the requested normalization.
+    if normalized:
+        scale = n / (n - 2) if n > 2 else 0.0
+    elif G.is_directed():
+        scale = n * (n - 1)
+    else:
+        scale = n * (n - 1) / 2
+    vd = _vertex_diameter_bound(G, weight)
+    if vd <= 2:  # no shortest path has an internal node
+        return betweenness, 0.0
+    samples = int(ceil((floor(log(vd - 2, 2)) + 1 + log(2 / delta)) /
+                       (2 * epsilon ** 2)))
+    checkpoints = []
+    tau = samples // 2
+    while tau >= 100:
+        checkpoints.append(tau)
+        tau //= 2
+    checkpoints.reverse()
+    if checkpoints:
+        bound = log(4 * n * len(checkpoints) / delta)
+    nodes = list(G)
+    counts = dict.fromkeys(G, 0)
+    done = 0
+    for tau in checkpoints + [samples]:
+        while done < tau:
+            s, t = seed.sample(nodes, 2)
+            for v in _sample_shortest_path(G, s, t, weight, seed):
+                counts[v] += 1
+            done += 1
+        if tau == samples:
+            error = epsilon
+            break
+        # Bernstein's inequality bounds the deviation of the mean b~ of tau
+        # Bernoulli(b) variables by sqrt(2 b L) + 2 L / 3. The largest b
+        # compatible with b~ is found by solving for sqrt(b).
+        L = bound / tau
+        error = 0.0
+        for c in counts.values():
+            root = (sqrt(2 * L) + sqrt(2 * L + 4 * c / tau + 8 * L / 3)) / 2
+            error = max(error, sqrt(2 * L) * root + 2 * L / 3)
+        if error <= epsilon:
+            break
+    for v, c in counts.items():
+        betweenness[v] = c / done * scale
+    return betweenness, error * scale
+
+
+class DynamicBetweennessCentrality(object):
+    """Betweenness centrality maintained under edge updates.
+
+    The structure runs :func:`betweenness_centrality` once, keeping for
+    each source node its shortest path distances and its contribution to
+    the betweenness of every other node. When an edge is added, removed
+    or reweighted through the methods of this class, only the sources
+    whose shortest paths can change are recomputed:
+
+    - a new or lighter edge `(u, v)` affects the sources from which the
+      path to `v` through `u` is no longer than the shortest known one,
+    - a removed or heavier edge affects the sources for which it lies on
+      a shortest path.
+
+    Any other source keeps the same shortest path DAG and contribution.
+    `G` must only be modified through the methods of this class.
+
+    Parameters
+    ----------
+    G : graph
+      A NetworkX graph.
+
+    normalized : bool, optional
+      If True the betweenness values are normalized by `2/((n-1)(n-2))`
+      for graphs, and `1/((n-1)(n-2))` for directed graphs where `n`
+      is the number of nodes in G.
+
+    weight : None or string, optional (default=None)
+      If None, all edge weights are considered equal.
+      Otherwise holds the name of the edge attribute used as weight.
+
+    endpoints : bool, optional
+      If True include the endpoints in the shortest path counts.
+
+    Attributes
+    ----------
+    graph : graph
+      The graph `G`.
+
+    Raises
+    ------
+    NetworkXNotImplemented
+      If `G` is a multigraph.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(4)
+    >>> dbc = nx.DynamicBetweennessCentrality(G, normalized=False)
+    >>> dbc.betweenness()
+    {0: 0.0, 1: 2.0, 2: 2.0, 3: 0.0}
+    >>> dbc.add_edge(0, 3)
+    >>> dbc.betweenness()
+    {0: 0.5, 1: 0.5, 2: 0.5, 3: 0.5}
+
+    See Also
+    --------
+    betweenness_centrality
+
+    Notes
+    -----
+    The stored distances and contributions take $O(n^2)$ memory. Each
+    update costs one single-source shortest path computation per
+    affected source; on graphs with many alternative shortest paths
+    this is usually a small fraction of the sources.
+
+    For weighted graphs the edge weights must be greater than zero.
+    """
+
+    def __init__(self, G, normalized=True, weight=None, endpoints=False):
+        if G.is_multigraph():
+            raise nx.NetworkXNotImplemented('not implemented for multigraph '
+                                            'type')
+        self.graph = G
+        self.normalized = normalized
+        self.weight = weight
+        self.endpoints = endpoints
+        self._dist = {}
+        self._contrib = {}
+        self._raw = dict.fromkeys(G, 0.0)
+        for s in G:
+            self._compute_source(s)
+
+    def _edge_weight(self, u, v):
+        if self.weight is None:
+            return 1
+        return self.graph[u][v].get(self.weight, 1)
+
+    def _compute_source(self, s):
+        """Computes and adds the contribution of source `s`."""
+        G = self.graph
+        if self.weight is None:
+            S, P, sigma = _single_source_shortest_path_basic(G, s)
+        else:
+            S, P, sigma = _single_source_dijkstra_path_basic(G, s,
+                                                             self.weight)
+        dist = {s: 0}
+        for w in S[1:]:
+            v = P[w][0]
+            dist[w] = dist[v] + self._edge_weight(v, w)
+        contrib = dict.fromkeys(S, 0.0)
+        if self.endpoints:
+            contrib = _accumulate_endpoints(contrib, S, P, sigma, s)
+        else:
+            contrib = _accumulate_basic(contrib, S, P, sigma, s)
+        for v, c in contrib.items():
+            self._raw[v] += c
+        self._dist[s] = dist
+        self._contrib[s] = contrib
+
+    def _update_source(self, s):
+        """Recomputes the contribution of source `s`."""
+        for v, c in self._contrib[s].items():
+            self._raw[v] -= c
+        self._compute_source(s)
+
+    def _arcs(self, u, v):
+        if self.graph.is_directed():
+            return ((u, v),)
+        return ((u, v), (v, u))
+
+    def _tight(self, u, v, wt):
+        """Returns the sources with a shortest path using the edge
+        `(u, v)` of weight `wt`."""
+        return [s for s, dist in self._dist.items()
+                if any(a in dist and b in dist and dist[a] + wt == dist[b]
+                       for a, b in self._arcs(u, v))]
+
+    def _improved(self, u, v, wt):
+        """Returns the sources with a shortest path that the edge `(u, v)`
+        of weight `wt` would shorten or duplicate."""
+        return [s for s, dist in self._dist.items()
+                if any(a in dist and (b not in dist or
+                                      dist[a] + wt <= dist[b])
+                       for a, b in self._arcs(u, v))]
+
+    def _add_node(self, n):
+        self.graph.add_node(n)
+        self._raw[n] = 0.0
+        self._compute_source(n)
+
+    def betweenness(self):
+        """Returns a dictionary of nodes with betweenness centrality as
+        the value."""
+        return _rescale(dict(self._raw), len(self.graph),
+                        normalized=self.normalized,
+                        directed=self.graph.is_directed(),
+                        endpoints=self.endpoints)
+
+    def add_node(self, n, **attr):
+        """Add the node `n`, updating node attributes if present."""
+        if n not in self.graph:
+            self._add_node(n)
+        self.graph.add_node(n, **attr)
+
+    def add_edge(self, u, v, **attr):
+        """Add an edge between `u` and `v`, or update its attributes.
+
+        Updating the weight of an existing edge updates the betweenness.
+        """
+        G = self.graph
+        for n in (u, v):
+            if n not in G:
+                self._add_node(n)
+        if G.has_edge(u, v):
+            old = self._edge_weight(u, v)
+            G.add_edge(u, v, **attr)
+            new = self._edge_weight(u, v)
+            if new == old:
+                return
+            affected = set(self._tight(u, v, old))
+        else:
+            G.add_edge(u, v, **attr)
+            new = self._edge_weight(u, v)
+            affected = set()
+        affected.update(self._improved(u, v, new))
+        for s in affected:
+            self._update_source(s)
+
+    def remove_edge(self, u, v):
+        """Remove the edge between `u` and `v`.
+
+        Raises
+        ------
+        NetworkXError
+            If there is not an edge between `u` and `v`.
+        """
+        G = self.graph
+        if not G.has_edge(u, v):
+            raise nx.NetworkXError("The edge %s-%s is not in the graph."
+                                   % (u, v))
+        affected = self._tight(u, v, self._edge_weight(u, v))
+        G.remove_edge(u, v)
+        for s in affected:
+            self._update_source(s)
+
+    def remove_node(self, n):
+        """Remove node `n` and its incident edges.
+
+        Raises
+        ------
+        NetworkXError
+            If `n` is not in the graph.
+        """
+        G = self.graph
+        if n not in G:
+            raise nx.NetworkXError("The node %s is not in the graph." % (n,))
+        edges = list(G.edges(n))
+        if G.is_directed():
+            edges.extend(G.in_edges(n))
+        for u, v in edges:
+            if G.has_edge(u, v):
+                self.remove_edge(u, v)
+        G.remove_node(n)
+        for v, c in self._contrib.pop(n).items():
+            self._raw[v] -= c
+        del self._dist[n]
+        del self._raw[n]
+
+
 # obsolete name
 
 
@@ -289,6 +680,134 @@ def _single_source_dijkstra_path_basic(G, s, weight):
     return S, P, sigma
 
 
+def _vertex_diameter_bound(G, weight):
+    """Returns an upper bound on the number of nodes of a shortest path."""
+    if G.is_directed():
+        components = nx.weakly_connected_components(G)
+    else:
+        components = nx.connected_components(G)
+    if G.is_directed() or weight is not None:
+        return max((len(c) for c in components), default=0)
+    # In an undirected graph a shortest path has at most twice the
+    # eccentricity of any node of its component plus one nodes.
+    vd = 0
+    for c in components:
+        v = next(iter(c))
+        ecc = max(nx.single_source_shortest_path_length(G, v).values())
+        vd = max(vd, min(2 * ecc + 1, len(c)))
+    return vd
+
+
+def _sample_shortest_path(G, s, t, weight, seed):
+    """Returns the internal nodes of a uniformly random shortest path
+    from `s` to `t`, or an empty list if there is no such path.
+
+    The search stops once all shortest paths to `t` are known. Without
+    weights, it is a balanced bidirectional breadth-first search, which
+    always extends the side whose frontier has fewer edges.
+
+    """
+    if weight is not None:
+        return _sample_shortest_path_dijkstra(G, s, t, weight, seed)
+    if s == t:
+        return []
+    succ = G._succ if G.is_directed() else G._adj
+    pred = G._pred if G.is_directed() else G._adj
+    # Distances, numbers of shortest paths and predecessors from s (index
+    # 0) and towards t (index 1).
+    D = ({s: 0}, {t: 0})
+    sigma = ({s: 1}, {t: 1})
+    P = ({s: []}, {t: []})
+    frontiers = [[s], [t]]
+    nbrs = (succ, pred)
+    while frontiers[0] and frontiers[1]:
+        cost = [sum(len(nbrs[i][v]) for v in frontiers[i]) for i in (0, 1)]
+        i = 0 if cost[0] <= cost[1] else 1
+        Di, sigmai, Pi = D[i], sigma[i], P[i]
+        layer = []
+        for v in frontiers[i]:
+            dist = Di[v] + 1
+            for w in nbrs[i][v]:
+                if w not in Di:
+                    Di[w] = dist
+                    sigmai[w] = 0
+                    Pi[w] = []
+                    layer.append(w)
+                if Di[w] == dist:
+                    sigmai[w] += sigmai[v]
+                    Pi[w].append(v)
+        frontiers[i] = layer
+        # The first nodes found from both sides are exactly the nodes of
+        # the new layer through which shortest paths go.
+        meet = [w for w in layer if w in D[1 - i]]
+        if meet:
+            break
+    else:
+        return []
+    r = seed.random() * sum(sigma[0][w] * sigma[1][w] for w in meet)
+    for w in meet:
+        r -= sigma[0][w] * sigma[1][w]
+        if r < 0:
+            break
+    path = [] if w == s or w == t else [w]
+    for i, end in ((0, s), (1, t)):
+        v = w
+        while v != end:
+            v = _random_predecessor(P[i][v], sigma[i], seed)
+            if v != end:
+                path.append(v)
+    return path
+
+
+def _random_predecessor(preds, sigma, seed):
+    """Returns a node of `preds` with probability proportional to its
+    number of shortest paths."""
+    r = seed.random() * sum(sigma[v] for v in preds)
+    for v in preds:
+        r -= sigma[v]
+        if r < 0:
+            break
+    return v
+
+
+def _sample_shortest_path_dijkstra(G, s, t, weight, seed):
+    """Weighted version of :func:`_sample_shortest_path`."""
+    P = {s: []}
+    sigma = {s: 1.0}
+    D = {}
+    seen = {s: 0}
+    c = count()
+    Q = []
+    heappush(Q, (0, next(c), s, s))
+    while Q:
+        (dist, _, pred, v) = heappop(Q)
+        if v in D:
+            continue
+        if v != s:
+            sigma[v] += sigma[pred]
+        D[v] = dist
+        if v == t:
+            break
+        for w, edgedata in G[v].items():
+            vw_dist = dist + edgedata.get(weight, 1)
+            if w not in D and (w not in seen or vw_dist < seen[w]):
+                seen[w] = vw_dist
+                heappush(Q, (vw_dist, next(c), v, w))
+                sigma[w] = 0.0
+                P[w] = [v]
+            elif vw_dist == seen[w]:
+                sigma[w] += sigma[v]
+                P[w].append(v)
+    if t not in D:
+        return []
+    path = []
+    v = _random_predecessor(P[t], sigma, seed)
+    while v != s:
+        path.append(v)
+        v = _random_predecessor(P[v], sigma, seed)
+    return path
+
+
 def _accumulate_basic(betweenness, S, P, sigma, s):
     delta = dict.fromkeys(S, 0)
     while S:
@@ -12,10 +12,22 @@
 """
 Closeness centrality measures.
 """
+from __future__ import division
 import functools
+from heapq import heappush, heapreplace, nlargest
+
 import networkx as nx
 
-__all__ = ['closeness_centrality']
+__all__ = ['closeness_centrality', 'top_k_closeness_centrality']
+
+try:
+    _popcount = int.bit_count
+except AttributeError:
+    def _popcount(x):
+        return bin(x).count('1')
+
+#: Number of sources explored together by :func:`_batched_bfs_sums`.
+BFS_BATCH_SIZE = 256
 
 
 def closeness_centrality(G, u=None, distance=None, wf_improved=True):
@@ -86,6 +98,11 @@ def closeness_centrality(G, u=None, distance=None, wf_improved=True):
     shortest-path length will be computed using Dijkstra's algorithm with
     that edge attribute as the edge weight.
 
+    Without distances, the closeness of all nodes is computed with
+    bit-parallel breadth-first searches [3]_, which explore the graph
+    from many sources at once and add up the distances found at each
+    node.
+
     In NetworkX 2.2 and earlier a bug caused Dijkstra's algorithm to use the
     outward distance rather than the inward distance. If you use a 'distance'
     keyword and a DiGraph, your results will change between v2.2 and v2.3.
@@ -98,7 +115,26 @@ def closeness_centrality(G, u=None, distance=None, wf_improved=True):
     .. [2] pg. 201 of Wasserman, S. and Faust, K.,
        Social Network Analysis: Methods and Applications, 1994,
        Cambridge University Press.
+    .. [3] Yuichi Yoshida:
+       Almost linear-time algorithms for adaptive betweenness centrality
+       using hypergraph sketches.
+       Proceedings of KDD 2014, pp. 1416-1425.
+       Section 5, bit-parallel BFS.
     """
+    if u is None and distance is None:
+        # Accumulate the distances from all sources to each node at once.
+        reached, totsp = _batched_bfs_sums(G)
+        closeness_centrality = {}
+        for n in G:
+            if totsp[n] > 0.0 and len(G) > 1:
+                closeness_centrality[n] = (reached[n] - 1.0) / totsp[n]
+                if wf_improved:
+                    s = (reached[n] - 1.0) / (len(G) - 1)
+                    closeness_centrality[n] *= s
+            else:
+                closeness_centrality[n] = 0.0
+        return closeness_centrality
+
     if G.is_directed():
         G = G.reverse()  # create a reversed graph view
 
@@ -129,3 +165,195 @@ def closeness_centrality(G, u=None, distance=None, wf_improved=True):
         return closeness_centrality[u]
     else:
         return closeness_centrality
+
+
+def _batched_bfs_sums(G, harmonic=False):
+    """Returns, for every node `u`, the number of nodes reaching `u` and
+    the sum of their distances to `u`.
+
+    The number of nodes includes `u` itself. If `harmonic` is True, the
+    sum of the reciprocal distances is returned instead of the sum of
+    distances.
+
+    Breadth-first searches from :data:`BFS_BATCH_SIZE` sources are run
+    together: each node keeps an integer whose bit ``i`` tells whether the
+    ``i``-th source of the batch has reached it, so that one pass over the
+    edges advances all the searches of the batch by one level.
+
+    """
+    succ = G._succ if G.is_directed() else G._adj
+    nodes = list(G)
+    reached = dict.fromkeys(G, 0)
+    total = dict.fromkeys(G, 0)
+    for start in range(0, len(nodes), BFS_BATCH_SIZE):
+        batch = nodes[start:start + BFS_BATCH_SIZE]
+        seen = {}
+        frontier = {}
+        for i, s in enumerate(batch):
+            seen[s] = frontier[s] = 1 << i
+            reached[s] += 1
+        level = 0
+        while frontier:
+            level += 1
+            incoming = {}
+            for v, bits in frontier.items():
+                for w in succ[v]:
+                    if w in incoming:
+                        incoming[w] |= bits
+                    else:
+                        incoming[w] = bits
+            frontier = {}
+            for w, bits in incoming.items():
+                new = bits & ~seen.get(w, 0)
+                if new:
+                    seen[w] = seen.get(w, 0) | new
+                    frontier[w] = new
+                    count = _popcount(new)
+                    reached[w] += count
+                    if harmonic:
+                        total[w] += count / level
+                    else:
+                        total[w] += count * level
+    return reached, total
+
+
+def top_k_closeness_centrality(G, k, wf_improved=True):
+    r"""Returns the `k` nodes of largest closeness centrality.
+
+    The closeness centrality of a node is defined as for
+    :func:`closeness_centrality`, without edge distances. Instead of
+    running a complete breadth-first search from every node, the search
+    from a node stops as soon as a bound on the distances it has not
+    found yet proves that its closeness is smaller than the `k`-th
+    largest closeness found so far [1]_. Nodes are processed by
+    decreasing degree, so that the central ones are found early.
+
+    Parameters
+    ----------
+    G : graph
+      A NetworkX graph
+
+    k : int
+      Number of nodes to return.
+
+    wf_improved : bool, optional (default=True)
+      If True, scale by the fraction of nodes reachable. This gives the
+      Wasserman and Faust improved formula. For single component graphs
+      it is the same as the original formula.
+
+    Returns
+    -------
+    list
+      List of the `k` pairs ``(node, closeness)`` of largest closeness,
+      by decreasing closeness. Ties are broken arbitrarily. If `G` has
+      fewer than `k` nodes, all the nodes are returned.
+
+    Raises
+    ------
+    ValueError
+      If `k` is negative.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(5)
+    >>> nx.top_k_closeness_centrality(G, 2)
+    [(2, 0.6666666666666666), (1, 0.5714285714285714)]
+
+    See Also
+    --------
+    closeness_centrality
+
+    Notes
+    -----
+    After the search from node `u` has found all the nodes at distance at
+    most `d` from `u`, the nodes at distance `d + 1` are at most as many
+    as the edges leaving the last level, and all the others are at
+    distance at least `d + 2`. This gives a lower bound on the sum of the
+    distances to `u` and hence an upper bound on its closeness. For
+    undirected graphs the number of nodes reaching `u` is the size of its
+    connected component; for directed graphs it is bounded by the number
+    of nodes of `G`, which makes the bound less effective.
+
+    References
+    ----------
+    .. [1] Elisabetta Bergamini, Michele Borassi, Pierluigi Crescenzi,
+       Andrea Marino and Henning Meyerhenke:
+       Computing top-k closeness centrality faster in unweighted graphs.
+       ACM Transactions on Knowledge Discovery from Data 13(5), 2019.
+       https://doi.org/10.1145/3344719
+    """
+    if k < 0:
+        raise ValueError('k must be non-negative')
+    N = len(G)
+    if k == 0 or N == 0:
+        return []
+    if G.is_directed():
+        nbrs = G._pred  # closeness uses the distances towards a node
+        reach = dict.fromkeys(G, N)
+        degree = G.in_degree
+        tree_edge = 0
+    else:
+        nbrs = G._adj
+        reach = {}
+        for c in nx.connected_components(G):
+            reach.update(dict.fromkeys(c, len(c)))
+        degree = G.degree
+        tree_edge = 1
+
+    def value(r, total):
+        """Closeness of a node reached by `r` nodes at total distance
+        `total`."""
+        if total == 0 or N == 1:
+            return 0.0
+        c = (r - 1) / total
+        if wf_improved:
+            c *= (r - 1) / (N - 1)
+        return c
+
+    top = []  # heap of (closeness, index, node) of the best nodes so far
+    order = sorted(G, key=degree, reverse=True)
+    for i, u in enumerate(order):
+        threshold = top[0][0] if len(top) == k else -1.0
+        dist = {u: 0}
+        frontier = [u]
+        total = 0
+        d = 0
+        pruned = False
+        while frontier:
+            # Number of edges leaving the frontier towards the next level.
+            out = sum(len(nbrs[v]) for v in frontier)
+            if d > 0:
+                out -= tree_edge * len(frontier)
+            r = len(dist)
+            if threshold >= 0 and r < reach[u]:
+                # Largest possible closeness, for each number x of nodes
+                # still to be found, is reached at the ends of the
+                # intervals where the lower bound on distances is linear.
+                X = reach[u] - r
+                bound = 0.0
+                for x in {0, min(out, X), X}:
+                    if x <= out:
+                        rest = total + (d + 1) * x
+                    else:
+                        rest = total + (d + 1) * out + (d + 2) * (x - out)
+                    bound = max(bound, value(r + x, rest))
+                if bound < threshold:
+                    pruned = True
+                    break
+            d += 1
+            layer = []
+            for v in frontier:
+                for w in nbrs[v]:
+                    if w not in dist:
+                        dist[w] = d
+                        layer.append(w)
+            total += d * len(layer)
+            frontier = layer
+        if pruned:
+            continue
+        c = value(len(dist), total)
+        if len(top) < k:
+            heappush(top, (c, i, u))
+        elif c > top[0][0]:
+            heapreplace(top, (c, i, u))
+    return [(u, c) for c, i, u in nlargest(k, top)]
@@ -50,8 +50,9 @@ def approximate_current_flow_betweenness_centrality(G, normalized=True,
 
     solver : string (default='lu')
        Type of linear solver to use for computing the flow matrix.
-       Options are "full" (uses most memory), "lu" (recommended), and
-       "cg" (uses least memory).
+       Options are "full" (uses most memory), "lu" (recommended),
+       "cg" (uses least memory), and "amg" (conjugate gradient with a
+       multigrid preconditioner, for large sparse graphs).
 
     epsilon: float
         Absolute error tolerance.
@@ -101,9 +102,6 @@ def approximate_current_flow_betweenness_centrality(G, normalized=True,
                           'http://scipy.org/')
     if not nx.is_connected(G):
         raise nx.NetworkXError("Graph not connected.")
-    solvername = {"full": FullInverseLaplacian,
-                  "lu": SuperLUInverseLaplacian,
-                  "cg": CGInverseLaplacian}
     n = G.number_of_nodes()
     ordering = list(reverse_cuthill_mckee_ordering(G))
     # make a copy with integer labels according to rcm ordering
@@ -111,8 +109,7 @@ def approximate_current_flow_betweenness_centrality(G, normalized=True,
     H = nx.relabel_nodes(G, dict(zip(ordering, range(n))))
     L = laplacian_sparse_matrix(H, nodelist=range(n), weight=weight,
                                 dtype=dtype, format='csc')
-    C = solvername[solver](L, dtype=dtype)  # initialize solver
-    betweenness = dict.fromkeys(H, 0.0)
+    C = inverse_laplacian_solver(solver)(L, width=1, dtype=dtype)
     nb = (n - 1.0) * (n - 2.0)  # normalization factor
     cstar = n * (n - 1) / nb
     l = 1  # parameter in approximation, adjustable
@@ -121,24 +118,35 @@ def approximate_current_flow_betweenness_centrality(G, normalized=True,
         msg = 'Number random pairs k>kmax (%d>%d) ' % (k, kmax)
         raise nx.NetworkXError(msg, 'Increase kmax or epsilon')
     cstar2k = cstar / (2 * k)
-    for i in range(k):
-        s, t = seed.sample(range(n), 2)
-        b = np.zeros(n, dtype=dtype)
-        b[s] = 1
-        b[t] = -1
-        p = C.solve(b)
-        for v in H:
-            if v == s or v == t:
-                continue
-            for nbr in H[v]:
-                w = H[v][nbr].get(weight, 1.0)
-                betweenness[v] += w * np.abs(p[v] - p[nbr]) * cstar2k
+    pairs = np.array([seed.sample(range(n), 2) for i in range(k)])
+    u, v, w = zip(*((u, v, d.get(weight, 1.0))
+                    for u, v, d in H.edges(data=True)))
+    m = len(w)
+    # unsigned incidence matrix, to sum edge currents at their endpoints
+    edge_index = 2 * list(range(m))
+    incidence = sparse.csr_matrix((np.ones(2 * m), (u + v, edge_index)),
+                                  shape=(n, m))
+    u, v, w = np.array(u), np.array(v), np.array(w, dtype=dtype)
+    betweenness = np.zeros(n)
+    # solve for the potentials of a block of pairs at once
+    for start in range(0, k, FLOW_BLOCK_SIZE):
+        s, t = pairs[start:start + FLOW_BLOCK_SIZE].T
+        cols = np.arange(len(s))
+        b = np.zeros((n, len(s)), dtype=dtype)
+        b[s, cols] = 1
+        b[t, cols] = -1
+        p = C.solve_block(b)
+        current = incidence.dot(w[:, np.newaxis] * np.abs(p[u] - p[v]))
+        current[s, cols] = 0
+        current[t, cols] = 0
+        betweenness += current.sum(axis=1) * cstar2k
     if normalized:
         factor = 1.0
     else:
         factor = nb / 2.0
     # remap to original node names and "unnormalize" if required
-    return dict((ordering[k], float(v * factor)) for k, v in betweenness.items())
+    return dict((ordering[k], float(v * factor))
+                for k, v in enumerate(betweenness))
 
 
 @not_implemented_for('directed')
@@ -172,8 +180,9 @@ def current_flow_betweenness_centrality(G, normalized=True, weight=None,
 
     solver : string (default='lu')
        Type of linear solver to use for computing the flow matrix.
-       Options are "full" (uses most memory), "lu" (recommended), and
-       "cg" (uses least memory).
+       Options are "full" (uses most memory), "lu" (recommended),
+       "cg" (uses least memory), and "amg" (conjugate gradient with a
+       multigrid preconditioner, for large sparse graphs).
 
     Returns
     -------
@@ -229,20 +238,20 @@ def current_flow_betweenness_centrality(G, normalized=True, weight=None,
     # make a copy with integer labels according to rcm ordering
     # this could be done without a copy if we really wanted to
     H = nx.relabel_nodes(G, dict(zip(ordering, range(n))))
-    betweenness = dict.fromkeys(H, 0.0)  # b[v]=0 for v in H
-    for row, (s, t) in flow_matrix_row(H, weight=weight, dtype=dtype,
-                                       solver=solver):
-        pos = dict(zip(row.argsort()[::-1], range(n)))
-        for i in range(n):
-            betweenness[s] += (i - pos[i]) * row[i]
-            betweenness[t] += (n - i - 1 - pos[i]) * row[i]
+    betweenness = np.zeros(n)
+    for F, edges in flow_matrix_block(H, weight=weight, dtype=dtype,
+                                      solver=solver):
+        pos = _flow_ranks(F)
+        s, t = np.array(edges).T
+        i = np.arange(n)
+        np.add.at(betweenness, s, ((i - pos) * F).sum(axis=1))
+        np.add.at(betweenness, t, ((n - i - 1 - pos) * F).sum(axis=1))
     if normalized:
         nb = (n - 1.0) * (n - 2.0)  # normalization factor
     else:
         nb = 2.0
-    for v in H:
-        betweenness[v] = float((betweenness[v] - v) * 2.0 / nb)
-    return dict((ordering[k], v) for k, v in betweenness.items())
+    betweenness = (betweenness - np.arange(n)) * 2.0 / nb
+    return dict((ordering[k], float(v)) for k, v in enumerate(betweenness))
 
 
 @not_implemented_for('directed')
@@ -277,8 +286,9 @@ def edge_current_flow_betweenness_centrality(G, normalized=True,
 
     solver : string (default='lu')
        Type of linear solver to use for computing the flow matrix.
-       Options are "full" (uses most memory), "lu" (recommended), and
-       "cg" (uses least memory).
+       Options are "full" (uses most memory), "lu" (recommended),
+       "cg" (uses least memory), and "amg" (conjugate gradient with a
+       multigrid preconditioner, for large sparse graphs).
 
     Returns
     -------
@@ -347,17 +357,25 @@ def edge_current_flow_betweenness_centrality(G, normalized=True,
         nb = (n - 1.0) * (n - 2.0)  # normalization factor
     else:
         nb = 2.0
-    for row, (e) in flow_matrix_row(H, weight=weight, dtype=dtype,
-                                    solver=solver):
-        pos = dict(zip(row.argsort()[::-1], range(1, n + 1)))
-        for i in range(n):
-            betweenness[e] += (i + 1 - pos[i]) * row[i]
-            betweenness[e] += (n - i - pos[i]) * row[i]
-        betweenness[e] /= nb
+    for F, edges in flow_matrix_block(H, weight=weight, dtype=dtype,
+                                      solver=solver):
+        pos = _flow_ranks(F)
+        values = ((n - 1 - 2 * pos) * F).sum(axis=1) / nb
+        for e, value in zip(edges, values):
+            betweenness[e] += value
     return dict(((ordering[s], ordering[t]), float(v))
                 for (s, t), v in betweenness.items())
 
 
+def _flow_ranks(F):
+    # Position of each entry in its row of F when sorted in decreasing order
+    import numpy as np
+    pos = np.empty(F.shape, dtype=int)
+    order = F.argsort(axis=1)[:, ::-1]
+    pos[np.arange(F.shape[0])[:, np.newaxis], order] = np.arange(F.shape[1])
+    return pos
+
+
 # fixture for nose tests
 def setup_module(module):
     from nose import SkipTest
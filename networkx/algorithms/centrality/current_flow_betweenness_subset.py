@@ -56,8 +56,9 @@ def current_flow_betweenness_centrality_subset(G, sources, targets,
 
     solver: string (default='lu')
        Type of linear solver to use for computing the flow matrix.
-       Options are "full" (uses most memory), "lu" (recommended), and
-       "cg" (uses least memory).
+       Options are "full" (uses most memory), "lu" (recommended),
+       "cg" (uses least memory), and "amg" (conjugate gradient with a
+       multigrid preconditioner, for large sparse graphs).
 
     Returns
     -------
@@ -115,22 +116,21 @@ def current_flow_betweenness_centrality_subset(G, sources, targets,
     # this could be done without a copy if we really wanted to
     mapping = dict(zip(ordering, range(n)))
     H = nx.relabel_nodes(G, mapping)
-    betweenness = dict.fromkeys(H, 0.0)  # b[v]=0 for v in H
-    for row, (s, t) in flow_matrix_row(H, weight=weight, dtype=dtype,
-                                       solver=solver):
-        for ss in sources:
-            i = mapping[ss]
-            for tt in targets:
-                j = mapping[tt]
-                betweenness[s] += 0.5 * np.abs(row[i] - row[j])
-                betweenness[t] += 0.5 * np.abs(row[i] - row[j])
+    betweenness = np.zeros(n)
+    sources = [mapping[ss] for ss in sources]
+    targets = [mapping[tt] for tt in targets]
+    for F, edges in flow_matrix_block(H, weight=weight, dtype=dtype,
+                                      solver=solver):
+        flow = _subset_flow(F, sources, targets)
+        s, t = np.array(edges).T
+        np.add.at(betweenness, s, flow)
+        np.add.at(betweenness, t, flow)
     if normalized:
         nb = (n - 1.0) * (n - 2.0)  # normalization factor
     else:
         nb = 2.0
-    for v in H:
-        betweenness[v] = betweenness[v] / nb + 1.0 / (2 - n)
-    return dict((ordering[k], v) for k, v in betweenness.items())
+    betweenness = betweenness / nb + 1.0 / (2 - n)
+    return dict((ordering[k], float(v)) for k, v in enumerate(betweenness))
 
 
 @not_implemented_for('directed')
@@ -173,8 +173,9 @@ def edge_current_flow_betweenness_centrality_subset(G, sources, targets,
 
     solver: string (default='lu')
        Type of linear solver to use for computing the flow matrix.
-       Options are "full" (uses most memory), "lu" (recommended), and
-       "cg" (uses least memory).
+       Options are "full" (uses most memory), "lu" (recommended),
+       "cg" (uses least memory), and "amg" (conjugate gradient with a
+       multigrid preconditioner, for large sparse graphs).
 
     Returns
     -------
@@ -236,18 +237,28 @@ def edge_current_flow_betweenness_centrality_subset(G, sources, targets,
         nb = (n - 1.0) * (n - 2.0)  # normalization factor
     else:
         nb = 2.0
-    for row, (e) in flow_matrix_row(H, weight=weight, dtype=dtype,
-                                    solver=solver):
-        for ss in sources:
-            i = mapping[ss]
-            for tt in targets:
-                j = mapping[tt]
-                betweenness[e] += 0.5 * np.abs(row[i] - row[j])
-        betweenness[e] /= nb
+    sources = [mapping[ss] for ss in sources]
+    targets = [mapping[tt] for tt in targets]
+    for F, edges in flow_matrix_block(H, weight=weight, dtype=dtype,
+                                      solver=solver):
+        flow = _subset_flow(F, sources, targets) / nb
+        for e, value in zip(edges, flow):
+            betweenness[e] += value
     return dict(((ordering[s], ordering[t]), v)
                 for (s, t), v in betweenness.items())
 
 
+def _subset_flow(F, sources, targets):
+    # Half the current through each edge (row of F), summed over all
+    # source-target pairs
+    import numpy as np
+    flow = np.zeros(F.shape[0])
+    T = F[:, targets]
+    for i in sources:
+        flow += 0.5 * np.abs(F[:, [i]] - T).sum(axis=1)
+    return flow
+
+
 # fixture for nose tests
 def setup_module(module):
     from nose import SkipTest
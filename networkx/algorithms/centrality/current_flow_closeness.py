@@ -9,10 +9,13 @@
 """Current-flow closeness centrality measures."""
 import networkx as nx
 
-from networkx.utils import not_implemented_for, reverse_cuthill_mckee_ordering
+from networkx.utils import (not_implemented_for,
+                            reverse_cuthill_mckee_ordering,
+                            np_random_state)
 from networkx.algorithms.centrality.flow_matrix import *
 
-__all__ = ['current_flow_closeness_centrality', 'information_centrality']
+__all__ = ['current_flow_closeness_centrality', 'information_centrality',
+           'approximate_current_flow_closeness_centrality']
 
 
 @not_implemented_for('directed')
@@ -39,8 +42,9 @@ def current_flow_closeness_centrality(G, weight=None,
 
     solver: string (default='lu')
        Type of linear solver to use for computing the flow matrix.
-       Options are "full" (uses most memory), "lu" (recommended), and
-       "cg" (uses least memory).
+       Options are "full" (uses most memory), "lu" (recommended),
+       "cg" (uses least memory), and "amg" (conjugate gradient with a
+       multigrid preconditioner, for large sparse graphs).
 
     Returns
     -------
@@ -49,6 +53,7 @@ def current_flow_closeness_centrality(G, weight=None,
 
     See Also
     --------
+    approximate_current_flow_closeness_centrality
     closeness_centrality
 
     Notes
@@ -74,32 +79,166 @@ def current_flow_closeness_centrality(G, weight=None,
     import scipy
     if not nx.is_connected(G):
         raise nx.NetworkXError("Graph not connected.")
-    solvername = {"full": FullInverseLaplacian,
-                  "lu": SuperLUInverseLaplacian,
-                  "cg": CGInverseLaplacian}
     n = G.number_of_nodes()
     ordering = list(reverse_cuthill_mckee_ordering(G))
     # make a copy with integer labels according to rcm ordering
     # this could be done without a copy if we really wanted to
     H = nx.relabel_nodes(G, dict(zip(ordering, range(n))))
-    betweenness = dict.fromkeys(H, 0.0)  # b[v]=0 for v in H
-    n = H.number_of_nodes()
     L = laplacian_sparse_matrix(H, nodelist=range(n), weight=weight,
                                 dtype=dtype, format='csc')
-    C2 = solvername[solver](L, width=1, dtype=dtype)  # initialize solver
-    for v in H:
-        col = C2.get_row(v)
-        for w in H:
-            betweenness[v] += col[v] - 2 * col[w]
-            betweenness[w] += col[v]
-    for v in H:
-        betweenness[v] = 1.0 / (betweenness[v])
-    return dict((ordering[k], float(v)) for k, v in betweenness.items())
+    C2 = inverse_laplacian_solver(solver)(L, width=1, dtype=dtype)
+    # The sum of the effective resistances from v to all nodes is
+    # n * C[v, v] - 2 * sum(C[v]) + trace(C), for the inverse C of the
+    # Laplacian grounded at node 0.
+    betweenness = np.zeros(n)
+    trace = 0.0
+    for start in range(0, n, FLOW_BLOCK_SIZE):
+        rows = np.arange(start, min(start + FLOW_BLOCK_SIZE, n))
+        C = C2.get_row_block(rows)
+        diagonal = C[np.arange(len(rows)), rows]
+        betweenness[rows] = n * diagonal - 2 * C.sum(axis=1)
+        trace += diagonal.sum()
+    betweenness = 1.0 / (betweenness + trace)
+    return dict((ordering[k], float(v)) for k, v in enumerate(betweenness))
 
 
 information_centrality = current_flow_closeness_centrality
 
 
+@np_random_state(6)
+@not_implemented_for('directed')
+def approximate_current_flow_closeness_centrality(G, weight=None,
+                                                  dtype=float, solver='lu',
+                                                  epsilon=0.5, kmax=10000,
+                                                  seed=None):
+    r"""Compute the approximate current-flow closeness centrality for nodes.
+
+    Approximates the current-flow closeness centrality within a relative
+    error of `epsilon` with high probability, by a random projection of the
+    electrical flows in the graph [1]_. Only $k = O(\log n / \epsilon^2)$
+    linear systems in the Laplacian are solved, instead of one for every
+    node.
+
+    Parameters
+    ----------
+    G : graph
+      A NetworkX graph.
+
+    weight : None or string, optional (default=None)
+      If None, all edge weights are considered equal.
+      Otherwise holds the name of the edge attribute used as weight.
+
+    dtype: data type (default=float)
+      Default data type for internal matrices.
+      Set to np.float32 for lower memory consumption.
+
+    solver: string (default='lu')
+       Type of linear solver to use for computing the flow matrix.
+       Options are "full" (uses most memory), "lu" (recommended),
+       "cg" (uses least memory), and "amg" (conjugate gradient with a
+       multigrid preconditioner, for large sparse graphs).
+
+    epsilon: float (default=0.5)
+        Relative error tolerance, between 0 and 1.
+
+    kmax: int (default=10000)
+       Maximum number of linear systems to solve for the approximation.
+
+    seed : integer, random_state, or None (default)
+        Indicator of random number generation state.
+        See :ref:`Randomness<randomness>`.
+
+    Returns
+    -------
+    nodes : dictionary
+       Dictionary of nodes with approximate current flow closeness
+       centrality as the value.
+
+    Raises
+    ------
+    NetworkXError
+       If the graph is not connected, or if more than `kmax` systems
+       would be needed for the requested `epsilon`.
+
+    Examples
+    --------
+    >>> G = nx.grid_2d_graph(30, 30)
+    >>> approx = nx.approximate_current_flow_closeness_centrality(G, seed=42)
+    >>> exact = nx.current_flow_closeness_centrality(G)
+    >>> max(abs(approx[v] - exact[v]) / exact[v] for v in G) < 0.5
+    True
+
+    See Also
+    --------
+    current_flow_closeness_centrality
+    approximate_current_flow_betweenness_centrality
+
+    Notes
+    -----
+    The current-flow closeness of node $v$ is the inverse of
+    $n L^+_{vv} + \operatorname{tr}(L^+)$, where $L^+$ is the
+    pseudo-inverse of the Laplacian. Writing $L = B B^T$ for the weighted
+    incidence matrix $B$, the diagonal entry $L^+_{vv}$ is the squared
+    norm of row $v$ of $L^+ B$, and the rows of $L^+ B Q$, for a random
+    $m \times k$ matrix $Q$ of entries $\pm 1/\sqrt{k}$, preserve these
+    norms within a factor $1 \pm \epsilon$ with probability at least
+    $1 - 1/n$ when $k \geq 6 \ln n / (\epsilon^2/2 - \epsilon^3/3)$ [2]_.
+
+    If that many systems are at least as many as the exact computation
+    needs, :func:`current_flow_closeness_centrality` is used instead.
+
+    References
+    ----------
+    .. [1] Daniel A. Spielman and Nikhil Srivastava:
+       Graph sparsification by effective resistances.
+       SIAM Journal on Computing 40(6):1913-1926, 2011.
+       https://doi.org/10.1137/080734029
+
+    .. [2] Dimitris Achlioptas:
+       Database-friendly random projections: Johnson-Lindenstrauss with
+       binary coins.
+       Journal of Computer and System Sciences 66(4):671-687, 2003.
+       https://doi.org/10.1016/S0022-0000(03)00025-4
+    """
+    import numpy as np
+    from scipy import sparse
+    if not nx.is_connected(G):
+        raise nx.NetworkXError("Graph not connected.")
+    if not 0 < epsilon < 1:
+        raise nx.NetworkXError('epsilon must be between 0 and 1')
+    n = G.number_of_nodes()
+    k = int(np.ceil(6 * np.log(n) / (epsilon ** 2 / 2 - epsilon ** 3 / 3)))
+    if k >= n - 1:
+        return current_flow_closeness_centrality(G, weight=weight,
+                                                 dtype=dtype, solver=solver)
+    if k > kmax:
+        msg = 'Number of systems k>kmax (%d>%d) ' % (k, kmax)
+        raise nx.NetworkXError(msg, 'Increase kmax or epsilon')
+    ordering = list(reverse_cuthill_mckee_ordering(G))
+    H = nx.relabel_nodes(G, dict(zip(ordering, range(n))))
+    L = laplacian_sparse_matrix(H, nodelist=range(n), weight=weight,
+                                dtype=dtype, format='csc')
+    C = inverse_laplacian_solver(solver)(L, width=1, dtype=dtype)
+    u, v, w = zip(*((u, v, d.get(weight, 1.0))
+                    for u, v, d in H.edges(data=True)))
+    m = len(w)
+    w = np.sqrt(np.array(w, dtype=dtype))
+    edge_index = 2 * list(range(m))
+    B = sparse.csr_matrix((np.concatenate([w, -w]), (u + v, edge_index)),
+                          shape=(n, m))
+    diagonal = np.zeros(n)
+    for start in range(0, k, FLOW_BLOCK_SIZE):
+        size = min(FLOW_BLOCK_SIZE, k - start)
+        Q = seed.choice([-1.0, 1.0], size=(m, size)) / np.sqrt(k)
+        # columns of B Q sum to zero, so the grounded solution becomes
+        # the pseudo-inverse solution once each column is centered
+        Z = C.solve_block(B.dot(Q))
+        Z -= Z.mean(axis=0)
+        diagonal += (Z ** 2).sum(axis=1)
+    closeness = 1.0 / (n * diagonal + diagonal.sum())
+    return dict((ordering[i], float(c)) for i, c in enumerate(closeness))
+
+
 # fixture for nose tests
 def setup_module(module):
     from nose import SkipTest
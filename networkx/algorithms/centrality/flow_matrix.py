@@ -2,19 +2,19 @@
 # Lazy computations for inverse Laplacian and flow-matrix rows.
 import networkx as nx
 
+# Number of right-hand sides solved together by the block solvers.
+FLOW_BLOCK_SIZE = 64
+
 
 def flow_matrix_row(G, weight=None, dtype=float, solver='lu'):
     # Generate a row of the current-flow matrix
     import numpy as np
     from scipy import sparse
     from scipy.sparse import linalg
-    solvername = {"full": FullInverseLaplacian,
-                  "lu": SuperLUInverseLaplacian,
-                  "cg": CGInverseLaplacian}
     n = G.number_of_nodes()
     L = laplacian_sparse_matrix(G, nodelist=range(n), weight=weight,
                                 dtype=dtype, format='csc')
-    C = solvername[solver](L, dtype=dtype)  # initialize solver
+    C = inverse_laplacian_solver(solver)(L, dtype=dtype)  # initialize solver
     w = C.w  # w is the Laplacian matrix width
     # row-by-row flow matrix
     for u, v in sorted(sorted((u, v)) for u, v in G.edges()):
@@ -28,6 +28,49 @@ def flow_matrix_row(G, weight=None, dtype=float, solver='lu'):
         yield row, (u, v)
 
 
+def flow_matrix_block(G, weight=None, dtype=float, solver='lu',
+                      block_size=FLOW_BLOCK_SIZE):
+    # Generate blocks of rows of the current-flow matrix, together with
+    # the list of edges they belong to.  Each row of the inverse
+    # Laplacian is solved for only once, many at a time, and kept only
+    # while edges still need it.
+    import numpy as np
+    n = G.number_of_nodes()
+    L = laplacian_sparse_matrix(G, nodelist=range(n), weight=weight,
+                                dtype=dtype, format='csc')
+    C = inverse_laplacian_solver(solver)(L, width=1, dtype=dtype)
+    edges = sorted(sorted((u, v)) for u, v in G.edges())
+    rows = {}
+    for start in range(0, len(edges), block_size):
+        block = edges[start:start + block_size]
+        # edges are sorted, so rows before the first endpoint are done
+        first = block[0][0]
+        for r in [r for r in rows if r < first]:
+            del rows[r]
+        missing = sorted(set(r for e in block for r in e) - set(rows))
+        for i in range(0, len(missing), block_size):
+            chunk = missing[i:i + block_size]
+            rows.update(zip(chunk, C.get_row_block(chunk)))
+        c = np.array([G[u][v].get(weight, 1.0) for u, v in block],
+                     dtype=dtype)
+        F = np.array([rows[u] - rows[v] for u, v in block], dtype=dtype)
+        F *= c[:, np.newaxis]
+        yield F, [tuple(e) for e in block]
+
+
+def inverse_laplacian_solver(solver):
+    # Returns the InverseLaplacian subclass for the solver name
+    solvername = {"full": FullInverseLaplacian,
+                  "lu": SuperLUInverseLaplacian,
+                  "cg": CGInverseLaplacian,
+                  "amg": AMGInverseLaplacian}
+    try:
+        return solvername[solver]
+    except KeyError:
+        raise nx.NetworkXError('Unknown solver %s; use one of %s'
+                               % (solver, ', '.join(sorted(solvername))))
+
+
 # Class to compute the inverse laplacian only for specified rows
 # Allows computation of the current-flow matrix without storing entire
 # inverse laplacian matrix
@@ -64,6 +107,19 @@ class InverseLaplacian(object):
         self.C[r % self.w, 1:] = self.solve_inverse(r)
         return self.C[r % self.w]
 
+    def solve_block(self, rhs):
+        # Solve for each column of the (n, k) array rhs
+        s = np.zeros(rhs.shape, dtype=self.dtype)
+        for j in range(rhs.shape[1]):
+            s[:, j] = self.solve(rhs[:, j])
+        return s
+
+    def get_row_block(self, rows):
+        # Rows of the inverse Laplacian as an array, one solve per block
+        rhs = np.zeros((self.n, len(rows)), dtype=self.dtype)
+        rhs[rows, np.arange(len(rows))] = 1
+        return self.solve_block(rhs).T
+
     def width(self, L):
         m = 0
         for i, row in enumerate(L):
@@ -89,11 +145,17 @@ class FullInverseLaplacian(InverseLaplacian):
     def solve_inverse(self, r):
         return self.IL[r, 1:]
 
+    def solve_block(self, rhs):
+        return np.dot(self.IL, rhs)
+
+    def get_row_block(self, rows):
+        return self.IL[rows]
+
 
 class SuperLUInverseLaplacian(InverseLaplacian):
     def init_solver(self, L):
         from scipy.sparse import linalg
-        self.lusolve = linalg.factorized(self.L1.tocsc())
+        self.lusolve = linalg.splu(self.L1.tocsc()).solve
 
     def solve_inverse(self, r):
         rhs = np.zeros(self.n, dtype=self.dtype)
@@ -105,6 +167,10 @@ class SuperLUInverseLaplacian(InverseLaplacian):
         s[1:] = self.lusolve(rhs[1:])
         return s
 
+    def solve_block(self, rhs):
+        # SuperLU solves all columns of rhs in one call
+        return self.solve(np.asarray(rhs, dtype=self.dtype))
+
 
 class CGInverseLaplacian(InverseLaplacian):
     def init_solver(self, L):
@@ -125,6 +191,62 @@ class CGInverseLaplacian(InverseLaplacian):
         return linalg.cg(self.L1, rhs[1:], M=self.M)[0]
 
 
+class AMGInverseLaplacian(CGInverseLaplacian):
+    # Conjugate gradient preconditioned with an aggregation multigrid
+    # V-cycle.  Setup is cheaper and uses less memory than an incomplete
+    # factorization, and the number of iterations grows slowly with n.
+    coarse_size = 500
+    omega = 2.0 / 3.0
+
+    def init_solver(self, L):
+        global linalg
+        from scipy.sparse import linalg
+        self.levels = []
+        A = self.L1.tocsr()
+        while A.shape[0] > self.coarse_size:
+            P = self.aggregation(A)
+            if P.shape[1] == A.shape[0]:
+                break
+            self.levels.append((A, P, self.omega / A.diagonal()))
+            A = (P.T * A * P).tocsr()
+        self.coarse = linalg.splu(A.tocsc())
+        n = self.n - 1
+        self.M = linalg.LinearOperator(shape=(n, n), matvec=self.vcycle)
+
+    def aggregation(self, A):
+        # Piecewise constant prolongation: each node that still has
+        # unaggregated neighbors starts an aggregate with them, other
+        # nodes join a neighboring aggregate.
+        from scipy import sparse
+        n = A.shape[0]
+        indptr, indices = A.indptr, A.indices
+        agg = np.full(n, -1, dtype=int)
+        count = 0
+        for i in range(n):
+            if agg[i] >= 0:
+                continue
+            nbrs = indices[indptr[i]:indptr[i + 1]]  # includes i
+            free = nbrs[agg[nbrs] < 0]
+            if len(free) > 1 or (agg[nbrs] < 0).all():
+                agg[free] = count
+                agg[i] = count
+                count += 1
+            else:
+                agg[i] = agg[nbrs].max()
+        return sparse.csr_matrix((np.ones(n), (np.arange(n), agg)),
+                                 shape=(n, count))
+
+    def vcycle(self, b, level=0):
+        if level == len(self.levels):
+            return self.coarse.solve(b)
+        A, P, dinv = self.levels[level]
+        # damped Jacobi smoothing before and after the coarse correction
+        x = dinv * b
+        x += P.dot(self.vcycle(P.T.dot(b - A.dot(x)), level + 1))
+        x += dinv * (b - A.dot(x))
+        return x
+
+
 # graph laplacian, sparse version, will move to linalg/laplacianmatrix.py
 def laplacian_sparse_matrix(G, nodelist=None, weight=None, dtype=None,
                             format='csr'):
@@ -10,6 +10,7 @@ from __future__ import division
 from functools import partial
 
 import networkx as nx
+from networkx.algorithms.centrality.closeness import _batched_bfs_sums
 
 __all__ = ['harmonic_centrality']
 
@@ -57,11 +58,18 @@ def harmonic_centrality(G, nbunch=None, distance=None):
     shortest-path length will be computed using Dijkstra's algorithm with
     that edge attribute as the edge weight.
 
+    Without distances, the harmonic centrality of all nodes is computed
+    with the bit-parallel breadth-first searches described in
+    :func:`closeness_centrality`.
+
     References
     ----------
     .. [1] Boldi, Paolo, and Sebastiano Vigna. "Axioms for centrality."
            Internet Mathematics 10.3-4 (2014): 222-262.
     """
+    if nbunch is None and distance is None:
+        # Accumulate the distances from all sources to each node at once.
+        return _batched_bfs_sums(G, harmonic=True)[1]
     if G.is_directed():
         G = G.reverse()
     spl = partial(nx.shortest_path_length, G, weight=distance)
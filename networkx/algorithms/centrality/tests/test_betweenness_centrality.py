@@ -1,5 +1,6 @@
 #!/usr/bin/env python
 from __future__ import division
+import random
 from nose.tools import *
 import networkx as nx
 
@@ -658,3 +659,129 @@ class TestWeightedEdgeBetweennessCentrality(object):
         norm = len(G) * (len(G) - 1) / 2
         for n in sorted(G.edges()):
             assert_almost_equal(b[n], b_answer[n] / norm)
+
+
+class TestApproximateBetweennessCentrality(object):
+
+    def check(self, G, **kwargs):
+        normalized = kwargs.get('normalized', True)
+        weight = kwargs.get('weight')
+        exact = nx.betweenness_centrality(G, normalized=normalized,
+                                          weight=weight)
+        b, error = nx.approximate_betweenness_centrality(G, seed=42,
+                                                         **kwargs)
+        assert_equal(set(b), set(G))
+        for v in G:
+            assert_true(abs(b[v] - exact[v]) <= error)
+        return error
+
+    def test_undirected(self):
+        G = nx.barabasi_albert_graph(60, 2, seed=1)
+        error = self.check(G, epsilon=0.05)
+        assert_true(error <= 0.05 * 60 / 58 + 1e-12)
+        error = self.check(G, epsilon=0.05, normalized=False)
+        assert_true(error <= 0.05 * 60 * 59 / 2 + 1e-12)
+
+    def test_directed_weighted(self):
+        G = nx.gnp_random_graph(40, 0.1, seed=2, directed=True)
+        for i, (u, v) in enumerate(G.edges()):
+            G[u][v]['weight'] = i % 5 + 1
+        self.check(G, epsilon=0.05, weight='weight')
+        self.check(G, epsilon=0.05, normalized=False)
+
+    def test_disconnected(self):
+        G = nx.disjoint_union(nx.path_graph(10), nx.star_graph(10))
+        self.check(G, epsilon=0.05)
+
+    def test_adaptive_stop(self):
+        # Most nodes of a star have no betweenness, so sampling stops
+        # before the worst case number of samples.
+        G = nx.star_graph(200)
+        error = self.check(G, epsilon=0.02, delta=0.1)
+        assert_true(error < 0.02 * 201 / 199)
+
+    def test_small_graphs(self):
+        for G in (nx.Graph(), nx.path_graph(2), nx.empty_graph(3)):
+            b, error = nx.approximate_betweenness_centrality(G)
+            assert_equal(b, dict.fromkeys(G, 0.0))
+            assert_equal(error, 0.0)
+        G = nx.complete_graph(5)
+        b, error = nx.approximate_betweenness_centrality(G)
+        assert_equal(b, dict.fromkeys(G, 0.0))
+
+    @raises(ValueError)
+    def test_bad_epsilon(self):
+        nx.approximate_betweenness_centrality(nx.path_graph(3), epsilon=0)
+
+    @raises(ValueError)
+    def test_bad_delta(self):
+        nx.approximate_betweenness_centrality(nx.path_graph(3), delta=1)
+
+
+class TestDynamicBetweennessCentrality(object):
+
+    def check(self, dbc):
+        expected = nx.betweenness_centrality(dbc.graph,
+                                             normalized=dbc.normalized,
+                                             weight=dbc.weight,
+                                             endpoints=dbc.endpoints)
+        actual = dbc.betweenness()
+        assert_equal(set(actual), set(expected))
+        for v in expected:
+            assert_almost_equal(actual[v], expected[v])
+
+    def random_updates(self, G, weight=None, **kwargs):
+        rng = random.Random(42)
+        dbc = nx.DynamicBetweennessCentrality(G, weight=weight, **kwargs)
+        self.check(dbc)
+        for i in range(60):
+            op = rng.random()
+            edges = list(G.edges())
+            if op < 0.35 and edges:
+                dbc.remove_edge(*rng.choice(edges))
+            elif op < 0.95:
+                u, v = rng.randrange(22), rng.randrange(22)
+                if u == v:
+                    continue
+                if weight is None:
+                    dbc.add_edge(u, v)
+                else:
+                    dbc.add_edge(u, v, **{weight: rng.randint(1, 3)})
+            else:
+                dbc.remove_node(rng.choice(list(G)))
+            self.check(dbc)
+
+    def test_undirected(self):
+        self.random_updates(nx.gnm_random_graph(20, 30, seed=1))
+
+    def test_directed(self):
+        G = nx.gnm_random_graph(20, 40, seed=2, directed=True)
+        self.random_updates(G, normalized=False)
+
+    def test_weighted(self):
+        G = nx.gnm_random_graph(20, 30, seed=3)
+        for u, v, d in G.edges(data=True):
+            d['weight'] = (u + v) % 3 + 1
+        self.random_updates(G, weight='weight')
+
+    def test_endpoints(self):
+        G = nx.gnm_random_graph(20, 30, seed=4)
+        self.random_updates(G, endpoints=True)
+
+    def test_add_node(self):
+        G = nx.path_graph(3)
+        dbc = nx.DynamicBetweennessCentrality(G)
+        dbc.add_node(3, color='red')
+        assert_equal(G.nodes[3], {'color': 'red'})
+        self.check(dbc)
+        dbc.add_edge(2, 3, color='blue')
+        self.check(dbc)
+
+    @raises(nx.NetworkXError)
+    def test_remove_missing_edge(self):
+        dbc = nx.DynamicBetweennessCentrality(nx.path_graph(3))
+        dbc.remove_edge(0, 2)
+
+    @raises(nx.NetworkXNotImplemented)
+    def test_multigraph(self):
+        nx.DynamicBetweennessCentrality(nx.MultiGraph())
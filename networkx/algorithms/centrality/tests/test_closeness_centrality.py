@@ -194,3 +194,55 @@ class TestClosenessCentrality:
              'v': 0.200}
         for n in sorted(XG):
             assert_almost_equal(c[n], d[n], places=3)
+
+    def test_batched_bfs(self):
+        # More nodes than the batch size, several components, directed.
+        G = nx.gnm_random_graph(300, 500, seed=42)
+        D = nx.gnm_random_graph(300, 900, seed=42, directed=True)
+        for H in (G, D):
+            for wf_improved in (True, False):
+                c = nx.closeness_centrality(H, wf_improved=wf_improved)
+                for n in H:
+                    expected = nx.closeness_centrality(
+                        H, u=n, wf_improved=wf_improved)
+                    assert_almost_equal(c[n], expected)
+
+
+class TestTopKClosenessCentrality:
+
+    def check(self, G, k, wf_improved=True):
+        c = nx.closeness_centrality(G, wf_improved=wf_improved)
+        top = nx.top_k_closeness_centrality(G, k, wf_improved=wf_improved)
+        assert_equal(len(top), min(k, len(G)))
+        values = sorted(c.values(), reverse=True)[:k]
+        for (n, v), expected in zip(top, values):
+            assert_almost_equal(v, c[n])
+            assert_almost_equal(v, expected)
+
+    def test_undirected(self):
+        G = nx.barabasi_albert_graph(200, 2, seed=1)
+        for k in (1, 5, 50, 250):
+            self.check(G, k)
+
+    def test_disconnected(self):
+        G = nx.union(nx.path_graph(30), nx.complete_graph(range(30, 35)))
+        G.add_node(35)
+        for k in (1, 3, 10):
+            self.check(G, k)
+            self.check(G, k, wf_improved=False)
+
+    def test_directed(self):
+        G = nx.gnp_random_graph(80, 0.05, seed=3, directed=True)
+        for k in (1, 5, 20):
+            self.check(G, k)
+            self.check(G, k, wf_improved=False)
+
+    def test_trivial(self):
+        assert_equal(nx.top_k_closeness_centrality(nx.Graph(), 3), [])
+        assert_equal(nx.top_k_closeness_centrality(nx.path_graph(3), 0), [])
+        assert_equal(nx.top_k_closeness_centrality(nx.empty_graph(1), 1),
+                     [(0, 0.0)])
+
+    @raises(ValueError)
+    def test_negative_k(self):
+        nx.top_k_closeness_centrality(nx.path_graph(3), -1)
@@ -44,7 +44,7 @@ class TestFlowBetweennessCentrality(object):
     def test_K4(self):
         """Betweenness centrality: K4"""
         G = nx.complete_graph(4)
-        for solver in ['full', 'lu', 'cg']:
+        for solver in ['full', 'lu', 'cg', 'amg']:
             b = nx.current_flow_betweenness_centrality(G, normalized=False,
                                                        solver=solver)
             b_answer = {0: 0.75, 1: 0.75, 2: 0.75, 3: 0.75}
@@ -79,7 +79,7 @@ class TestFlowBetweennessCentrality(object):
     def test_solers(self):
         """Betweenness centrality: alternate solvers"""
         G = nx.complete_graph(4)
-        for solver in ['full', 'lu', 'cg']:
+        for solver in ['full', 'lu', 'cg', 'amg']:
             b = nx.current_flow_betweenness_centrality(G, normalized=False,
                                                        solver=solver)
             b_answer = {0: 0.75, 1: 0.75, 2: 0.75, 3: 0.75}
@@ -149,7 +149,7 @@ class TestApproximateFlowBetweennessCentrality(object):
         "Approximate current-flow betweenness centrality: solvers"
         G = nx.complete_graph(4)
         epsilon = 0.1
-        for solver in ['full', 'lu', 'cg']:
+        for solver in ['full', 'lu', 'cg', 'amg']:
             b = approximate_cfbc(G, normalized=False, solver=solver,
                                  epsilon=0.5 * epsilon)
             b_answer = {0: 0.75, 1: 0.75, 2: 0.75, 3: 0.75}
@@ -41,6 +41,71 @@ class TestFlowClosenessCentrality(object):
         for n in sorted(G):
             assert_almost_equal(b[n], b_answer[n])
 
+    def test_solvers(self):
+        G = nx.convert_node_labels_to_integers(nx.grid_2d_graph(25, 25))
+        for u, v, d in G.edges(data=True):
+            d['weight'] = (u + v) % 3 + 1
+        b_answer = nx.current_flow_closeness_centrality(G, weight='weight')
+        for solver in ['full', 'cg', 'amg']:
+            b = nx.current_flow_closeness_centrality(G, weight='weight',
+                                                     solver=solver)
+            for n in sorted(G):
+                assert_almost_equal(b[n], b_answer[n], places=5)
+
+    @raises(nx.NetworkXError)
+    def test_unknown_solver(self):
+        nx.current_flow_closeness_centrality(nx.path_graph(3), solver='foo')
+
+
+class TestApproximateFlowClosenessCentrality(object):
+    numpy = 1  # nosetests attribute, use nosetests -a 'not numpy' to skip test
+
+    @classmethod
+    def setupClass(cls):
+        global np
+        try:
+            import numpy as np
+            import scipy
+        except ImportError:
+            raise SkipTest('NumPy not available.')
+
+    def test_small_graph_is_exact(self):
+        G = nx.path_graph(4)
+        b = nx.approximate_current_flow_closeness_centrality(G)
+        b_answer = {0: 1.0 / 6, 1: 1.0 / 4, 2: 1.0 / 4, 3: 1.0 / 6}
+        for n in sorted(G):
+            assert_almost_equal(b[n], b_answer[n])
+
+    def test_grid(self):
+        G = nx.grid_2d_graph(30, 30)
+        for epsilon in (0.5, 0.4):
+            b = nx.approximate_current_flow_closeness_centrality(
+                G, epsilon=epsilon, seed=1)
+            b_answer = nx.current_flow_closeness_centrality(G)
+            for n in G:
+                assert_true(abs(b[n] - b_answer[n]) < epsilon * b_answer[n])
+
+    def test_seed(self):
+        G = nx.grid_2d_graph(30, 30)
+        b = nx.approximate_current_flow_closeness_centrality(G, seed=3)
+        b2 = nx.approximate_current_flow_closeness_centrality(G, seed=3)
+        assert_equal(b, b2)
+
+    @raises(nx.NetworkXError)
+    def test_kmax(self):
+        G = nx.grid_2d_graph(30, 30)
+        nx.approximate_current_flow_closeness_centrality(G, kmax=100)
+
+    @raises(nx.NetworkXError)
+    def test_disconnected(self):
+        G = nx.Graph([(0, 1), (2, 3)])
+        nx.approximate_current_flow_closeness_centrality(G)
+
+    @raises(nx.NetworkXError)
+    def test_bad_epsilon(self):
+        nx.approximate_current_flow_closeness_centrality(nx.path_graph(3),
+                                                         epsilon=1.5)
+
 
 class TestWeightedFlowClosenessCentrality(object):
     pass
@@ -147,3 +147,72 @@ class TestEigenvectorCentralityExceptions(object):
     @raises(nx.NetworkXException)
     def test_empty_numpy(self):
         e = nx.eigenvector_centrality_numpy(nx.Graph())
+
+
+class TestEigenvectorCentralityScipy(object):
+    numpy = 1  # nosetests attribute, use nosetests -a 'not numpy' to skip test
+
+    @classmethod
+    def setupClass(cls):
+        global np
+        try:
+            import numpy as np
+            import scipy
+        except ImportError:
+            raise SkipTest('SciPy not available.')
+
+    def test_K5(self):
+        G = nx.complete_graph(5)
+        b = nx.eigenvector_centrality_scipy(G)
+        v = math.sqrt(1 / 5.0)
+        for n in sorted(G):
+            assert_almost_equal(b[n], v)
+        nstart = dict([(n, n + 1) for n in G])
+        b = nx.eigenvector_centrality_scipy(G, nstart=nstart)
+        for n in sorted(G):
+            assert_almost_equal(b[n], v)
+
+    def test_matches_dict_version(self):
+        G = nx.gnp_random_graph(50, 0.1, seed=42)
+        for u, v, d in G.edges(data=True):
+            d['weight'] = u + v + 1
+        for weight in (None, 'weight'):
+            history = []
+            b = nx.eigenvector_centrality_scipy(G, weight=weight,
+                                                history=history)
+            b_answer = nx.eigenvector_centrality(G, weight=weight)
+            for n in G:
+                assert_almost_equal(b[n], b_answer[n])
+            assert_true(history[-1] < len(G) * 1.0e-6)
+            assert_true(all(e >= len(G) * 1.0e-6 for e in history[:-1]))
+
+    def test_directed(self):
+        D = TestEigenvectorCentralityDirected()
+        D.setUp()
+        p = nx.eigenvector_centrality_scipy(D.G, tol=1e-8)
+        for (a, b) in zip(list(p.values()), D.G.evc):
+            assert_almost_equal(a, b, places=5)
+
+    def test_float32(self):
+        G = nx.path_graph(3)
+        b = nx.eigenvector_centrality_scipy(G, dtype=np.float32)
+        b_answer = {0: 0.5, 1: 0.7071, 2: 0.5}
+        for n in sorted(G):
+            assert_almost_equal(b[n], b_answer[n], places=4)
+
+    @raises(nx.PowerIterationFailedConvergence)
+    def test_maxiter(self):
+        nx.eigenvector_centrality_scipy(nx.path_graph(3), max_iter=0)
+
+    @raises(nx.NetworkXError)
+    def test_zero_nstart(self):
+        G = nx.path_graph(3)
+        nx.eigenvector_centrality_scipy(G, nstart=dict.fromkeys(G, 0))
+
+    @raises(nx.NetworkXException)
+    def test_multigraph(self):
+        nx.eigenvector_centrality_scipy(nx.MultiGraph())
+
+    @raises(nx.NetworkXException)
+    def test_empty(self):
+        nx.eigenvector_centrality_scipy(nx.Graph())
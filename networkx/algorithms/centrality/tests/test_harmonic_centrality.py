@@ -117,3 +117,12 @@ class TestClosenessCentrality:
         c = harmonic_centrality(G, distance='weight')
         d = {0: 0}
         assert_equal(c, d)
+
+    def test_batched_bfs(self):
+        G = nx.gnm_random_graph(300, 500, seed=42)
+        D = nx.gnm_random_graph(300, 900, seed=42, directed=True)
+        for H in (G, D):
+            c = harmonic_centrality(H)
+            d = harmonic_centrality(H, nbunch=list(H))
+            for n in H:
+                assert_almost_equal(c[n], d[n])
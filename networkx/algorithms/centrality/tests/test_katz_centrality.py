@@ -3,7 +3,7 @@ import math
 
 import networkx as nx
 from nose import SkipTest
-from nose.tools import assert_almost_equal, assert_equal, raises
+from nose.tools import assert_almost_equal, assert_equal, assert_true, raises
 
 
 class TestKatzCentrality(object):
@@ -320,3 +320,101 @@ class TestKatzEigenvectorVKatz(object):
         k = nx.katz_centrality_numpy(G, 1.0 / l)
         for n in G:
             assert_almost_equal(e[n], k[n])
+
+
+class TestKatzCentralityScipy(object):
+    numpy = 1  # nosetests attribute, use nosetests -a 'not numpy' to skip test
+
+    @classmethod
+    def setupClass(cls):
+        global np
+        try:
+            import numpy as np
+            import scipy
+        except ImportError:
+            raise SkipTest('SciPy not available.')
+
+    def test_K5(self):
+        G = nx.complete_graph(5)
+        b = nx.katz_centrality_scipy(G, 0.1)
+        v = math.sqrt(1 / 5.0)
+        for n in sorted(G):
+            assert_almost_equal(b[n], v)
+
+    def test_matches_dict_version(self):
+        G = nx.gnp_random_graph(50, 0.1, seed=42, directed=True)
+        for u, v, d in G.edges(data=True):
+            d['weight'] = (u + v) % 3 + 1
+        beta = dict((n, n % 4 + 1) for n in G)
+        for weight in (None, 'weight'):
+            for normalized in (True, False):
+                b = nx.katz_centrality_scipy(G, 0.05, beta, weight=weight,
+                                             normalized=normalized)
+                b_answer = nx.katz_centrality(G, 0.05, beta, weight=weight,
+                                              normalized=normalized)
+                for n in G:
+                    assert_almost_equal(b[n], b_answer[n])
+
+    def test_directed(self):
+        D = TestKatzCentralityDirected()
+        D.setUp()
+        p = nx.katz_centrality_scipy(D.G, D.G.alpha, weight='weight')
+        for (a, b) in zip(list(p.values()), D.G.evc):
+            assert_almost_equal(a, b)
+
+    def test_history(self):
+        G = nx.path_graph(4)
+        history = []
+        nx.katz_centrality_scipy(G, 0.1, history=history)
+        assert_true(len(history) > 1)
+        assert_true(history[-1] < 4 * 1.0e-6)
+        assert_equal(history, sorted(history, reverse=True))
+
+    def test_float32(self):
+        G = nx.path_graph(3)
+        b = nx.katz_centrality_scipy(G, 0.1, dtype=np.float32)
+        b_answer = {0: 0.5598852584152165, 1: 0.6107839182711449,
+                    2: 0.5598852584152162}
+        for n in sorted(G):
+            assert_almost_equal(b[n], b_answer[n], places=4)
+
+    def test_sweep(self):
+        G = nx.gnp_random_graph(30, 0.2, seed=7)
+        parameters = [(0.01, 1.0), (0.02, 1.0), (0.03, 2.0),
+                      (0.03, dict((n, n + 1) for n in G))]
+        history = []
+        sweep = nx.katz_centrality_sweep(G, parameters, history=history)
+        for (alpha, beta), b in zip(parameters, sweep):
+            b_answer = nx.katz_centrality(G, alpha, beta)
+            for n in G:
+                assert_almost_equal(b[n], b_answer[n])
+        assert_equal(len(history), len(parameters))
+        # Starting from the previous solution saves iterations.
+        cold = []
+        nx.katz_centrality_scipy(G, 0.02, 1.0, history=cold)
+        assert_true(len(history[1]) < len(cold))
+
+    def test_sweep_empty(self):
+        sweep = nx.katz_centrality_sweep(nx.Graph(), [(0.1, 1.0)])
+        assert_equal(list(sweep), [{}])
+
+    @raises(nx.PowerIterationFailedConvergence)
+    def test_maxiter(self):
+        nx.katz_centrality_scipy(nx.path_graph(3), 0.1, max_iter=0)
+
+    @raises(nx.NetworkXException)
+    def test_multigraph(self):
+        nx.katz_centrality_scipy(nx.MultiGraph(), 0.1)
+
+    def test_empty(self):
+        assert_equal(nx.katz_centrality_scipy(nx.Graph(), 0.1), {})
+
+    @raises(nx.NetworkXException)
+    def test_bad_beta(self):
+        G = nx.Graph([(0, 1)])
+        nx.katz_centrality_scipy(G, 0.1, beta={0: 77})
+
+    @raises(nx.NetworkXException)
+    def test_bad_beta_number(self):
+        G = nx.Graph([(0, 1)])
+        nx.katz_centrality_scipy(G, 0.1, beta='foo')
@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+#    Copyright (C) 2019 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+"""Connected components maintained under node and edge insertions."""
+import networkx as nx
+from networkx.utils import UnionFind
+
+__all__ = ['IncrementalConnectedComponents']
+
+
+class IncrementalConnectedComponents(object):
+    """Connected components of an undirected graph that only grows.
+
+    The structure keeps a union-find forest of the nodes together with
+    the member set of each component, so that connectivity queries are
+    answered in near-constant time instead of with a new traversal of
+    the graph after every change.
+
+    Nodes and edges are added through :meth:`add_node`,
+    :meth:`add_nodes_from`, :meth:`add_edge` and :meth:`add_edges_from`.
+    If a graph `G` was given on construction, these methods also add the
+    nodes and edges to `G`, so that `G` and the structure stay in sync.
+
+    Parameters
+    ----------
+    G : NetworkX graph, optional (default=None)
+       An undirected graph. The components of `G` are computed on
+       construction and `G` receives all subsequent insertions.
+
+    Raises
+    ------
+    NetworkXNotImplemented:
+        If G is directed.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(3)
+    >>> cc = nx.IncrementalConnectedComponents(G)
+    >>> cc.add_edge(10, 11)
+    >>> cc.number_connected_components()
+    2
+    >>> cc.same_component(0, 10)
+    False
+    >>> cc.add_edge(2, 10)
+    >>> cc.same_component(0, 10)
+    True
+    >>> sorted(cc.node_connected_component(11))
+    [0, 1, 2, 10, 11]
+    >>> G.has_edge(2, 10)
+    True
+
+    Notes
+    -----
+    Removing nodes or edges is not supported, since a removal can split
+    a component and the union-find forest cannot be undone. Changes made
+    to `G` directly, rather than through this structure, are not seen.
+
+    See Also
+    --------
+    connected_components
+    networkx.utils.union_find.UnionFind
+
+    """
+
+    def __init__(self, G=None):
+        if G is not None and G.is_directed():
+            raise nx.NetworkXNotImplemented('not implemented for directed '
+                                            'type')
+        self.graph = G
+        self._forest = UnionFind()
+        self._members = {}
+        self._count = 0
+        if G is not None:
+            self._add_nodes(G)
+            for u, v in G.edges():
+                self._union(u, v)
+
+    def __contains__(self, n):
+        return n in self._forest.parents
+
+    def __len__(self):
+        return len(self._forest.parents)
+
+    def _add_nodes(self, nodes):
+        parents = self._forest.parents
+        for n in nodes:
+            try:
+                if n in parents:
+                    continue
+            except TypeError:  # (node, attribute dict) tuple
+                n = n[0]
+                if n in parents:
+                    continue
+            self._forest[n]
+            self._members[n] = {n}
+            self._count += 1
+
+    def _union(self, u, v):
+        self._add_nodes((u, v))
+        ru = self._forest[u]
+        rv = self._forest[v]
+        if ru == rv:
+            return
+        self._forest.union(ru, rv)
+        root = self._forest[ru]
+        other = rv if root == ru else ru
+        self._members[root].update(self._members.pop(other))
+        self._count -= 1
+
+    def _root(self, n):
+        if n not in self._forest.parents:
+            raise nx.NetworkXError('The node %s is not in the graph.' % (n,))
+        return self._forest[n]
+
+    def add_node(self, n, **attr):
+        """Add node `n` as a new singleton component.
+
+        Attributes are passed on to the underlying graph, if any.
+        Adding a node that is already present does nothing.
+        """
+        if self.graph is not None:
+            self.graph.add_node(n, **attr)
+        self._add_nodes((n,))
+
+    def add_nodes_from(self, nodes, **attr):
+        """Add each node in `nodes` as a new singleton component.
+
+        Nodes may be given as `(node, attribute dict)` tuples as for
+        :meth:`Graph.add_nodes_from`.
+        """
+        nodes = list(nodes)
+        if self.graph is not None:
+            self.graph.add_nodes_from(nodes, **attr)
+        self._add_nodes(nodes)
+
+    def add_edge(self, u, v, **attr):
+        """Add an edge between `u` and `v`, merging their components.
+
+        Attributes are passed on to the underlying graph, if any.
+        """
+        if self.graph is not None:
+            self.graph.add_edge(u, v, **attr)
+        self._union(u, v)
+
+    def add_edges_from(self, ebunch_to_add, **attr):
+        """Add all edges in `ebunch_to_add`, merging their components.
+
+        Edges may be given as 2-tuples `(u, v)` or 3-tuples `(u, v, d)`
+        as for :meth:`Graph.add_edges_from`.
+        """
+        edges = list(ebunch_to_add)
+        if self.graph is not None:
+            self.graph.add_edges_from(edges, **attr)
+        for e in edges:
+            self._union(e[0], e[1])
+
+    def same_component(self, u, v):
+        """Returns True if `u` and `v` are in the same component.
+
+        Raises
+        ------
+        NetworkXError
+            If `u` or `v` is not in the graph.
+        """
+        return self._root(u) == self._root(v)
+
+    def node_connected_component(self, n):
+        """Returns the set of nodes in the component containing node `n`.
+
+        Raises
+        ------
+        NetworkXError
+            If `n` is not in the graph.
+        """
+        return set(self._members[self._root(n)])
+
+    def number_connected_components(self):
+        """Returns the number of connected components."""
+        return self._count
+
+    def connected_components(self):
+        """Generate connected components as sets of nodes."""
+        for c in list(self._members.values()):
+            yield set(c)
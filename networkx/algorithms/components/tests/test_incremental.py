@@ -0,0 +1,64 @@
+from nose.tools import *
+import networkx as nx
+from networkx import NetworkXNotImplemented, NetworkXError
+
+
+class TestIncrementalConnectedComponents:
+
+    def test_matches_connected_components(self):
+        G = nx.Graph()
+        cc = nx.IncrementalConnectedComponents(G)
+        edges = list(nx.gnm_random_graph(60, 50, seed=42).edges())
+        cc.add_nodes_from(range(60))
+        for i in range(0, len(edges), 10):
+            cc.add_edges_from(edges[i:i + 10])
+            expected = {frozenset(c) for c in nx.connected_components(G)}
+            assert_equal({frozenset(c) for c in cc.connected_components()},
+                         expected)
+            assert_equal(cc.number_connected_components(), len(expected))
+            for c in expected:
+                for n in c:
+                    assert_equal(cc.node_connected_component(n), set(c))
+
+    def test_initial_graph(self):
+        G = nx.union(nx.path_graph(3), nx.path_graph([3, 4]))
+        G.add_node(5)
+        cc = nx.IncrementalConnectedComponents(G)
+        assert_equal(cc.number_connected_components(), 3)
+        assert_equal(len(cc), 6)
+        assert_true(cc.same_component(0, 2))
+        assert_false(cc.same_component(2, 3))
+        cc.add_edge(2, 3, weight=4)
+        assert_true(cc.same_component(0, 4))
+        assert_equal(G[2][3], {'weight': 4})
+        assert_equal(cc.number_connected_components(), 2)
+        cc.add_edge(0, 4)
+        assert_equal(cc.number_connected_components(), 2)
+        cc.add_node(6, color='red')
+        assert_equal(G.nodes[6], {'color': 'red'})
+        assert_equal(cc.node_connected_component(6), {6})
+        assert_equal(cc.number_connected_components(), 3)
+
+    def test_without_graph(self):
+        cc = nx.IncrementalConnectedComponents()
+        assert_equal(cc.number_connected_components(), 0)
+        cc.add_edges_from([(1, 2, {'weight': 3}), ('a', 'b')])
+        cc.add_nodes_from([(3, {'color': 'red'}), 1])
+        assert_true(3 in cc)
+        assert_equal(cc.number_connected_components(), 3)
+        assert_equal(cc.node_connected_component('a'), {'a', 'b'})
+
+    def test_component_copy(self):
+        cc = nx.IncrementalConnectedComponents(nx.path_graph(3))
+        c = cc.node_connected_component(0)
+        c.add(10)
+        assert_equal(cc.node_connected_component(0), {0, 1, 2})
+
+    @raises(NetworkXError)
+    def test_missing_node(self):
+        cc = nx.IncrementalConnectedComponents(nx.path_graph(3))
+        cc.same_component(0, 10)
+
+    @raises(NetworkXNotImplemented)
+    def test_directed(self):
+        nx.IncrementalConnectedComponents(nx.DiGraph([(0, 1)]))
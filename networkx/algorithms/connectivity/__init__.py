@@ -7,6 +7,7 @@ from .edge_kcomponents import *
 from .disjoint_paths import *
 from .kcomponents import *
 from .kcutsets import *
+from .kargerstein import *
 from .stoerwagner import *
 from .utils import *
 
@@ -17,6 +18,7 @@ __all__ = sum([connectivity.__all__,
                disjoint_paths.__all__,
                kcomponents.__all__,
                kcutsets.__all__,
+               kargerstein.__all__,
                stoerwagner.__all__,
                utils.__all__,
                ], [])
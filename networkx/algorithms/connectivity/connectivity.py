@@ -14,7 +14,7 @@ from networkx.algorithms.flow import boykov_kolmogorov
 from networkx.algorithms.flow import dinitz
 from networkx.algorithms.flow import edmonds_karp
 from networkx.algorithms.flow import shortest_augmenting_path
-from networkx.algorithms.flow import build_residual_network
+from networkx.algorithms.flow import FlowSession
 default_flow_func = edmonds_karp
 
 from .utils import (build_auxiliary_node_connectivity,
@@ -285,6 +285,13 @@ def node_connectivity(G, s=None, t=None, flow_func=None):
     :meth:`local_node_connectivity`. This implementation is based
     on algorithm 11 in [1]_.
 
+    No flow is computed for graphs whose connectivity already follows
+    from cheap bounds: undirected graphs with an articulation point, and
+    simple graphs whose minimum degree $\delta$ meets the lower bound
+    $2\delta + 2 - n$. Pairs of nodes with at least as many common
+    neighbors as the current upper bound are skipped, and the search
+    stops as soon as the upper bound meets the lower bound.
+
     See also
     --------
     :meth:`local_node_connectivity`
@@ -322,30 +329,60 @@ def node_connectivity(G, s=None, t=None, flow_func=None):
         def neighbors(v):
             return itertools.chain.from_iterable([G.predecessors(v),
                                                   G.successors(v)])
+
+        def common(x, y):
+            return len(set(G._succ[x]) & set(G._pred[y]))
     else:
         if not nx.is_connected(G):
             return 0
         iter_func = itertools.combinations
         neighbors = G.neighbors
 
-    # Reuse the auxiliary digraph and the residual network
-    H = build_auxiliary_node_connectivity(G)
-    R = build_residual_network(H, 'capacity')
-    kwargs = dict(flow_func=flow_func, auxiliary=H, residual=R)
+        def common(x, y):
+            return len(set(G._adj[x]) & set(G._adj[y]))
 
     # Pick a node with minimum degree
     # Node connectivity is bounded by degree.
     v, K = min(G.degree(), key=itemgetter(1))
+    # A connected undirected graph is at least 1-connected, and exactly
+    # 1-connected if it has an articulation point. A simple one with
+    # minimum degree d is at least (2d + 2 - n)-connected.
+    if G.is_directed():
+        lower = 0
+    else:
+        lower = 1
+        if not G.is_multigraph() and nx.number_of_selfloops(G) == 0:
+            lower = max(lower, 2 * K + 2 - len(G))
+    if K <= lower:
+        return K
+    if not G.is_directed() and not nx.is_biconnected(G):
+        return 1
+
+    # Reuse the auxiliary digraph and the residual network
+    H = build_auxiliary_node_connectivity(G)
+    R = FlowSession(H, 'capacity', flow_func).residual
+    kwargs = dict(flow_func=flow_func, auxiliary=H, residual=R)
+
+    # Non adjacent pairs with at least K common neighbors have at least
+    # K node independent paths, so the flow computation is skipped.
+    # Low degree nodes are tried first to lower K as early as possible.
     # compute local node connectivity with all its non-neighbors nodes
-    for w in set(G) - set(neighbors(v)) - set([v]):
+    others = set(G) - set(neighbors(v)) - set([v])
+    for w in sorted(others, key=G.degree):
+        if common(v, w) >= K:
+            continue
         kwargs['cutoff'] = K
         K = min(K, local_node_connectivity(G, v, w, **kwargs))
+        if K == lower:
+            return K
     # Also for non adjacent pairs of neighbors of v
     for x, y in iter_func(neighbors(v), 2):
-        if y in G[x]:
+        if y in G[x] or common(x, y) >= K:
             continue
         kwargs['cutoff'] = K
         K = min(K, local_node_connectivity(G, x, y, **kwargs))
+        if K == lower:
+            return K
 
     return K
 
@@ -405,7 +442,7 @@ def average_node_connectivity(G, flow_func=None):
 
     # Reuse the auxiliary digraph and the residual network
     H = build_auxiliary_node_connectivity(G)
-    R = build_residual_network(H, 'capacity')
+    R = FlowSession(H, 'capacity', flow_func).residual
     kwargs = dict(flow_func=flow_func, auxiliary=H, residual=R)
 
     num, den = 0, 0
@@ -473,7 +510,7 @@ def all_pairs_node_connectivity(G, nbunch=None, flow_func=None):
     # Reuse auxiliary digraph and residual network
     H = build_auxiliary_node_connectivity(G)
     mapping = H.graph['mapping']
-    R = build_residual_network(H, 'capacity')
+    R = FlowSession(H, 'capacity', flow_func).residual
     kwargs = dict(flow_func=flow_func, auxiliary=H, residual=R)
 
     for u, v in iter_func(nbunch, 2):
@@ -732,6 +769,10 @@ def edge_connectivity(G, s=None, t=None, flow_func=None, cutoff=None):
     For directed graphs, the algorithm does n calls to the maximum
     flow function. This is an implementation of algorithm 8 in [1]_ .
 
+    Digraphs that are not strongly connected, undirected graphs with a
+    bridge, and simple graphs with minimum degree at least $n / 2$ are
+    answered without any flow computation.
+
     See also
     --------
     :meth:`local_edge_connectivity`
@@ -763,15 +804,13 @@ def edge_connectivity(G, s=None, t=None, flow_func=None, cutoff=None):
                                        cutoff=cutoff)
 
     # Global edge connectivity
-    # reuse auxiliary digraph and residual network
-    H = build_auxiliary_edge_connectivity(G)
-    R = build_residual_network(H, 'capacity')
-    kwargs = dict(flow_func=flow_func, auxiliary=H, residual=R)
-
     if G.is_directed():
         # Algorithm 8 in [1]
         if not nx.is_weakly_connected(G):
             return 0
+        # Some node cannot reach some other node
+        if not nx.is_strongly_connected(G):
+            return 0
 
         # initial value for \lambda is minimum degree
         L = min(d for n, d in G.degree())
@@ -780,6 +819,13 @@ def edge_connectivity(G, s=None, t=None, flow_func=None, cutoff=None):
 
         if cutoff is not None:
             L = min(cutoff, L)
+        if L <= 1:
+            return L
+
+        # reuse auxiliary digraph and residual network
+        H = build_auxiliary_edge_connectivity(G)
+        R = FlowSession(H, 'capacity', flow_func).residual
+        kwargs = dict(flow_func=flow_func, auxiliary=H, residual=R)
 
         for i in range(n):
             kwargs['cutoff'] = L
@@ -789,6 +835,8 @@ def edge_connectivity(G, s=None, t=None, flow_func=None, cutoff=None):
             except IndexError:  # last node!
                 L = min(L, local_edge_connectivity(G, nodes[i], nodes[0],
                                                    **kwargs))
+            if L == 1:
+                break
         return L
     else:  # undirected
         # Algorithm 6 in [1]
@@ -800,6 +848,18 @@ def edge_connectivity(G, s=None, t=None, flow_func=None, cutoff=None):
 
         if cutoff is not None:
             L = min(cutoff, L)
+        if L <= 1:
+            return L
+        lower = 1
+        if not G.is_multigraph() and nx.number_of_selfloops(G) == 0:
+            # A simple graph with minimum degree at least n / 2 has edge
+            # connectivity equal to its minimum degree, and one with a
+            # bridge has edge connectivity 1.
+            if 2 * min(d for n, d in G.degree()) >= len(G) - 1:
+                return L
+            if nx.has_bridges(G):
+                return 1
+            lower = 2
 
         # A dominating set is \lambda-covering
         # We need a dominating set with at least two nodes
@@ -813,8 +873,21 @@ def edge_connectivity(G, s=None, t=None, flow_func=None, cutoff=None):
             # thus we return min degree
             return L
 
-        for w in D:
+        # reuse auxiliary digraph and residual network
+        H = build_auxiliary_edge_connectivity(G)
+        R = FlowSession(H, 'capacity', flow_func).residual
+        kwargs = dict(flow_func=flow_func, auxiliary=H, residual=R)
+
+        # The common neighbors of v and w, and the edge between them if
+        # any, give edge disjoint paths, so the flow computation is
+        # skipped when there are at least L of them.
+        nbrs = set(G._adj[v])
+        for w in sorted(D, key=G.degree):
+            if len(nbrs & set(G._adj[w])) + (w in nbrs) >= L:
+                continue
             kwargs['cutoff'] = L
             L = min(L, local_edge_connectivity(G, v, w, **kwargs))
+            if L == lower:
+                break
 
         return L
@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019 by
+#   Aric Hagberg <hagberg@lanl.gov>
+#   Dan Schult <dschult@colgate.edu>
+#   Pieter Swart <swart@lanl.gov>
+# All rights reserved.
+# BSD license.
+"""
+Karger-Stein randomized minimum cut algorithm.
+"""
+from itertools import chain
+from math import ceil, log, sqrt
+
+import networkx as nx
+from networkx.utils import not_implemented_for
+from networkx.utils import py_random_state
+from .stoerwagner import _CutContraction
+
+__all__ = ['karger_stein']
+
+# Graphs with at most this many nodes are cut exactly at the bottom of
+# the recursion.
+_EXACT_SIZE = 32
+
+
+@not_implemented_for('directed')
+@not_implemented_for('multigraph')
+@py_random_state(3)
+def karger_stein(G, weight='weight', success_probability=0.9, seed=None):
+    r"""Returns a weighted minimum edge cut using the Karger-Stein algorithm.
+
+    The algorithm contracts randomly chosen edges, with probability
+    proportional to their weight, until about $n / \sqrt{2}$ nodes are
+    left, and recurses twice on the contracted graph [1]_. A single run
+    finds a given minimum cut with probability $\Omega(1 / \log n)$, so
+    enough independent runs are made to find a minimum cut with
+    probability at least `success_probability`. The cut returned is
+    always a valid cut, and its value is never smaller than the minimum.
+
+    Each run takes $O(n^2 \log n)$ time. Lowering `success_probability`
+    reduces the number of runs, trading certainty for speed.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+        Edges of the graph are expected to have an attribute named by the
+        weight parameter below. If this attribute is not present, the edge is
+        considered to have unit weight.
+
+    weight : string
+        Name of the weight attribute of the edges. If the attribute is not
+        present, unit weight is assumed. Default value: 'weight'.
+
+    success_probability : float
+        Lower bound on the probability that the cut returned is a minimum
+        cut. It must be strictly between 0 and 1; the number of runs grows
+        with $\log(1 / (1 - p))$. Default value: 0.9.
+
+    seed : integer, random_state, or None (default)
+        Indicator of random number generation state.
+        See :ref:`Randomness<randomness>`.
+
+    Returns
+    -------
+    cut_value : integer or float
+        The sum of weights of edges in the cut found.
+
+    partition : pair of node lists
+        A partitioning of the nodes that defines the cut.
+
+    Raises
+    ------
+    NetworkXNotImplemented
+        If the graph is directed or a multigraph.
+
+    NetworkXError
+        If the graph has less than two nodes, is not connected or has a
+        negative-weighted edge, or if `success_probability` is not strictly
+        between 0 and 1.
+
+    Examples
+    --------
+    >>> G = nx.Graph()
+    >>> G.add_edge('x', 'a', weight=3)
+    >>> G.add_edge('x', 'b', weight=1)
+    >>> G.add_edge('a', 'c', weight=3)
+    >>> G.add_edge('b', 'c', weight=5)
+    >>> G.add_edge('b', 'd', weight=4)
+    >>> G.add_edge('d', 'e', weight=2)
+    >>> G.add_edge('c', 'y', weight=2)
+    >>> G.add_edge('e', 'y', weight=3)
+    >>> cut_value, partition = nx.karger_stein(G, seed=42)
+    >>> cut_value
+    4
+
+    Notes
+    -----
+    As in :func:`stoer_wagner`, edges that no better cut than the best one
+    found so far needs to separate are contracted first with the tests of
+    Padberg and Rinaldi, and the cuts around single nodes are considered,
+    so only the remaining graph goes through the random contractions.
+    Once the contracted graphs are small enough, their minimum cuts are
+    found exactly.
+
+    See also
+    --------
+    stoer_wagner
+
+    References
+    ----------
+    .. [1] D. R. Karger, C. Stein.
+           A new approach to the minimum cut problem.
+           Journal of the ACM 43(4):601--640. 1996.
+    """
+    if not 0 < success_probability < 1:
+        raise nx.NetworkXError('success_probability must be strictly '
+                               'between 0 and 1.')
+    n = len(G)
+    if n < 2:
+        raise nx.NetworkXError('graph has less than two nodes.')
+    if not nx.is_connected(G):
+        raise nx.NetworkXError('graph is not connected.')
+
+    C = _CutContraction(G, weight)
+    C.reduce()
+    nodes = list(C.alive)
+    k = len(nodes)
+    if k > 2:
+        index = {u: i for i, u in enumerate(nodes)}
+        edges = [(index[u], index[v], w) for u in nodes
+                 for v, w in C.adj[u].items() if index[u] < index[v]]
+        # A run succeeds with probability at least 1 / (depth + 1), where
+        # depth is the number of recursion levels above the exact search.
+        depth = 0
+        while k > _EXACT_SIZE:
+            k = int(ceil(1 + k / sqrt(2)))
+            depth += 1
+        if depth == 0:
+            trials = 1
+        else:
+            trials = int(ceil(log(1 - success_probability) /
+                              log(1 - 1 / (depth + 1))))
+        best = None
+        for i in range(trials):
+            value, side = _recursive_contraction(len(nodes), edges, seed)
+            if value < C.cut_value and (best is None or value < best[0]):
+                best = (value, side)
+        if best is not None:
+            members = C.members()
+            side = set(chain.from_iterable(members[nodes[i]]
+                                           for i in best[1]))
+            partition = ([C.nodes[u] for u in side],
+                         [C.nodes[u] for u in range(n) if u not in side])
+            return best[0], partition
+    return C.cut_value, C.partition()
+
+
+def _recursive_contraction(n, edges, seed):
+    """Returns the value and one side of a cut of the graph with nodes
+    0, ..., n - 1 and weighted edges `edges`, found by the recursive
+    contractions of Karger and Stein.
+    """
+    if n <= _EXACT_SIZE:
+        return _exact_cut(n, edges)
+    t = int(ceil(1 + n / sqrt(2)))
+    best = None
+    for i in range(2):
+        labels, contracted = _contract(n, edges, t, seed)
+        value, side = _recursive_contraction(t, contracted, seed)
+        if best is None or value < best[0]:
+            best = (value, {u for u in range(n) if labels[u] in side})
+    return best
+
+
+def _contract(n, edges, t, seed):
+    """Contract random edges, chosen with probability proportional to
+    their weight, until t nodes are left.
+
+    Returns the labels in 0, ..., t - 1 of the contracted nodes and the
+    edges between them, with the weights of parallel edges added up.
+    Contracting the edges in increasing order of exponential keys with
+    rates equal to their weights is the same as repeatedly choosing a
+    random edge among those left.
+    """
+    inf = float('inf')
+    keys = [-log(1 - seed.random()) / w if w > 0 else inf
+            for u, v, w in edges]
+    parent = list(range(n))
+
+    def find(u):
+        while parent[u] != u:
+            parent[u] = parent[parent[u]]
+            u = parent[u]
+        return u
+
+    count = n
+    for i in sorted(range(len(edges)), key=keys.__getitem__):
+        if count == t:
+            break
+        u = find(edges[i][0])
+        v = find(edges[i][1])
+        if u != v:
+            parent[v] = u
+            count -= 1
+    roots = {}
+    labels = [roots.setdefault(find(u), len(roots)) for u in range(n)]
+    weights = {}
+    for u, v, w in edges:
+        u = labels[u]
+        v = labels[v]
+        if u != v:
+            if u > v:
+                u, v = v, u
+            weights[u, v] = weights.get((u, v), 0) + w
+    return labels, [(u, v, w) for (u, v), w in weights.items()]
+
+
+def _exact_cut(n, edges):
+    """Returns the value and one side of a minimum cut of a small graph
+    with nodes 0, ..., n - 1, by the Stoer-Wagner algorithm on its
+    weight matrix.
+    """
+    W = [[0] * n for u in range(n)]
+    for u, v, w in edges:
+        W[u][v] += w
+        W[v][u] += w
+    groups = [[u] for u in range(n)]
+    alive = list(range(n))
+    best = None
+    while len(alive) > 1:
+        # Find a maximum adjacency ordering; the cut between its last
+        # node and the others is a minimum cut between its last two nodes.
+        s = alive[0]
+        conn = {u: W[s][u] for u in alive[1:]}
+        t = s
+        while conn:
+            s = t
+            t = max(conn, key=conn.__getitem__)
+            value = conn.pop(t)
+            Wt = W[t]
+            for u in conn:
+                conn[u] += Wt[u]
+        if best is None or value < best[0]:
+            best = (value, list(groups[t]))
+        Ws = W[s]
+        for u in alive:
+            Ws[u] += W[t][u]
+            W[u][s] = Ws[u]
+        groups[s].extend(groups[t])
+        alive.remove(t)
+    return best[0], set(best[1])
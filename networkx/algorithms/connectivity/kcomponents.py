@@ -77,7 +77,10 @@ def k_components(G, flow_func=None):
            else end.
 
     This implementation also uses some heuristics (see [3]_ for details)
-    to speed up the computation.
+    to speed up the computation. Subgraphs without a 3-core are not
+    split further, since none of their parts can have node connectivity
+    above 2, and a set of nodes that comes out of several partitions is
+    only split once.
 
     See also
     --------
@@ -116,7 +119,7 @@ def k_components(G, flow_func=None):
         comp = set(component)
         if len(comp) > 1:
             k_components[1].append(comp)
-    bicomponents = list(nx.biconnected_component_subgraphs(G))
+    bicomponents = [G.subgraph(c).copy() for c in nx.biconnected_components(G)]
     for bicomponent in bicomponents:
         bicomp = set(bicomponent)
         # avoid considering dyads as bicomponents
@@ -125,18 +128,37 @@ def k_components(G, flow_func=None):
     for B in bicomponents:
         if len(B) <= 2:
             continue
+        # Subgraphs of a graph without a 3-core have connectivity at
+        # most 2, so there are no higher order k-components to look for.
+        if _max_core_number(B) <= 2:
+            continue
         k = nx.node_connectivity(B, flow_func=flow_func)
         if k > 2:
             k_components[k].append(set(B.nodes()))
         # Perform cuts in a DFS like order.
         cuts = list(nx.all_node_cuts(B, k=k, flow_func=flow_func))
         stack = [(k, _generate_partition(B, cuts, k))]
+        # The same set of nodes can come out of the partitions of several
+        # parents. What is found below it only depends on the set, so its
+        # connectivity is recorded and it is split only once.
+        seen = {}
         while stack:
             (parent_k, partition) = stack[-1]
             try:
                 nodes = next(partition)
+                key = frozenset(nodes)
+                this_k = seen.get(key)
+                if this_k is not None:
+                    if this_k > parent_k and this_k > 2:
+                        k_components[this_k].append(set(nodes))
+                    continue
                 C = B.subgraph(nodes)
+                if _max_core_number(C) <= 2:
+                    # Neither C nor its parts can be reported.
+                    seen[key] = 0
+                    continue
                 this_k = nx.node_connectivity(C, flow_func=flow_func)
+                seen[key] = this_k
                 if this_k > parent_k and this_k > 2:
                     k_components[this_k].append(set(C.nodes()))
                 cuts = list(nx.all_node_cuts(C, k=this_k, flow_func=flow_func))
@@ -155,6 +177,17 @@ def k_components(G, flow_func=None):
     return _reconstruct_k_components(k_components)
 
 
+def _max_core_number(G):
+    """Returns the largest k such that G has a nonempty k-core.
+
+    This bounds the node connectivity of every subgraph of G. Self loops
+    do not count, as they do not add to the connectivity.
+    """
+    if nx.number_of_selfloops(G) > 0:
+        G = nx.restricted_view(G, [], list(nx.selfloop_edges(G)))
+    return max(nx.core_number(G).values())
+
+
 def _consolidate(sets, k):
     """Merge sets that share k or more elements.
 
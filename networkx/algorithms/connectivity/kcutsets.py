@@ -8,11 +8,13 @@ from itertools import combinations
 from operator import itemgetter
 
 import networkx as nx
+from .connectivity import local_node_connectivity
 from .utils import build_auxiliary_node_connectivity
 from networkx.algorithms.flow import (
     build_residual_network,
     edmonds_karp,
     shortest_augmenting_path,
+    FlowSession,
 )
 default_flow_func = edmonds_karp
 
@@ -74,6 +76,11 @@ def all_node_cuts(G, k=None, flow_func=None):
     node and the target node of the local maximum flow computation to make 
     sure that we will not find that minimum cut again.
 
+    Pairs of nodes are first screened with a maximum flow computation that
+    stops as soon as the flow exceeds k, on an array residual network that
+    is reused across pairs, so that the full residual network analysis is
+    only done for pairs separated by a k-cutset.
+
     See also
     --------
     node_connectivity
@@ -102,7 +109,7 @@ def all_node_cuts(G, k=None, flow_func=None):
     # Even-Tarjan reduction is what we call auxiliary digraph
     # for node connectivity.
     H = build_auxiliary_node_connectivity(G)
-    H_nodes = H.nodes # for speed
+    node_id = {n: d['id'] for n, d in H.nodes(data=True)}  # for speed
     mapping = H.graph['mapping']
     # Keep a copy of original predecessors, H will be modified later.
     # Shallow copy is enough.
@@ -118,6 +125,14 @@ def all_node_cuts(G, k=None, flow_func=None):
     # step 1: Find node connectivity k of G
     if k is None:
         k = nx.node_connectivity(G, flow_func=flow_func)
+    # Pairs of nodes with more than k node independent paths have no
+    # k-cutset between them. They are discarded with a flow computation
+    # that stops at k + 1, on a reusable array residual network of H.
+    # The edges added to H below are not in that network, so it can only
+    # underestimate the flow, which keeps the test safe.
+    screen = dict(flow_func=flow_func, auxiliary=H,
+                  residual=FlowSession(H, 'capacity', flow_func).residual,
+                  cutoff=k + 1)
     # step 2:
     # Find k nodes with top degree, call it X:
     X = {n for n, d in sorted(G.degree(), key=itemgetter(1), reverse=True)[:k]}
@@ -131,6 +146,8 @@ def all_node_cuts(G, k=None, flow_func=None):
         # non adjacent nodes in G
         non_adjacent = set(G) - X - set(G[x])
         for v in non_adjacent:
+            if local_node_connectivity(G, x, v, **screen) > k:
+                continue
             # step 4: compute maximum flow in an Even-Tarjan reduction H of G
             # and step 5: build the associated residual network R
             R = flow_func(H, '%sB' % mapping[x], '%sA' % mapping[v], **kwargs)
@@ -150,7 +167,6 @@ def all_node_cuts(G, k=None, flow_func=None):
                                    if d['capacity'] == d['flow']
                                    or d['capacity'] == 0]
                 R.remove_edges_from(saturated_edges)
-                R_closure = nx.transitive_closure(R)
                 # step 6: shrink the strongly connected components of
                 # residual flow network R and call it L.
                 L = nx.condensation(R)
@@ -160,13 +176,33 @@ def all_node_cuts(G, k=None, flow_func=None):
                     inv_cmap[scc].append(n)
                 # Find the incident nodes in the condensed graph.
                 VE1 = set([cmap[n] for n in VE1])
+                # The closed set of an antichain contains the source only
+                # if the component of the source is in the antichain or is
+                # an ancestor of some element of it, and likewise for the
+                # target.
+                source_scc = cmap['%sB' % mapping[x]]
+                target_scc = cmap['%sA' % mapping[v]]
+                below_source = nx.descendants(L, source_scc)
+                below_source.add(source_scc)
+                below_target = nx.descendants(L, target_scc)
+                below_target.add(target_scc)
+                # The ancestors in R of the nodes of a strongly connected
+                # component are the nodes of its ancestors in L, so the
+                # closed sets are unions of precomputed sets, and no
+                # transitive closure of R is needed.
+                closure = {}
+                for scc in VE1:
+                    closure[scc] = S = set(inv_cmap[scc])
+                    for a in nx.ancestors(L, scc):
+                        S.update(inv_cmap[a])
                 # step 7: Compute all antichains of L;
                 # they map to closed sets in H.
                 # Any edge in H that links a closed set is part of a cutset.
-                for antichain in nx.antichains(L):
-                    # Only antichains that are subsets of incident nodes counts.
-                    # Lemma 8 in reference.
-                    if not set(antichain).issubset(VE1):
+                # Only antichains that are subsets of incident nodes counts.
+                # Lemma 8 in reference.
+                for antichain in _antichains(L, VE1):
+                    if (below_source.isdisjoint(antichain) or
+                            not below_target.isdisjoint(antichain)):
                         continue
                     # Nodes in an antichain of the condensation graph of
                     # the residual network map to a closed set of nodes that
@@ -175,25 +211,13 @@ def all_node_cuts(G, k=None, flow_func=None):
                     # transitive closure.
                     S = set()
                     for scc in antichain:
-                        S.update(inv_cmap[scc])
-                    S_ancestors = set()
-                    for n in S:
-                        S_ancestors.update(R_closure._pred[n])
-                    S.update(S_ancestors)
-                    if '%sB' % mapping[x] not in S or '%sA' % mapping[v] in S:
-                        continue
+                        S.update(closure[scc])
                     # Find the cutset that links the node partition (S,~S) in H
-                    cutset = set()
-                    for u in S:
-                        cutset.update((u, w)
-                                      for w in original_H_pred[u] if w not in S)
                     # The edges in H that form the cutset are internal edges
                     # (ie edges that represent a node of the original graph G)
-                    if any([H_nodes[u]['id'] != H_nodes[w]['id']
-                            for u, w in cutset]):
+                    node_cut = _node_cut(S, original_H_pred, node_id, k)
+                    if node_cut is None:
                         continue
-                    node_cut = {H_nodes[u]['id'] for u, _ in cutset}
-
                     if len(node_cut) == k:
                         # The cut is invalid if it includes internal edges of
                         # end nodes. The other half of Lemma 8 in ref.
@@ -228,6 +252,46 @@ def all_node_cuts(G, k=None, flow_func=None):
                 R.add_edges_from(saturated_edges)
 
 
+def _antichains(L, nodes):
+    """Generate the antichains of the DAG L that are subsets of `nodes`.
+
+    They come in the same order as from :func:`networkx.antichains`, but
+    without going through the, possibly many more, antichains of L that
+    have other nodes.
+    """
+    descendants = {n: nx.descendants(L, n) for n in nodes}
+    order = [n for n in reversed(list(nx.topological_sort(L)))
+             if n in descendants]
+    antichains_stacks = [([], order)]
+    while antichains_stacks:
+        (antichain, stack) = antichains_stacks.pop()
+        yield antichain
+        while stack:
+            x = stack.pop()
+            new_antichain = antichain + [x]
+            new_stack = [t for t in stack if not (t in descendants[x] or
+                                                  x in descendants[t])]
+            antichains_stacks.append((new_antichain, new_stack))
+
+
+def _node_cut(S, H_pred, node_id, k):
+    """Returns the nodes of G whose internal edges in H enter the set S.
+
+    Returns None as soon as an edge entering S is not an internal edge,
+    or more than k nodes are found.
+    """
+    node_cut = set()
+    for u in S:
+        for w in H_pred[u]:
+            if w not in S:
+                if node_id[u] != node_id[w]:
+                    return None
+                node_cut.add(node_id[u])
+        if len(node_cut) > k:
+            return None
+    return node_cut
+
+
 def _is_separating_set(G, cut):
     """Assumes that the input graph is connected"""
     if len(cut) == len(G) - 1:
@@ -77,6 +77,17 @@ def stoer_wagner(G, weight='weight', heap=BinaryHeap):
         If the graph has less than two nodes, is not connected or has a
         negative-weighted edge.
 
+    Notes
+    -----
+    Before and between the phases of the algorithm, edges that no better
+    cut than the best one found so far needs to separate are contracted
+    with the tests of Padberg and Rinaldi. On sparse graphs with many
+    nodes of low degree this leaves few nodes for the phases themselves.
+
+    See also
+    --------
+    karger_stein
+
     Examples
     --------
     >>> G = nx.Graph()
@@ -98,60 +109,154 @@ def stoer_wagner(G, weight='weight', heap=BinaryHeap):
     if not nx.is_connected(G):
         raise nx.NetworkXError('graph is not connected.')
 
-    # Make a copy of the graph for internal use.
-    G = nx.Graph((u, v, {'weight': e.get(weight, 1)})
-                 for u, v, e in G.edges(data=True) if u != v)
-
-    for u, v, e, in G.edges(data=True):
-        if e['weight'] < 0:
-            raise nx.NetworkXError('graph has a negative-weighted edge.')
-
-    cut_value = float('inf')
-    nodes = set(G)
-    contractions = []  # contracted node pairs
+    # Work on integer-indexed adjacency dicts instead of a graph copy, and
+    # first contract the edges that no minimum cut needs to separate.
+    C = _CutContraction(G, weight)
+    C.reduce()
+    adj = C.adj
 
     # Repeatedly pick a pair of nodes to contract until only one node is left.
-    for i in range(n - 1):
+    while len(C.alive) > 1:
         # Pick an arbitrary node u and create a set A = {u}.
-        u = arbitrary_element(G)
+        u = arbitrary_element(C.alive)
         A = set([u])
         # Repeatedly pick the node "most tightly connected" to A and add it to
         # A. The tightness of connectivity of a node not in A is defined by the
         # of edges connecting it to nodes in A.
         h = heap()  # min-heap emulating a max-heap
-        for v, e in G[u].items():
-            h.insert(v, -e['weight'])
+        for v, w in adj[u].items():
+            h.insert(v, -w)
         # Repeat until all but one node has been added to A.
-        for j in range(n - i - 2):
+        for j in range(len(C.alive) - 2):
             u = h.pop()[0]
             A.add(u)
-            for v, e, in G[u].items():
+            for v, w in adj[u].items():
                 if v not in A:
-                    h.insert(v, h.get(v, 0) - e['weight'])
+                    h.insert(v, h.get(v, 0) - w)
         # A and the remaining node v define a "cut of the phase". There is a
         # minimum cut of the original graph that is also a cut of the phase.
         # Due to contractions in earlier phases, v may in fact represent
         # multiple nodes in the original graph.
         v, w = h.min()
-        w = -w
-        if w < cut_value:
-            cut_value = w
-            best_phase = i
+        C.record(v, -w)
         # Contract v and the last node added to A.
-        contractions.append((u, v))
-        for w, e in G[v].items():
-            if w != u:
-                if w not in G[u]:
-                    G.add_edge(u, w, weight=e['weight'])
-                else:
-                    G[u][w]['weight'] += e['weight']
-        G.remove_node(v)
-
-    # Recover the optimal partitioning from the contractions.
-    G = nx.Graph(islice(contractions, best_phase))
-    v = contractions[best_phase][1]
-    G.add_node(v)
-    reachable = set(nx.single_source_shortest_path_length(G, v))
-    partition = (list(reachable), list(nodes - reachable))
-
-    return cut_value, partition
+        C.contract(u, v)
+        C.reduce()
+
+    return C.cut_value, C.partition()
+
+
+class _CutContraction(object):
+    """Contractions of the nodes of an undirected graph that keep track of
+    the best cut around a contracted node seen so far.
+
+    The nodes of `G` are numbered in iteration order and `adj[u]` maps the
+    neighbors of a live node `u` to the total weight of the edges between
+    them. `deg[u]` is the weighted degree of `u`, so that it is the value
+    of the cut around the nodes contracted into `u`. The contractions are
+    kept in order, so that the side of the best cut can be recovered at
+    the end without maintaining the members of every node.
+    """
+
+    def __init__(self, G, weight):
+        self.nodes = list(G)
+        index = {u: i for i, u in enumerate(self.nodes)}
+        n = len(self.nodes)
+        adj = [{} for u in range(n)]
+        for u, v, e in G.edges(data=True):
+            if u != v:
+                w = e.get(weight, 1)
+                if w < 0:
+                    raise nx.NetworkXError(
+                        'graph has a negative-weighted edge.')
+                adj[index[u]][index[v]] = w
+                adj[index[v]][index[u]] = w
+        self.adj = adj
+        self.deg = [sum(nbrs.values()) for nbrs in adj]
+        self.alive = set(range(n))
+        self.contractions = []
+        self.cut_value = float('inf')
+        self.best = None
+        for u in range(n):
+            self.record(u, self.deg[u])
+
+    def record(self, v, value):
+        """Record the cut around node v if its value is the best so far."""
+        if value < self.cut_value and len(self.alive) > 1:
+            self.cut_value = value
+            self.best = (len(self.contractions), v)
+
+    def contract(self, u, v):
+        """Contract node v into node u and return u."""
+        adj = self.adj
+        adj_u = adj[u]
+        w_uv = adj_u.pop(v, 0)
+        for x, w in adj[v].items():
+            if x != u:
+                adj_x = adj[x]
+                del adj_x[v]
+                adj_x[u] = adj_u[x] = adj_u.get(x, 0) + w
+        adj[v] = None
+        self.deg[u] += self.deg[v] - 2 * w_uv
+        self.alive.remove(v)
+        self.contractions.append((u, v))
+        return u
+
+    def reduce(self):
+        """Contract edges that no cut better than the best one found needs
+        to separate.
+
+        These are the tests of Padberg and Rinaldi [1]_: an edge is
+        contracted if its weight is at least the value of the best cut, or
+        if twice its weight is at least the weighted degree of one of its
+        endpoints, since moving that endpoint to the other side of a cut
+        does not increase its value.
+
+        References
+        ----------
+        .. [1] M. Padberg, G. Rinaldi.
+               An efficient algorithm for the minimum capacity cut problem.
+               Mathematical Programming 47(1):19--36. 1990.
+        """
+        adj = self.adj
+        deg = self.deg
+        stack = list(self.alive)
+        while stack and len(self.alive) > 2:
+            u = stack.pop()
+            if adj[u] is None:
+                continue
+            for v, w in adj[u].items():
+                if (w >= self.cut_value or 2 * w >= deg[u] or
+                        2 * w >= deg[v]):
+                    if len(adj[u]) < len(adj[v]):
+                        u, v = v, u
+                    self.contract(u, v)
+                    self.record(u, deg[u])
+                    stack.append(u)
+                    break
+
+    def side(self, k, v):
+        """Returns the original nodes contracted into v by the first k
+        contractions.
+        """
+        G = nx.Graph(islice(self.contractions, k))
+        G.add_node(v)
+        return set(nx.node_connected_component(G, v))
+
+    def members(self):
+        """Returns a dict mapping each live node to the list of original
+        nodes contracted into it.
+        """
+        members = {u: [u] for u in range(len(self.nodes))}
+        for u, v in self.contractions:
+            if len(members[u]) < len(members[v]):
+                members[u], members[v] = members[v], members[u]
+            members[u].extend(members.pop(v))
+        return members
+
+    def partition(self):
+        """Returns the partition of the original nodes of the best cut."""
+        side = self.side(*self.best)
+        nodes = self.nodes
+        return ([nodes[u] for u in side],
+                [nodes[u] for u in range(len(nodes)) if u not in side])
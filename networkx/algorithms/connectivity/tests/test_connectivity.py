@@ -309,6 +309,38 @@ def test_edge_connectivity_flow_vs_stoer_wagner():
         assert_equal(nx.stoer_wagner(G)[0], nx.edge_connectivity(G))
 
 
+def test_connectivity_bounds():
+    # Graphs decided by the degree, articulation point and bridge bounds
+    # must agree with the flow computations on their pairs of nodes.
+    barbell = nx.barbell_graph(5, 0)
+    two_blocks = nx.disjoint_union(nx.complete_graph(5),
+                                   nx.complete_graph(5))
+    two_blocks = nx.contracted_nodes(two_blocks, 0, 5, self_loops=False)
+    cocktail = nx.complement(nx.Graph([(2 * i, 2 * i + 1) for i in range(6)]))
+    one_way = nx.DiGraph([(0, 1), (1, 2), (2, 0), (2, 3)])
+    for G, k, l in [(barbell, 1, 1), (two_blocks, 1, 4), (cocktail, 10, 10),
+                    (one_way, 0, 0)]:
+        for flow_func in flow_funcs:
+            kwargs = dict(flow_func=flow_func)
+            assert_equal(k, nx.node_connectivity(G, **kwargs),
+                         msg=msg.format(flow_func.__name__))
+            assert_equal(l, nx.edge_connectivity(G, **kwargs),
+                         msg=msg.format(flow_func.__name__))
+
+
+def test_connectivity_random_graphs():
+    for i in range(10):
+        G = nx.gnp_random_graph(12, 0.5, seed=i)
+        pairs = list(itertools.combinations(G, 2))
+        K = min([len(G) - 1] + [nx.node_connectivity(G, u, v)
+                                for u, v in pairs if v not in G[u]])
+        L = min(nx.edge_connectivity(G, u, v) for u, v in pairs)
+        if not nx.is_connected(G):
+            K = 0
+        assert_equal(K, nx.node_connectivity(G))
+        assert_equal(L, nx.edge_connectivity(G))
+
+
 class TestAllPairsNodeConnectivity:
 
     def setUp(self):
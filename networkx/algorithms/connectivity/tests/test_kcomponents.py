@@ -114,6 +114,14 @@ def test_random_gnp():
     _check_connectivity(G, result)
 
 
+def test_without_3_core():
+    G = nx.ladder_graph(6)
+    nx.add_path(G, [0, 'a', 'b', 5])
+    result = nx.k_components(G)
+    assert_equal(sorted(result), [1, 2])
+    assert_equal(result[2], [set(G)])
+
+
 def test_shell():
     constructor = [(20, 80, 0.8), (80, 180, 0.6)]
     G = nx.random_shell_graph(constructor, seed=42)
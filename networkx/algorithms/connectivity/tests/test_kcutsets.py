@@ -6,6 +6,7 @@ from nose.tools import assert_equal, assert_false, assert_true, assert_raises
 import networkx as nx
 from networkx.algorithms import flow
 from networkx.algorithms.connectivity.kcutsets import _is_separating_set
+from networkx.algorithms.connectivity.kcutsets import _antichains
 
 MAX_CUTSETS_TO_TEST = 4  # originally 100. cut to decrease testing time
 
@@ -221,6 +222,21 @@ def test_alternative_flow_functions():
                 assert_false(nx.is_connected(nx.restricted_view(G, cut, [])))
 
 
+def test_preflow_push_grid():
+    G = nx.grid_2d_graph(4, 4)
+    cuts = list(nx.all_node_cuts(G, flow_func=flow.preflow_push))
+    assert_equal(sorted(map(sorted, cuts)),
+                 sorted(map(sorted, nx.all_node_cuts(G))))
+
+
+def test_antichains_subset():
+    G = nx.gnp_random_graph(12, 0.3, directed=True, seed=7)
+    G.remove_edges_from([(u, v) for u, v in G.edges() if u > v])
+    for nodes in [set(G), set(range(0, 12, 2)), {3, 5, 6, 11}, set()]:
+        expected = [a for a in nx.antichains(G) if set(a) <= nodes]
+        assert_equal(list(_antichains(G, nodes)), expected)
+
+
 def test_is_separating_set_complete_graph():
     G = nx.complete_graph(5)
     assert_true(_is_separating_set(G, {0, 1, 2, 3}))
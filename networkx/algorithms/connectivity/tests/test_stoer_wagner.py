@@ -29,6 +29,9 @@ def _test_stoer_wagner(G, answer, weight='weight'):
                                            heap=nx.utils.BinaryHeap)
     assert_equal(cut_value, answer)
     _check_partition(G, cut_value, partition, weight)
+    cut_value, partition = nx.karger_stein(G, weight, seed=42)
+    assert_equal(cut_value, answer)
+    _check_partition(G, cut_value, partition, weight)
 
 
 def test_graph1():
@@ -85,6 +88,36 @@ def test_weight_name():
     _test_stoer_wagner(G, 6, weight='cost')
 
 
+def test_pendant_nodes():
+    G = nx.complete_graph(6)
+    nx.set_edge_attributes(G, 3, 'weight')
+    G.add_edge(0, 'a', weight=5)
+    G.add_edge('a', 'b', weight=6)
+    G.add_edge(3, 'c', weight=0)
+    _test_stoer_wagner(G, 0)
+    G.remove_node('c')
+    _test_stoer_wagner(G, 5)
+
+
+def test_karger_stein_large():
+    # Two dense halves joined by a few light edges, large enough for the
+    # random contractions to recurse.
+    G = nx.Graph()
+    for offset in (0, 50):
+        for u in range(offset, offset + 50):
+            for v in range(u + 1, offset + 50):
+                G.add_edge(u, v, weight=1 + (u * v) % 3)
+    G.add_edge(0, 50, weight=2)
+    G.add_edge(10, 60, weight=1)
+    G.add_edge(20, 70, weight=2)
+    cut_value, partition = nx.karger_stein(G, success_probability=0.99,
+                                           seed=1)
+    assert_equal(cut_value, 5)
+    _check_partition(G, cut_value, partition, 'weight')
+    assert_equal(set(map(frozenset, partition)),
+                 {frozenset(range(50)), frozenset(range(50, 100))})
+
+
 def test_exceptions():
     G = nx.Graph()
     assert_raises(nx.NetworkXError, nx.stoer_wagner, G)
@@ -100,3 +133,23 @@ def test_exceptions():
     assert_raises(nx.NetworkXNotImplemented, nx.stoer_wagner, G)
     G = nx.MultiDiGraph()
     assert_raises(nx.NetworkXNotImplemented, nx.stoer_wagner, G)
+
+
+def test_karger_stein_exceptions():
+    G = nx.Graph()
+    assert_raises(nx.NetworkXError, nx.karger_stein, G)
+    G.add_node(1)
+    assert_raises(nx.NetworkXError, nx.karger_stein, G)
+    G.add_node(2)
+    assert_raises(nx.NetworkXError, nx.karger_stein, G)
+    G.add_edge(1, 2, weight=-2)
+    assert_raises(nx.NetworkXError, nx.karger_stein, G)
+    G.add_edge(1, 2, weight=2)
+    assert_raises(nx.NetworkXError, nx.karger_stein, G,
+                  success_probability=1)
+    assert_raises(nx.NetworkXError, nx.karger_stein, G,
+                  success_probability=0)
+    G = nx.DiGraph()
+    assert_raises(nx.NetworkXNotImplemented, nx.karger_stein, G)
+    G = nx.MultiGraph()
+    assert_raises(nx.NetworkXNotImplemented, nx.karger_stein, G)
@@ -36,7 +36,7 @@ from networkx.exception import NetworkXError
 from networkx.utils import not_implemented_for
 
 __all__ = ['core_number', 'find_cores', 'k_core',
-           'k_shell', 'k_crust', 'k_corona']
+           'k_shell', 'k_crust', 'k_corona', 'DynamicCoreDecomposition']
 
 
 @not_implemented_for('multigraph')
@@ -81,31 +81,42 @@ def core_number(G):
         msg = ('Input graph has self loops which is not permitted; '
                'Consider using G.remove_edges_from(nx.selfloop_edges(G)).')
         raise NetworkXError(msg)
-    degrees = dict(G.degree())
-    # Sort nodes by degree.
-    nodes = sorted(degrees, key=degrees.get)
-    bin_boundaries = [0]
-    curr_degree = 0
-    for i, v in enumerate(nodes):
-        if degrees[v] > curr_degree:
-            bin_boundaries.extend([i] * (degrees[v] - curr_degree))
-            curr_degree = degrees[v]
-    node_pos = {v: pos for pos, v in enumerate(nodes)}
+    # Work on integer indices: nbrs[i] lists the neighbors of node i, with
+    # a neighbor repeated when both directed edges are present.
+    nodes = list(G)
+    index = {v: i for i, v in enumerate(nodes)}
+    nbrs = [[index[u] for u in nx.all_neighbors(G, v)] for v in nodes]
     # The initial guess for the core number of a node is its degree.
-    core = degrees
-    nbrs = {v: list(nx.all_neighbors(G, v)) for v in G}
-    for v in nodes:
+    core = [len(vnbrs) for vnbrs in nbrs]
+    # Bucket sort the nodes by degree; bin_boundaries[d] is the position
+    # of the first node with current core number d.
+    bin_boundaries = [0] * (max(core, default=0) + 2)
+    for d in core:
+        bin_boundaries[d + 1] += 1
+    for d in range(1, len(bin_boundaries)):
+        bin_boundaries[d] += bin_boundaries[d - 1]
+    order = [0] * len(nodes)
+    node_pos = [0] * len(nodes)
+    next_pos = bin_boundaries[:]
+    for v, d in enumerate(core):
+        node_pos[v] = next_pos[d]
+        order[next_pos[d]] = v
+        next_pos[d] += 1
+    for i in range(len(order)):
+        v = order[i]
+        cv = core[v]
         for u in nbrs[v]:
-            if core[u] > core[v]:
-                nbrs[u].remove(v)
+            cu = core[u]
+            if cu > cv:
+                # move u to the start of its bin and shrink the bin
                 pos = node_pos[u]
-                bin_start = bin_boundaries[core[u]]
-                node_pos[u] = bin_start
-                node_pos[nodes[bin_start]] = pos
-                nodes[bin_start], nodes[pos] = nodes[pos], nodes[bin_start]
-                bin_boundaries[core[u]] += 1
-                core[u] -= 1
-    return core
+                bin_start = bin_boundaries[cu]
+                w = order[bin_start]
+                order[bin_start], order[pos] = u, w
+                node_pos[u], node_pos[w] = bin_start, pos
+                bin_boundaries[cu] += 1
+                core[u] = cu - 1
+    return dict(zip(nodes, core))
 
 
 find_cores = core_number
@@ -353,3 +364,234 @@ def k_corona(G, k, core_number=None):
     def func(v, k, c):
         return c[v] == k and k == sum(1 for w in G[v] if c[w] >= k)
     return _core_subgraph(G, func, k, core_number)
+
+
+class DynamicCoreDecomposition(object):
+    """Core numbers of an undirected graph maintained under edge updates.
+
+    The structure computes :func:`core_number` once. When an edge is
+    added or removed through the methods of this class, the core numbers
+    are updated by a traversal from its endpoints [1]_: an inserted edge
+    can only raise, by one, the core number `k` of nodes with core number
+    `k` that are reachable from its endpoint of smaller core number, and
+    a removed edge can only lower, by one, the core numbers of such
+    nodes. The traversal visits those nodes and their neighbors, not the
+    whole graph.
+
+    `k_core`, `k_shell`, `k_crust` and `k_corona` are then answered from
+    the maintained core numbers. `G` must only be modified through the
+    methods of this class.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+       An undirected graph without self loops.
+
+    Attributes
+    ----------
+    graph : NetworkX graph
+       The graph `G`.
+
+    Raises
+    ------
+    NetworkXNotImplemented
+        If `G` is directed or a multigraph.
+
+    NetworkXError
+        If `G` has self loops.
+
+    Examples
+    --------
+    >>> G = nx.cycle_graph(4)
+    >>> cores = nx.DynamicCoreDecomposition(G)
+    >>> cores.core_number()
+    {0: 2, 1: 2, 2: 2, 3: 2}
+    >>> cores.add_edge(0, 2)
+    >>> cores.add_edge(1, 3)
+    >>> sorted(cores.k_core())
+    [0, 1, 2, 3]
+    >>> cores.core_number()[0]
+    3
+    >>> cores.remove_edge(0, 1)
+    >>> cores.core_number()
+    {0: 2, 1: 2, 2: 2, 3: 2}
+
+    See Also
+    --------
+    core_number
+
+    References
+    ----------
+    .. [1] Ahmet Erdem Sarıyüce, Buğra Gedik, Gabriela Jacques-Silva,
+       Kun-Lung Wu and Ümit V. Çatalyürek:
+       Streaming algorithms for k-core decomposition.
+       Proceedings of the VLDB Endowment 6(6):433-444, 2013.
+       https://doi.org/10.14778/2536336.2536344
+    """
+
+    def __init__(self, G):
+        if G.is_directed():
+            raise nx.NetworkXNotImplemented('not implemented for directed '
+                                            'type')
+        if G.is_multigraph():
+            raise nx.NetworkXNotImplemented('not implemented for multigraph '
+                                            'type')
+        self.graph = G
+        self._core = core_number(G)
+
+    def core_number(self):
+        """Returns a dictionary keyed by node to the core number."""
+        return dict(self._core)
+
+    def k_core(self, k=None):
+        """Returns the k-core of the graph, as :func:`k_core`."""
+        return k_core(self.graph, k, self._core)
+
+    def k_shell(self, k=None):
+        """Returns the k-shell of the graph, as :func:`k_shell`."""
+        return k_shell(self.graph, k, self._core)
+
+    def k_crust(self, k=None):
+        """Returns the k-crust of the graph, as :func:`k_crust`."""
+        return k_crust(self.graph, k, self._core)
+
+    def k_corona(self, k):
+        """Returns the k-corona of the graph, as :func:`k_corona`."""
+        return k_corona(self.graph, k, self._core)
+
+    def add_node(self, n, **attr):
+        """Add node `n` to the graph, with core number zero if new."""
+        self.graph.add_node(n, **attr)
+        self._core.setdefault(n, 0)
+
+    def add_edge(self, u, v, **attr):
+        """Add an edge between `u` and `v` and update the core numbers.
+
+        Attributes are passed on to the graph. Adding an edge that is
+        already present only updates its attributes.
+
+        Raises
+        ------
+        NetworkXError
+            If `u` and `v` are the same node.
+        """
+        if u == v:
+            raise NetworkXError('Self loops are not permitted.')
+        new = not self.graph.has_edge(u, v)
+        self.add_node(u)
+        self.add_node(v)
+        self.graph.add_edge(u, v, **attr)
+        if new:
+            self._insert(u, v)
+
+    def add_edges_from(self, ebunch_to_add, **attr):
+        """Add all edges in `ebunch_to_add` and update the core numbers.
+
+        Edges may be given as 2-tuples `(u, v)` or 3-tuples `(u, v, d)`
+        as for :meth:`Graph.add_edges_from`.
+        """
+        for e in ebunch_to_add:
+            u, v = e[:2]
+            dd = dict(attr)
+            if len(e) == 3:
+                dd.update(e[2])
+            self.add_edge(u, v, **dd)
+
+    def remove_edge(self, u, v):
+        """Remove the edge between `u` and `v` and update the core numbers.
+
+        Raises
+        ------
+        NetworkXError
+            If there is no edge between `u` and `v`.
+        """
+        self.graph.remove_edge(u, v)
+        self._delete(u, v)
+
+    def remove_node(self, n):
+        """Remove node `n` and its edges and update the core numbers.
+
+        Raises
+        ------
+        NetworkXError
+            If `n` is not in the graph.
+        """
+        if n not in self.graph:
+            raise NetworkXError('The node %s is not in the graph.' % (n,))
+        for u in list(self.graph[n]):
+            self.remove_edge(n, u)
+        self.graph.remove_node(n)
+        del self._core[n]
+
+    def _insert(self, u, v):
+        """Raises the core numbers after the edge `(u, v)` was added."""
+        core = self._core
+        adj = self.graph._adj
+        k = min(core[u], core[v])
+        # cd[w] is the number of neighbors of a visited node w that can be
+        # in the new (k + 1)-core: those of larger core number and those of
+        # core number k that were not evicted.
+        cd = {}
+        evicted = set()
+        stack = [w for w in (u, v) if core[w] == k]
+        visited = set(stack)
+        while stack:
+            w = stack.pop()
+            cd[w] = sum(1 for x in adj[w]
+                        if core[x] > k or (core[x] == k and x not in evicted))
+            if cd[w] > k:
+                for x in adj[w]:
+                    if core[x] == k and x not in visited:
+                        visited.add(x)
+                        stack.append(x)
+                continue
+            # w cannot reach core number k + 1; neither can the visited
+            # nodes that relied on it.
+            evicted.add(w)
+            queue = [w]
+            while queue:
+                z = queue.pop()
+                for x in adj[z]:
+                    if x in cd and x not in evicted:
+                        cd[x] -= 1
+                        if cd[x] <= k:
+                            evicted.add(x)
+                            queue.append(x)
+        for w in cd:
+            if w not in evicted:
+                core[w] = k + 1
+
+    def _delete(self, u, v):
+        """Lowers the core numbers after the edge `(u, v)` was removed."""
+        core = self._core
+        adj = self.graph._adj
+        k = min(core[u], core[v])
+        # cd[w] is the number of neighbors of w that are still in the
+        # k-core; it is only computed for nodes next to a dropped node.
+        # A dropped node is in `done` once its neighbors have seen it go.
+        cd = {}
+        dropped = set()
+        done = set()
+        stack = []
+        for w in (u, v):
+            if core[w] == k and w not in cd:
+                cd[w] = sum(1 for x in adj[w] if core[x] >= k)
+                if cd[w] < k:
+                    dropped.add(w)
+                    stack.append(w)
+        while stack:
+            w = stack.pop()
+            done.add(w)
+            for x in adj[w]:
+                if core[x] != k or x in dropped:
+                    continue
+                if x in cd:
+                    cd[x] -= 1
+                else:
+                    cd[x] = sum(1 for y in adj[x]
+                                if core[y] >= k and y not in done)
+                if cd[x] < k:
+                    dropped.add(x)
+                    stack.append(x)
+        for w in dropped:
+            core[w] = k - 1
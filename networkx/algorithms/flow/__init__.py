@@ -7,5 +7,7 @@ from .gomory_hu import *
 from .preflowpush import *
 from .shortestaugmentingpath import *
 from .capacityscaling import *
+from .costscaling import *
 from .networksimplex import *
 from .utils import build_flow_dict, build_residual_network
+from .utils import ArrayResidualNetwork, build_array_residual_network
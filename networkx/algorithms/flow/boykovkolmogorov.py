@@ -15,6 +15,7 @@ from collections import deque
 from operator import itemgetter
 
 import networkx as nx
+from networkx.algorithms.flow.utils import ArrayResidualNetwork
 from networkx.algorithms.flow.utils import build_residual_network
 
 __all__ = ['boykov_kolmogorov']
@@ -52,9 +53,11 @@ def boykov_kolmogorov(G, s, t, capacity='capacity', residual=None,
         attribute is not present, the edge is considered to have
         infinite capacity. Default value: 'capacity'.
 
-    residual : NetworkX graph
+    residual : NetworkX graph or ArrayResidualNetwork
         Residual network on which the algorithm is to be executed. If None, a
-        new residual network is created. Default value: None.
+        new residual network is created. If it is an
+        :class:`ArrayResidualNetwork`, the algorithm runs on its arrays and
+        returns it instead of a DiGraph. Default value: None.
 
     value_only : bool
         If True compute only the value of the maximum flow. This parameter
@@ -67,7 +70,7 @@ def boykov_kolmogorov(G, s, t, capacity='capacity', residual=None,
 
     Returns
     -------
-    R : NetworkX DiGraph
+    R : NetworkX DiGraph or ArrayResidualNetwork
         Residual network after computing the maximum flow.
 
     Raises
@@ -181,6 +184,18 @@ def boykov_kolmogorov_impl(G, s, t, capacity, residual, cutoff):
     else:
         R = residual
 
+    if isinstance(R, ArrayResidualNetwork):
+        R.reset()
+        flow_value, trees = boykov_kolmogorov_array(R, R.index[s], R.index[t],
+                                                    cutoff)
+        nodes = R.nodes
+        head = R.head
+        R.graph['trees'] = tuple(
+            {nodes[v]: None if e is None else nodes[head[e]]
+             for v, e in tree.items()} for tree in trees)
+        R.graph['flow_value'] = flow_value
+        return R
+
     # Initialize/reset the residual network.
     # This is way too slow
     #nx.set_edge_attributes(R, 0, 'flow')
@@ -209,6 +224,10 @@ def boykov_kolmogorov_impl(G, s, t, capacity, residual, cutoff):
         """
         while active:
             u = active[0]
+            if u not in is_active:
+                # Removed by the adoption stage.
+                active.popleft()
+                continue
             if u in source_tree:
                 this_tree = source_tree
                 other_tree = target_tree
@@ -226,11 +245,13 @@ def boykov_kolmogorov_impl(G, s, t, capacity, residual, cutoff):
                         dist[v] = dist[u] + 1
                         timestamp[v] = timestamp[u]
                         active.append(v)
+                        is_active.add(v)
                     elif v in this_tree and _is_closer(u, v):
                         this_tree[v] = u
                         dist[v] = dist[u] + 1
                         timestamp[v] = timestamp[u]
             _ = active.popleft()
+            is_active.discard(u)
         return None, None
 
     def augment(u, v):
@@ -313,13 +334,13 @@ def boykov_kolmogorov_impl(G, s, t, capacity, residual, cutoff):
                         if n in tree)
                 for v, attr, d in sorted(nbrs, key=itemgetter(2)):
                     if attr['capacity'] - attr['flow'] > 0:
-                        if v not in active:
+                        if v not in is_active:
                             active.append(v)
+                            is_active.add(v)
                     if tree[v] == u:
                         tree[v] = None
                         orphans.appendleft(v)
-                if u in active:
-                    active.remove(u)
+                is_active.discard(u)
                 del tree[u]
 
     def _has_valid_root(n, tree):
@@ -348,6 +369,8 @@ def boykov_kolmogorov_impl(G, s, t, capacity, residual, cutoff):
     source_tree = {s: None}
     target_tree = {t: None}
     active = deque([s, t])
+    # The nodes in active; removed nodes are skipped when they come up.
+    is_active = {s, t}
     orphans = deque()
     flow_value = 0
     # data structures for the marking heuristic
@@ -375,3 +398,193 @@ def boykov_kolmogorov_impl(G, s, t, capacity, residual, cutoff):
     # Add the standard flow_value graph attribute.
     R.graph['flow_value'] = flow_value
     return R
+
+
+def boykov_kolmogorov_array(R, s, t, cutoff):
+    """Boykov-Kolmogorov algorithm on an array residual network, with `s`
+    and `t` given as node indices.
+
+    Returns the flow value and the source and target search trees. The
+    trees map each node to the arc from it to its parent, or to None for
+    roots.
+    """
+    INF = R.graph['inf']
+
+    if cutoff is None:
+        cutoff = INF
+
+    head = R.head
+    capacity = R.capacity
+    flow = R.flow
+    succ = R.succ
+
+    def grow():
+        """Bidirectional breadth-first search for the growth stage.
+
+           Returns a connecting arc, that is an arc with positive residual
+           capacity from a node of the source search tree to a node of the
+           target search tree.
+        """
+        while active:
+            u = active[0]
+            if u not in is_active:
+                # Removed by the adoption stage.
+                active.popleft()
+                continue
+            in_source = u in source_tree
+            if in_source:
+                this_tree = source_tree
+                other_tree = target_tree
+            else:
+                this_tree = target_tree
+                other_tree = source_tree
+            for e in succ[u]:
+                v = head[e]
+                # The arc from v back to u, and the arc along which the
+                # tree grows.
+                back = e ^ 1
+                a = e if in_source else back
+                if capacity[a] - flow[a] > 0:
+                    if v not in this_tree:
+                        if v in other_tree:
+                            return a
+                        this_tree[v] = back
+                        dist[v] = dist[u] + 1
+                        timestamp[v] = timestamp[u]
+                        active.append(v)
+                        is_active.add(v)
+                    elif _is_closer(u, v):
+                        this_tree[v] = back
+                        dist[v] = dist[u] + 1
+                        timestamp[v] = timestamp[u]
+            _ = active.popleft()
+            is_active.discard(u)
+        return None
+
+    def augment(c):
+        """Augmentation stage.
+
+           Reconstruct the path through the connecting arc c and determine
+           its residual capacity.
+        """
+        f = min(INF, capacity[c] - flow[c])
+        path = []
+        # Trace a path from the tail of c to s in source_tree.
+        w = head[c ^ 1]
+        while w != s:
+            e = source_tree[w] ^ 1
+            f = min(f, capacity[e] - flow[e])
+            path.append(e)
+            w = head[e ^ 1]
+        path.reverse()
+        path.append(c)
+        # Trace a path from the head of c to t in target_tree.
+        w = head[c]
+        while w != t:
+            e = target_tree[w]
+            f = min(f, capacity[e] - flow[e])
+            path.append(e)
+            w = head[e]
+        # Augment flow along the path and check for saturated edges.
+        these_orphans = []
+        for e in path:
+            flow[e] += f
+            flow[e ^ 1] -= f
+            if flow[e] == capacity[e]:
+                u = head[e ^ 1]
+                v = head[e]
+                if v in source_tree:
+                    source_tree[v] = None
+                    these_orphans.append(v)
+                if u in target_tree:
+                    target_tree[u] = None
+                    these_orphans.append(u)
+        orphans.extend(sorted(these_orphans, key=dist.get))
+        return f
+
+    def adopt():
+        """Adoption stage.
+
+           Reconstruct search trees by adopting or discarding orphans.
+        """
+        while orphans:
+            u = orphans.popleft()
+            in_source = u in source_tree
+            tree = source_tree if in_source else target_tree
+            nbrs = sorted((e for e in succ[u] if head[e] in tree),
+                          key=lambda e: dist[head[e]])
+            for e in nbrs:
+                a = e ^ 1 if in_source else e
+                if capacity[a] - flow[a] > 0:
+                    if _has_valid_root(head[e], tree):
+                        tree[u] = e
+                        dist[u] = dist[head[e]] + 1
+                        timestamp[u] = time
+                        break
+            else:
+                nbrs = sorted((e for e in succ[u] if head[e] in tree),
+                              key=lambda e: dist[head[e]])
+                for e in nbrs:
+                    v = head[e]
+                    a = e ^ 1 if in_source else e
+                    if capacity[a] - flow[a] > 0:
+                        if v not in is_active:
+                            active.append(v)
+                            is_active.add(v)
+                    p = tree[v]
+                    if p is not None and head[p] == u:
+                        tree[v] = None
+                        orphans.appendleft(v)
+                is_active.discard(u)
+                del tree[u]
+
+    def _has_valid_root(n, tree):
+        path = []
+        v = n
+        while v is not None:
+            path.append(v)
+            if v == s or v == t:
+                base_dist = 0
+                break
+            elif timestamp[v] == time:
+                base_dist = dist[v]
+                break
+            e = tree[v]
+            v = None if e is None else head[e]
+        else:
+            return False
+        length = len(path)
+        for i, u in enumerate(path, 1):
+            dist[u] = base_dist + length - i
+            timestamp[u] = time
+        return True
+
+    def _is_closer(u, v):
+        return timestamp[v] <= timestamp[u] and dist[v] > dist[u] + 1
+
+    source_tree = {s: None}
+    target_tree = {t: None}
+    active = deque([s, t])
+    # The nodes in active; removed nodes are skipped when they come up.
+    is_active = {s, t}
+    orphans = deque()
+    flow_value = 0
+    # data structures for the marking heuristic
+    time = 1
+    timestamp = {s: time, t: time}
+    dist = {s: 0, t: 0}
+    while flow_value < cutoff:
+        # Growth stage
+        c = grow()
+        if c is None:
+            break
+        time += 1
+        # Augmentation stage
+        flow_value += augment(c)
+        # Adoption stage
+        adopt()
+
+    if flow_value * 2 > INF:
+        raise nx.NetworkXUnbounded('Infinite capacity path, flow unbounded above.')
+
+    return flow_value, (source_tree, target_tree)
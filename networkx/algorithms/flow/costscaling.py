@@ -0,0 +1,387 @@
+# -*- coding: utf-8 -*-
+"""
+Cost scaling minimum cost flow algorithm.
+"""
+#    Copyright (C) 2019 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+
+__all__ = ['cost_scaling']
+
+from collections import deque
+from heapq import heapify, heappop, heappush
+import networkx as nx
+from networkx.utils import not_implemented_for
+
+
+@not_implemented_for('undirected')
+def cost_scaling(G, demand='demand', capacity='capacity', weight='weight',
+                 alpha=8):
+    r"""Find a minimum cost flow satisfying all demands in digraph G.
+
+    This is the cost scaling push-relabel algorithm of Goldberg and
+    Tarjan [1]_. Instead of moving flow along whole augmenting paths or
+    pivoting on a spanning tree, it keeps node potentials and pushes flow
+    locally along edges of negative reduced cost, while an optimality
+    tolerance $\epsilon$ is divided by `alpha` after each phase.
+
+    G is a digraph with edge costs and capacities and in which nodes
+    have demand, i.e., they want to send or receive some amount of
+    flow. A negative demand means that the node wants to send flow, a
+    positive demand means that the node want to receive flow. A flow on
+    the digraph G satisfies all demand if the net flow into each node
+    is equal to the demand of that node.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+        DiGraph or MultiDiGraph on which a minimum cost flow satisfying all
+        demands is to be found.
+
+    demand : string
+        Nodes of the graph G are expected to have an attribute demand
+        that indicates how much flow a node wants to send (negative
+        demand) or receive (positive demand). Note that the sum of the
+        demands should be 0 otherwise the problem in not feasible. If
+        this attribute is not present, a node is considered to have 0
+        demand. Default value: 'demand'.
+
+    capacity : string
+        Edges of the graph G are expected to have an attribute capacity
+        that indicates how much flow the edge can support. If this
+        attribute is not present, the edge is considered to have
+        infinite capacity. Default value: 'capacity'.
+
+    weight : string
+        Edges of the graph G are expected to have an attribute weight
+        that indicates the cost incurred by sending one unit of flow on
+        that edge. If not present, the weight is considered to be 0.
+        Default value: 'weight'.
+
+    alpha : integer greater than 1
+        Factor by which $\epsilon$ is divided between phases.
+        Default value: 8.
+
+    Returns
+    -------
+    flowCost : integer
+        Cost of a minimum cost flow satisfying all demands.
+
+    flowDict : dictionary
+        If G is a digraph, a dict-of-dicts keyed by nodes such that
+        flowDict[u][v] is the flow on edge (u, v).
+        If G is a MultiDiGraph, a dict-of-dicts-of-dicts keyed by nodes
+        so that flowDict[u][v][key] is the flow on edge (u, v, key).
+
+    Raises
+    ------
+    NetworkXError
+        This exception is raised if the input graph is not directed, if
+        it has no nodes, if a demand or a weight is infinite or if the
+        weight of an edge is not an integer.
+
+    NetworkXUnfeasible
+        This exception is raised in the following situations:
+
+            * The sum of the demands is not zero. Then, there is no
+              flow satisfying all demands.
+            * An edge has a negative capacity.
+            * There is no flow satisfying all demand.
+
+    NetworkXUnbounded
+        This exception is raised if the digraph G has a cycle of
+        negative cost and infinite capacity. Then, the cost of a flow
+        satisfying all demands is unbounded below.
+
+    Notes
+    -----
+    Edge weights must be integers, since the optimality of the flow
+    follows from $\epsilon$-optimality only for integer costs. Capacities
+    and demands may be floating point numbers, with the usual caveats
+    about roundoff errors.
+
+    The running time is $O(n^2 m \log(nC))$, where $C$ is the largest
+    absolute edge weight. The algorithm does not depend on the number of
+    pivots as :func:`network_simplex` does, and is often faster on large
+    transportation and assignment problems with many edges per node.
+
+    See also
+    --------
+    :meth:`network_simplex`, :meth:`capacity_scaling`
+
+    Examples
+    --------
+    A simple example of a min cost flow problem.
+
+    >>> import networkx as nx
+    >>> G = nx.DiGraph()
+    >>> G.add_node('a', demand=-5)
+    >>> G.add_node('d', demand=5)
+    >>> G.add_edge('a', 'b', weight=3, capacity=4)
+    >>> G.add_edge('a', 'c', weight=6, capacity=10)
+    >>> G.add_edge('b', 'd', weight=1, capacity=9)
+    >>> G.add_edge('c', 'd', weight=2, capacity=5)
+    >>> flowCost, flowDict = nx.cost_scaling(G)
+    >>> flowCost
+    24
+    >>> flowDict  # doctest: +SKIP
+    {'a': {'b': 4, 'c': 1}, 'b': {'d': 4}, 'c': {'d': 1}, 'd': {}}
+
+    References
+    ----------
+    .. [1] A. V. Goldberg, R. E. Tarjan.
+           Finding minimum-cost circulations by successive approximation.
+           Mathematics of Operations Research 15(3):430--466. 1990.
+    .. [2] A. V. Goldberg.
+           An efficient implementation of a scaling minimum-cost flow
+           algorithm. Journal of Algorithms 22(1):1--29. 1997.
+    """
+    if len(G) == 0:
+        raise nx.NetworkXError('graph has no nodes')
+    if alpha < 2:
+        raise nx.NetworkXError('alpha must be at least 2')
+
+    inf = float('inf')
+    N = list(G)
+    I = {u: i for i, u in enumerate(N)}
+    D = [G.nodes[u].get(demand, 0) for u in N]
+    for u, b in zip(N, D):
+        if abs(b) == inf:
+            raise nx.NetworkXError('node %r has infinite demand' % (u,))
+    if sum(D) != 0:
+        raise nx.NetworkXUnfeasible('total node demand is not zero')
+
+    multigraph = G.is_multigraph()
+    if multigraph:
+        edges = list(G.edges(keys=True, data=True))
+    else:
+        edges = list(G.edges(data=True))
+    flow_cost = 0
+    arc_edges = []  # positions in edges of the edges that become arcs
+    for k, e in enumerate(edges):
+        c = e[-1].get(weight, 0)
+        u = e[-1].get(capacity, inf)
+        if abs(c) == inf:
+            raise nx.NetworkXError('edge %r has infinite weight' % (e[:-1],))
+        if u < 0:
+            raise nx.NetworkXUnfeasible(
+                'edge %r has negative capacity' % (e[:-1],))
+        if e[0] == e[1]:
+            if c < 0:
+                if u == inf:
+                    raise nx.NetworkXUnbounded(
+                        'negative cycle with infinite capacity found')
+                flow_cost += c * u
+        elif u != 0:
+            if c != int(c):
+                raise nx.NetworkXError(
+                    'edge %r has non-integer weight' % (e[:-1],))
+            arc_edges.append(k)
+
+    _check_unboundedness(edges, arc_edges, capacity, weight)
+
+    # Arcs 2 * k and 2 * k + 1 are an edge and its reverse. The last node
+    # is an artificial root linked in both directions to every node by
+    # arcs so expensive that they carry flow only if the demands cannot be
+    # satisfied otherwise. Infinite capacities are replaced by a value
+    # that no minimum cost flow needs to exceed.
+    n = len(N) + 1
+    root = n - 1
+    finite = [edges[k][-1].get(capacity, inf) for k in arc_edges]
+    big = sum(u for u in finite if u != inf) + sum(abs(b) for b in D) + 1
+    costs = [int(edges[k][-1].get(weight, 0)) for k in arc_edges]
+    M = min(sum(map(abs, costs)), n * max(map(abs, costs), default=0)) + 1
+    scale = n + 1
+    head = []
+    r = []
+    cost = []
+    adj = [[] for u in range(n)]
+
+    def add_arc(u, v, cap, c):
+        a = len(head)
+        head.extend((v, u))
+        r.extend((cap, 0))
+        # Costs are scaled so that 1-optimal flows are optimal.
+        cost.extend((c * scale, -c * scale))
+        adj[u].append(a)
+        adj[v].append(a + 1)
+
+    for k, u, c in zip(arc_edges, finite, costs):
+        e = edges[k]
+        add_arc(I[e[0]], I[e[1]], big if u == inf else u, c)
+    num_arcs = len(head)
+    for u in range(root):
+        add_arc(u, root, big, M)
+        add_arc(root, u, big, M)
+
+    excess = [-b for b in D]
+    excess.append(0)
+    p = [0] * n
+    eps = max(max(costs, default=0), -min(costs, default=0), 1) * scale
+    _refine_all(head, r, cost, adj, excess, p, eps, alpha)
+
+    for a in range(num_arcs, len(head), 2):
+        if r[a + 1] != 0:
+            raise nx.NetworkXUnfeasible('no flow satisfies all node demands')
+
+    # Flow cost calculation and flow dict construction
+    flows = [0] * len(edges)
+    for i, k in enumerate(arc_edges):
+        f = r[2 * i + 1]
+        flows[k] = f
+        flow_cost += f * costs[i]
+    flow_dict = {u: {} for u in N}
+    for k, e in enumerate(edges):
+        f = flows[k]
+        if e[0] == e[1] and e[-1].get(weight, 0) < 0:
+            f = e[-1][capacity]
+        if multigraph:
+            flow_dict[e[0]].setdefault(e[1], {})[e[2]] = f
+        else:
+            flow_dict[e[0]][e[1]] = f
+    return flow_cost, flow_dict
+
+
+def _check_unboundedness(edges, arc_edges, capacity, weight):
+    """Raise NetworkXUnbounded if the edges of infinite capacity form a
+    cycle of negative cost.
+    """
+    inf = float('inf')
+    H = nx.DiGraph()
+    for k in arc_edges:
+        u, v, d = edges[k][0], edges[k][1], edges[k][-1]
+        if d.get(capacity, inf) == inf:
+            c = d.get(weight, 0)
+            if v not in H._adj.get(u, ()) or c < H[u][v]['weight']:
+                H.add_edge(u, v, weight=c)
+    if H and nx.negative_edge_cycle(H):
+        raise nx.NetworkXUnbounded(
+            'negative cycle with infinite capacity found')
+
+
+def _global_update(head, r, cost, adj, excess, p, eps):
+    """Lower the potentials by eps times the distance of each node to the
+    nodes with a deficit, which keeps the flow eps-optimal and makes many
+    relabelings unnecessary.
+
+    Residual arcs are given the length ``floor(c_p / eps) + 1``, where
+    ``c_p`` is their reduced cost, and the distances are found by a
+    backward search from the nodes with a deficit. The search stops when
+    all the nodes with an excess are reached, and the nodes that are not
+    reached are lowered by the largest distance found.
+    """
+    n = len(adj)
+    dist = [None] * n
+    seen = [None] * n  # tentative distances
+    heap = [(0, v) for v in range(n) if excess[v] < 0]
+    heapify(heap)
+    remaining = sum(1 for v in range(n) if excess[v] > 0)
+    d_max = 0
+    while heap and remaining:
+        d_v, v = heappop(heap)
+        if dist[v] is not None:
+            continue
+        dist[v] = d_v
+        d_max = d_v
+        if excess[v] > 0:
+            remaining -= 1
+        p_v = p[v]
+        for b in adj[v]:
+            a = b ^ 1
+            if r[a] > 0:
+                u = head[b]
+                if dist[u] is None:
+                    d_u = d_v + (cost[a] + p[u] - p_v) // eps + 1
+                    if seen[u] is None or d_u < seen[u]:
+                        seen[u] = d_u
+                        heappush(heap, (d_u, u))
+    for v in range(n):
+        d_v = dist[v]
+        p[v] -= (d_max if d_v is None else d_v) * eps
+
+
+def _refine_all(head, r, cost, adj, excess, p, eps, alpha):
+    """Turn the pseudoflow given by the residual capacities `r`, which is
+    `eps`-optimal for the potentials `p`, into a 1-optimal flow, dividing
+    the tolerance by `alpha` between phases.
+    """
+    n = len(adj)
+    while True:
+        eps = max(eps // alpha, 1)
+        # Saturate the arcs of negative reduced cost, which makes the
+        # pseudoflow 0-optimal and leaves excesses and deficits behind.
+        for u in range(n):
+            p_u = p[u]
+            for a in adj[u]:
+                if r[a] > 0:
+                    v = head[a]
+                    if cost[a] + p_u - p[v] < 0:
+                        f = r[a]
+                        r[a] = 0
+                        r[a ^ 1] += f
+                        excess[u] -= f
+                        excess[v] += f
+        # Push the excesses along admissible arcs, relabeling the nodes
+        # that have none, until the pseudoflow is an eps-optimal flow.
+        # The potentials are also updated globally from time to time.
+        _global_update(head, r, cost, adj, excess, p, eps)
+        relabels = 0
+        active = deque(u for u in range(n) if excess[u] > 0)
+        current = [0] * n
+        while active:
+            if relabels > n:
+                _global_update(head, r, cost, adj, excess, p, eps)
+                relabels = 0
+                current = [0] * n
+            u = active.popleft()
+            if excess[u] <= 0:
+                continue
+            arcs = adj[u]
+            deg = len(arcs)
+            i = current[u]
+            p_u = p[u]
+            ex = excess[u]
+            # The best relabeling is found while scanning from the first arc.
+            best = None if i == 0 else False
+            while ex > 0:
+                if i == deg:
+                    if best is False:
+                        best = None
+                        for a in arcs:
+                            if r[a] > 0:
+                                t = p[head[a]] - cost[a]
+                                if best is None or t > best:
+                                    best = t
+                    # Relabel u so that its best residual arc becomes
+                    # admissible with a reduced cost of -eps.
+                    p_u = best - eps
+                    relabels += 1
+                    i = 0
+                    best = None
+                    continue
+                a = arcs[i]
+                if r[a] > 0:
+                    v = head[a]
+                    t = p[v] - cost[a]
+                    if p_u < t:
+                        f = r[a] if r[a] < ex else ex
+                        r[a] -= f
+                        r[a ^ 1] += f
+                        ex -= f
+                        ex_v = excess[v]
+                        if ex_v <= 0 < ex_v + f:
+                            active.append(v)
+                        excess[v] = ex_v + f
+                        if r[a] > 0:
+                            continue
+                    elif best is not False and (best is None or t > best):
+                        best = t
+                i += 1
+            p[u] = p_u
+            excess[u] = 0
+            current[u] = i
+        if eps == 1:
+            return
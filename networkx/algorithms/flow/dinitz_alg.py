@@ -14,6 +14,7 @@ Dinitz' algorithm for maximum flow problems.
 from collections import deque
 
 import networkx as nx
+from networkx.algorithms.flow.utils import ArrayResidualNetwork
 from networkx.algorithms.flow.utils import build_residual_network
 from networkx.utils import pairwise
 
@@ -50,9 +51,11 @@ def dinitz(G, s, t, capacity='capacity', residual=None, value_only=False, cutoff
         attribute is not present, the edge is considered to have
         infinite capacity. Default value: 'capacity'.
 
-    residual : NetworkX graph
+    residual : NetworkX graph or ArrayResidualNetwork
         Residual network on which the algorithm is to be executed. If None, a
-        new residual network is created. Default value: None.
+        new residual network is created. If it is an
+        :class:`ArrayResidualNetwork`, the algorithm runs on its arrays and
+        returns it instead of a DiGraph. Default value: None.
 
     value_only : bool
         If True compute only the value of the maximum flow. This parameter
@@ -65,7 +68,7 @@ def dinitz(G, s, t, capacity='capacity', residual=None, value_only=False, cutoff
 
     Returns
     -------
-    R : NetworkX DiGraph
+    R : NetworkX DiGraph or ArrayResidualNetwork
         Residual network after computing the maximum flow.
 
     Raises
@@ -161,6 +164,12 @@ def dinitz_impl(G, s, t, capacity, residual, cutoff):
     else:
         R = residual
 
+    if isinstance(R, ArrayResidualNetwork):
+        R.reset()
+        R.graph['flow_value'] = dinitz_array(R, R.index[s], R.index[t],
+                                             cutoff)
+        return R
+
     # Initialize/reset the residual network.
     for u in R:
         for e in R[u].values():
@@ -221,3 +230,63 @@ def dinitz_impl(G, s, t, capacity, residual, cutoff):
 
     R.graph['flow_value'] = flow_value
     return R
+
+
+def dinitz_array(R, s, t, cutoff):
+    """Dinitz' algorithm on an array residual network, with `s` and `t`
+    given as node indices. Returns the flow value.
+    """
+    INF = R.graph['inf']
+
+    if cutoff is None:
+        cutoff = INF
+
+    head = R.head
+    capacity = R.capacity
+    flow = R.flow
+    succ = R.succ
+
+    def breath_first_search():
+        # parents[v] is the arc through which v was reached.
+        parents = {}
+        queue = deque([s])
+        while queue:
+            if t in parents:
+                break
+            u = queue.popleft()
+            for e in succ[u]:
+                v = head[e]
+                if v not in parents and capacity[e] - flow[e] > 0:
+                    parents[v] = e
+                    queue.append(v)
+        return parents
+
+    def depth_first_search(parents):
+        """Build a path using DFS starting from the sink"""
+        path = []
+        u = t
+        f = INF
+        while u != s:
+            e = parents[u]
+            path.append(e)
+            f = min(f, capacity[e] - flow[e])
+            u = head[e ^ 1]
+        # Augment the flow along the path found
+        if f > 0:
+            for e in path:
+                flow[e] += f
+                flow[e ^ 1] -= f
+        return f
+
+    flow_value = 0
+    while flow_value < cutoff:
+        parents = breath_first_search()
+        if t not in parents:
+            break
+        this_flow = depth_first_search(parents)
+        if this_flow * 2 > INF:
+            raise nx.NetworkXUnbounded(
+                'Infinite capacity path, flow unbounded above.')
+        flow_value += this_flow
+
+    return flow_value
@@ -101,6 +101,96 @@ def edmonds_karp_core(R, s, t, cutoff):
     return flow_value
 
 
+def edmonds_karp_array_core(R, s, t, cutoff):
+    """Implementation of the Edmonds-Karp algorithm on an array residual
+    network, with `s` and `t` given as node indices.
+    """
+    head = R.head
+    capacity = R.capacity
+    flow = R.flow
+    succ = R.succ
+
+    inf = R.graph['inf']
+
+    def augment(path):
+        """Augment flow along a path of arcs from s to t.
+        """
+        # Determine the path residual capacity.
+        f = inf
+        for e in path:
+            f = min(f, capacity[e] - flow[e])
+        if f * 2 > inf:
+            raise nx.NetworkXUnbounded(
+                'Infinite capacity path, flow unbounded above.')
+        # Augment flow along the path.
+        for e in path:
+            flow[e] += f
+            flow[e ^ 1] -= f
+        return f
+
+    def bidirectional_bfs():
+        """Bidirectional breadth-first search for an augmenting path.
+
+        pred[v] is the arc into v in the search tree from s, and succ[v]
+        the arc out of v in the search tree into t.
+        """
+        pred = {s: None}
+        q_s = [s]
+        succ_t = {t: None}
+        q_t = [t]
+        while True:
+            q = []
+            if len(q_s) <= len(q_t):
+                for u in q_s:
+                    for e in succ[u]:
+                        v = head[e]
+                        if v not in pred and flow[e] < capacity[e]:
+                            pred[v] = e
+                            if v in succ_t:
+                                return v, pred, succ_t
+                            q.append(v)
+                if not q:
+                    return None, None, None
+                q_s = q
+            else:
+                for u in q_t:
+                    for e in succ[u]:
+                        v = head[e]
+                        e ^= 1
+                        if v not in succ_t and flow[e] < capacity[e]:
+                            succ_t[v] = e
+                            if v in pred:
+                                return v, pred, succ_t
+                            q.append(v)
+                if not q:
+                    return None, None, None
+                q_t = q
+
+    # Look for shortest augmenting paths using breadth-first search.
+    flow_value = 0
+    while flow_value < cutoff:
+        v, pred, succ_t = bidirectional_bfs()
+        if pred is None:
+            break
+        path = []
+        # Trace a path from s to v.
+        u = v
+        while u != s:
+            e = pred[u]
+            path.append(e)
+            u = head[e ^ 1]
+        path.reverse()
+        # Trace a path from v to t.
+        u = v
+        while u != t:
+            e = succ_t[u]
+            path.append(e)
+            u = head[e]
+        flow_value += augment(path)
+
+    return flow_value
+
+
 def edmonds_karp_impl(G, s, t, capacity, residual, cutoff):
     """Implementation of the Edmonds-Karp algorithm.
     """
@@ -116,13 +206,20 @@ def edmonds_karp_impl(G, s, t, capacity, residual, cutoff):
     else:
         R = residual
 
+    if cutoff is None:
+        cutoff = float('inf')
+
+    if isinstance(R, ArrayResidualNetwork):
+        R.reset()
+        R.graph['flow_value'] = edmonds_karp_array_core(
+            R, R.index[s], R.index[t], cutoff)
+        return R
+
     # Initialize/reset the residual network.
     for u in R:
         for e in R[u].values():
             e['flow'] = 0
 
-    if cutoff is None:
-        cutoff = float('inf')
     R.graph['flow_value'] = edmonds_karp_core(R, s, t, cutoff)
 
     return R
@@ -159,9 +256,11 @@ def edmonds_karp(G, s, t, capacity='capacity', residual=None, value_only=False,
         attribute is not present, the edge is considered to have
         infinite capacity. Default value: 'capacity'.
 
-    residual : NetworkX graph
+    residual : NetworkX graph or ArrayResidualNetwork
         Residual network on which the algorithm is to be executed. If None, a
-        new residual network is created. Default value: None.
+        new residual network is created. If it is an
+        :class:`ArrayResidualNetwork`, the algorithm runs on its arrays and
+        returns it instead of a DiGraph. Default value: None.
 
     value_only : bool
         If True compute only the value of the maximum flow. This parameter
@@ -174,7 +273,7 @@ def edmonds_karp(G, s, t, capacity='capacity', residual=None, value_only=False,
 
     Returns
     -------
-    R : NetworkX DiGraph
+    R : NetworkX DiGraph or ArrayResidualNetwork
         Residual network after computing the maximum flow.
 
     Raises
@@ -16,10 +16,12 @@ import networkx as nx
 from networkx.utils import not_implemented_for
 
 from .edmondskarp import edmonds_karp
-from .utils import build_residual_network
+from .maxflow import FlowSession
 
 default_flow_func = edmonds_karp
 
+INF = float('inf')
+
 __all__ = ['gomory_hu_tree']
 
 
@@ -129,6 +131,16 @@ def gomory_hu_tree(G, capacity='capacity', flow_func=None):
     Comory-Hu trees, which does not require node contractions and has
     the same computational complexity than the original method.
 
+    Nodes with a single neighbor are attached to it directly, repeatedly,
+    and the cuts among the remaining nodes are all computed on a single
+    residual network, which is reset between computations instead of
+    being built again (see :class:`FlowSession`). A cut that separates
+    one of its endpoints alone is taken without any flow computation
+    when the weighted degree of that endpoint is matched by the capacity
+    of the edge between the endpoints and of the paths through their
+    common neighbors, which is common in sparse graphs with many low
+    degree nodes.
+
     See also
     --------
     :func:`minimum_cut`
@@ -147,34 +159,96 @@ def gomory_hu_tree(G, capacity='capacity', flow_func=None):
         msg = 'Empty Graph does not have a Gomory-Hu tree representation'
         raise nx.NetworkXError(msg)
 
-    # Start the tree as a star graph with an arbitrary node at the center
     tree = {}
     labels = {}
-    iter_nodes = iter(G)
-    root = next(iter_nodes)
-    for n in iter_nodes:
-        tree[n] = root
+
+    # A node with a single neighbor hangs from it in the tree, with the
+    # capacity of their edge as weight, and can be removed from the graph
+    # before computing any cut. Removals are repeated while possible.
+    nbr_count = {u: len(nbrs) - (u in nbrs) for u, nbrs in G.adj.items()}
+    stack = [u for u, d in nbr_count.items() if d == 1]
+    while stack and len(tree) < len(G) - 1:
+        u = stack.pop()
+        if nbr_count[u] != 1:
+            continue
+        v = next(w for w in G[u] if w != u and w not in tree)
+        cut_value = G[u][v].get(capacity, INF)
+        if cut_value == INF:
+            continue
+        tree[u] = v
+        labels[(u, v)] = cut_value
+        nbr_count[u] = 0
+        nbr_count[v] -= 1
+        if nbr_count[v] == 1:
+            stack.append(v)
+    H = G.subgraph(u for u in G if u not in tree) if tree else G
+
+    # Weighted degrees are upper bounds for the cuts around each node.
+    degree = {u: sum(attr.get(capacity, INF) for v, attr in nbrs.items()
+                     if v != u)
+              for u, nbrs in H.adj.items()}
+
+    # Start the tree of the remaining nodes as a star graph with a node of
+    # maximum degree at the center, so that many cuts are between neighbors.
+    core_tree = {}
+    root = max(H, key=H.degree)
+    for n in H:
+        if n != root:
+            core_tree[n] = root
 
     # Reuse residual network
-    R = build_residual_network(G, capacity)
+    session = FlowSession(H, capacity, flow_func)
 
-    # For all the leaves in the star graph tree (that is n-1 nodes).
-    for source in tree:
+    # For all the leaves in the star graph tree.
+    for source in core_tree:
         # Find neighbor in the tree
-        target = tree[source]
-        # compute minimum cut
-        cut_value, partition = nx.minimum_cut(G, source, target,
-                                              capacity=capacity, flow_func=flow_func,
-                                              residual=R)
+        target = core_tree[source]
+        # compute minimum cut, unless a trivial cut is known to be minimum
+        cut = _trivial_cut(H, source, target, capacity, degree)
+        if cut is None:
+            cut = session.minimum_cut(source, target)
+        cut_value, partition = cut
         labels[(source, target)] = cut_value
         # Update the tree
         # Source will always be in partition[0] and target in partition[1]
         for node in partition[0]:
-            if node != source and node in tree and tree[node] == target:
-                tree[node] = source
+            if (node != source and node in core_tree and
+                    core_tree[node] == target):
+                core_tree[node] = source
                 labels[(node, source)] = labels.get((node, target), cut_value)
+    tree.update(core_tree)
     # Build the tree
     T = nx.Graph()
     T.add_nodes_from(G)
     T.add_weighted_edges_from(((u, v, labels[(u, v)]) for u, v in tree.items()))
     return T
+
+
+def _trivial_cut(G, s, t, capacity, degree):
+    """Returns the minimum s-t cut separating s or t alone, if it is
+    certified by a lower bound on the flow, and None otherwise.
+
+    The weighted degree of s and of t bound the maximum flow from above.
+    The edge between s and t and the paths through their common neighbors
+    are edge disjoint, so together they bound the flow from below. When
+    both bounds meet, the cut around the endpoint of smaller degree is a
+    minimum cut and no flow computation is needed.
+    """
+    bound = min(degree[s], degree[t])
+    if bound == INF:
+        return None
+    s_nbrs = G._adj[s]
+    t_nbrs = G._adj[t]
+    flow = s_nbrs[t].get(capacity, INF) if t in s_nbrs else 0
+    if len(s_nbrs) > len(t_nbrs):
+        s_nbrs, t_nbrs = t_nbrs, s_nbrs
+    for w, attr in s_nbrs.items():
+        if flow >= bound:
+            break
+        if w in t_nbrs and w != s and w != t:
+            flow += min(attr.get(capacity, INF), t_nbrs[w].get(capacity, INF))
+    if flow < bound:
+        return None
+    if degree[s] <= degree[t]:
+        return bound, ({s}, set(G) - {s})
+    return bound, (set(G) - {t}, {t})
@@ -9,7 +9,10 @@ from .dinitz_alg import dinitz
 from .edmondskarp import edmonds_karp
 from .preflowpush import preflow_push
 from .shortestaugmentingpath import shortest_augmenting_path
+from .utils import ArrayResidualNetwork
+from .utils import build_array_residual_network
 from .utils import build_flow_dict
+from .utils import build_residual_network
 # Define the default flow function for computing maximum flow.
 default_flow_func = preflow_push
 # Functions that don't support cutoff for minimum cut computations.
@@ -24,7 +27,16 @@ flow_funcs = [
 __all__ = ['maximum_flow',
            'maximum_flow_value',
            'minimum_cut',
-           'minimum_cut_value']
+           'minimum_cut_value',
+           'FlowSession']
+
+
+def _use_array_residual(flowG, capacity, flow_func, kwargs):
+    """Run the flow functions of this package on an array residual network
+    unless the caller passed a residual network.
+    """
+    if flow_func in flow_funcs and kwargs.get('residual') is None:
+        kwargs['residual'] = build_array_residual_network(flowG, capacity)
 
 
 def maximum_flow(flowG, _s, _t,
@@ -122,6 +134,10 @@ def maximum_flow(flowG, _s, _t,
 
     Specific algorithms may store extra data in :samp:`R`.
 
+    The flow functions of this package are run on an
+    :class:`ArrayResidualNetwork`, which stores the same residual network
+    in integer-indexed arrays, unless a `residual` is passed in `kwargs`.
+
     The function should supports an optional boolean parameter value_only. When
     True, it can optionally terminate the algorithm as soon as the maximum flow
     value and the minimum cut can be determined.
@@ -166,6 +182,7 @@ def maximum_flow(flowG, _s, _t,
     if not callable(flow_func):
         raise nx.NetworkXError("flow_func has to be callable.")
 
+    _use_array_residual(flowG, capacity, flow_func, kwargs)
     R = flow_func(flowG, _s, _t, capacity=capacity, value_only=False, **kwargs)
     flow_dict = build_flow_dict(flowG, R)
 
@@ -263,6 +280,10 @@ def maximum_flow_value(flowG, _s, _t,
 
     Specific algorithms may store extra data in :samp:`R`.
 
+    The flow functions of this package are run on an
+    :class:`ArrayResidualNetwork`, which stores the same residual network
+    in integer-indexed arrays, unless a `residual` is passed in `kwargs`.
+
     The function should supports an optional boolean parameter value_only. When
     True, it can optionally terminate the algorithm as soon as the maximum flow
     value and the minimum cut can be determined.
@@ -305,6 +326,7 @@ def maximum_flow_value(flowG, _s, _t,
     if not callable(flow_func):
         raise nx.NetworkXError("flow_func has to be callable.")
 
+    _use_array_residual(flowG, capacity, flow_func, kwargs)
     R = flow_func(flowG, _s, _t, capacity=capacity, value_only=True, **kwargs)
 
     return R.graph['flow_value']
@@ -401,6 +423,10 @@ def minimum_cut(flowG, _s, _t,
 
     Specific algorithms may store extra data in :samp:`R`.
 
+    The flow functions of this package are run on an
+    :class:`ArrayResidualNetwork`, which stores the same residual network
+    in integer-indexed arrays, unless a `residual` is passed in `kwargs`.
+
     The function should supports an optional boolean parameter value_only. When
     True, it can optionally terminate the algorithm as soon as the maximum flow
     value and the minimum cut can be determined.
@@ -457,7 +483,12 @@ def minimum_cut(flowG, _s, _t,
     if kwargs.get('cutoff') is not None and flow_func in flow_funcs:
         raise nx.NetworkXError("cutoff should not be specified.")
 
+    _use_array_residual(flowG, capacity, flow_func, kwargs)
     R = flow_func(flowG, _s, _t, capacity=capacity, value_only=True, **kwargs)
+    if isinstance(R, ArrayResidualNetwork):
+        nodes = R.nodes
+        S = {nodes[i] for i in R.source_side(R.index[_t])}
+        return (R.graph['flow_value'], (S, set(flowG) - S))
     # Remove saturated edges from the residual network
     cutset = [(u, v, d) for u, v, d in R.edges(data=True)
               if d['flow'] == d['capacity']]
@@ -563,6 +594,10 @@ def minimum_cut_value(flowG, _s, _t,
 
     Specific algorithms may store extra data in :samp:`R`.
 
+    The flow functions of this package are run on an
+    :class:`ArrayResidualNetwork`, which stores the same residual network
+    in integer-indexed arrays, unless a `residual` is passed in `kwargs`.
+
     The function should supports an optional boolean parameter value_only. When
     True, it can optionally terminate the algorithm as soon as the maximum flow
     value and the minimum cut can be determined.
@@ -608,6 +643,220 @@ def minimum_cut_value(flowG, _s, _t,
     if kwargs.get('cutoff') is not None and flow_func in flow_funcs:
         raise nx.NetworkXError("cutoff should not be specified.")
 
+    _use_array_residual(flowG, capacity, flow_func, kwargs)
     R = flow_func(flowG, _s, _t, capacity=capacity, value_only=True, **kwargs)
 
     return R.graph['flow_value']
+
+
+class FlowSession(object):
+    """Repeated maximum flow and minimum cut queries on one network.
+
+    The residual network of `G` is built once, on construction, and every
+    query runs `flow_func` on it. Each run starts by resetting the flow,
+    which for the flow functions of this package means allocating a new
+    list of zeros for the :class:`ArrayResidualNetwork` they run on. This
+    avoids rebuilding the residual network for each of the many (s, t)
+    pairs that algorithms such as :func:`gomory_hu_tree` or
+    :func:`all_pairs_node_connectivity` query.
+
+    Capacities are changed with :meth:`set_capacity`, which updates both
+    `G` and the residual network.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+        Edges of the graph are expected to have an attribute called
+        'capacity'. If this attribute is not present, the edge is
+        considered to have infinite capacity.
+
+    capacity : string
+        Name of the edge attribute holding the capacity. Default value:
+        'capacity'.
+
+    flow_func : function
+        A function for computing the maximum flow, as for
+        :func:`maximum_flow`. It must accept a `residual` argument. If
+        None, the default maximum flow function is used. Default value:
+        None.
+
+    kwargs : Any other keyword parameter is passed to `flow_func` at each
+        query.
+
+    Attributes
+    ----------
+    graph : NetworkX graph
+        The graph `G`.
+
+    residual : ArrayResidualNetwork or NetworkX DiGraph
+        The residual network shared by the queries. It is an
+        :class:`ArrayResidualNetwork` for the flow functions of this
+        package and a DiGraph otherwise.
+
+    Raises
+    ------
+    NetworkXError
+        If `G` is a multigraph, if `flow_func` is not callable, or if
+        `kwargs` are given without a `flow_func`.
+
+    Examples
+    --------
+    >>> G = nx.DiGraph()
+    >>> G.add_edge('x', 'a', capacity=3.0)
+    >>> G.add_edge('x', 'b', capacity=1.0)
+    >>> G.add_edge('a', 'c', capacity=3.0)
+    >>> G.add_edge('b', 'c', capacity=5.0)
+    >>> G.add_edge('c', 'y', capacity=2.0)
+    >>> session = nx.FlowSession(G)
+    >>> session.maximum_flow_values([('x', 'y'), ('x', 'c'), ('a', 'y')])
+    {('x', 'y'): 2.0, ('x', 'c'): 4.0, ('a', 'y'): 2.0}
+    >>> session.set_capacity('c', 'y', 1.0)
+    >>> session.minimum_cut_value('x', 'y')
+    1.0
+    >>> G['c']['y']['capacity']
+    1.0
+
+    See Also
+    --------
+    maximum_flow
+    minimum_cut
+    build_array_residual_network
+
+    """
+
+    def __init__(self, G, capacity='capacity', flow_func=None, **kwargs):
+        if flow_func is None:
+            if kwargs:
+                raise nx.NetworkXError("You have to explicitly set a flow_func"
+                                       " if you need to pass parameters via"
+                                       " kwargs.")
+            flow_func = default_flow_func
+        if not callable(flow_func):
+            raise nx.NetworkXError("flow_func has to be callable.")
+        self.graph = G
+        self._capacity = capacity
+        self._flow_func = flow_func
+        self._kwargs = kwargs
+        self._build()
+
+    def _build(self):
+        G = self.graph
+        capacity = self._capacity
+        if self._flow_func in flow_funcs:
+            self.residual = build_array_residual_network(G, capacity)
+        else:
+            self.residual = build_residual_network(G, capacity)
+        inf = float('inf')
+        # The finite capacity that the value standing for infinity was
+        # computed from.
+        self._total = sum(c for c in (attr.get(capacity, inf)
+                                      for u, v, attr in G.edges(data=True)
+                                      if u != v)
+                          if 0 < c < inf)
+        self._stale = False
+
+    def _query_kwargs(self, kwargs):
+        if self._stale:
+            self._build()
+        query = dict(self._kwargs)
+        query.update(kwargs)
+        query['residual'] = self.residual
+        return query
+
+    def maximum_flow(self, s, t, **kwargs):
+        """Returns the value and a dictionary of a maximum s-t flow.
+
+        See :func:`maximum_flow`. `kwargs` are passed to the flow
+        function for this query only.
+        """
+        return maximum_flow(self.graph, s, t, capacity=self._capacity,
+                            flow_func=self._flow_func,
+                            **self._query_kwargs(kwargs))
+
+    def maximum_flow_value(self, s, t, **kwargs):
+        """Returns the value of a maximum s-t flow.
+
+        See :func:`maximum_flow_value`.
+        """
+        return maximum_flow_value(self.graph, s, t, capacity=self._capacity,
+                                  flow_func=self._flow_func,
+                                  **self._query_kwargs(kwargs))
+
+    def minimum_cut(self, s, t, **kwargs):
+        """Returns the value and the node partition of a minimum s-t cut.
+
+        See :func:`minimum_cut`.
+        """
+        return minimum_cut(self.graph, s, t, capacity=self._capacity,
+                           flow_func=self._flow_func,
+                           **self._query_kwargs(kwargs))
+
+    def minimum_cut_value(self, s, t, **kwargs):
+        """Returns the value of a minimum s-t cut.
+
+        See :func:`minimum_cut_value`.
+        """
+        return minimum_cut_value(self.graph, s, t, capacity=self._capacity,
+                                 flow_func=self._flow_func,
+                                 **self._query_kwargs(kwargs))
+
+    def maximum_flow_values(self, pairs, **kwargs):
+        """Returns a dictionary keyed by (s, t) pairs to maximum flow values.
+
+        All pairs in the iterable `pairs` are computed on the same
+        residual network.
+        """
+        return {(s, t): self.maximum_flow_value(s, t, **kwargs)
+                for s, t in pairs}
+
+    def set_capacity(self, u, v, value):
+        """Set the capacity of the edge `(u, v)` to `value`.
+
+        The capacity attribute of the edge in `G` is updated, and so are
+        the residual capacities of its arcs. If the new capacity is not
+        compatible with the residual network, for instance because the
+        edge had no arc in it, the residual network is rebuilt before the
+        next query.
+
+        Raises
+        ------
+        NetworkXError
+            If the edge is not in `G`.
+        """
+        G = self.graph
+        if not G.has_edge(u, v):
+            raise nx.NetworkXError('The edge %s-%s is not in the graph.'
+                                   % (u, v))
+        inf = float('inf')
+        attr = G[u][v]
+        old = attr.get(self._capacity, inf)
+        attr[self._capacity] = value
+        if self._stale or u == v:
+            return
+        self._total += ((value if 0 < value < inf else 0) -
+                        (old if 0 < old < inf else 0))
+        R = self.residual
+        r = min(max(value, 0), R.graph['inf'])
+        if 3 * self._total > R.graph['inf']:
+            # The value standing for infinity is no longer large enough.
+            self._stale = True
+            return
+        ends = [(u, v)] if G.is_directed() else [(u, v), (v, u)]
+        if isinstance(R, ArrayResidualNetwork):
+            index = R.index
+            head = R.head
+            arcs = []
+            for x, y in ends:
+                j = index[y]
+                arcs.extend(e for e in R.succ[index[x]] if head[e] == j)
+            if len(arcs) < len(ends):
+                self._stale = True
+                return
+            for e in arcs:
+                R.capacity[e] = r
+        else:
+            if not R.has_edge(u, v):
+                self._stale = True
+                return
+            for x, y in ends:
+                R[x][y]['capacity'] = r
@@ -18,7 +18,7 @@ import networkx as nx
 
 
 def min_cost_flow_cost(G, demand='demand', capacity='capacity',
-                       weight='weight'):
+                       weight='weight', flow_func=None):
     r"""Find the cost of a minimum cost flow satisfying all demands in digraph G.
 
     G is a digraph with edge costs and capacities and in which nodes
@@ -54,6 +54,12 @@ def min_cost_flow_cost(G, demand='demand', capacity='capacity',
         that edge. If not present, the weight is considered to be 0.
         Default value: 'weight'.
 
+    flow_func : function
+        Function that computes a minimum cost flow, with the same
+        signature and return value as :func:`network_simplex`, for
+        instance :func:`capacity_scaling` or :func:`cost_scaling`. If
+        None, :func:`network_simplex` is used. Default value: None.
+
     Returns
     -------
     flowCost : integer, float
@@ -105,12 +111,13 @@ def min_cost_flow_cost(G, demand='demand', capacity='capacity',
     >>> flowCost
     24
     """
-    return nx.network_simplex(G, demand=demand, capacity=capacity,
-                              weight=weight)[0]
+    if flow_func is None:
+        flow_func = nx.network_simplex
+    return flow_func(G, demand=demand, capacity=capacity, weight=weight)[0]
 
 
 def min_cost_flow(G, demand='demand', capacity='capacity',
-                  weight='weight'):
+                  weight='weight', flow_func=None):
     r"""Returns a minimum cost flow satisfying all demands in digraph G.
 
     G is a digraph with edge costs and capacities and in which nodes
@@ -146,6 +153,12 @@ def min_cost_flow(G, demand='demand', capacity='capacity',
         that edge. If not present, the weight is considered to be 0.
         Default value: 'weight'.
 
+    flow_func : function
+        Function that computes a minimum cost flow, with the same
+        signature and return value as :func:`network_simplex`, for
+        instance :func:`capacity_scaling` or :func:`cost_scaling`. If
+        None, :func:`network_simplex` is used. Default value: None.
+
     Returns
     -------
     flowDict : dictionary
@@ -196,8 +209,9 @@ def min_cost_flow(G, demand='demand', capacity='capacity',
     >>> G.add_edge('c', 'd', weight = 2, capacity = 5)
     >>> flowDict = nx.min_cost_flow(G)
     """
-    return nx.network_simplex(G, demand=demand, capacity=capacity,
-                              weight=weight)[1]
+    if flow_func is None:
+        flow_func = nx.network_simplex
+    return flow_func(G, demand=demand, capacity=capacity, weight=weight)[1]
 
 
 def cost_of_flow(G, flowDict, weight='weight'):
@@ -245,7 +259,8 @@ def cost_of_flow(G, flowDict, weight='weight'):
                 for u, v, d in G.edges(data=True)))
 
 
-def max_flow_min_cost(G, s, t, capacity='capacity', weight='weight'):
+def max_flow_min_cost(G, s, t, capacity='capacity', weight='weight',
+                      flow_func=None):
     """Returns a maximum (s, t)-flow of minimum cost.
 
     G is a digraph with edge costs and capacities. There is a source
@@ -276,6 +291,12 @@ def max_flow_min_cost(G, s, t, capacity='capacity', weight='weight'):
         that edge. If not present, the weight is considered to be 0.
         Default value: 'weight'.
 
+    flow_func : function
+        Function that computes a minimum cost flow, with the same
+        signature and return value as :func:`network_simplex`, for
+        instance :func:`capacity_scaling` or :func:`cost_scaling`. If
+        None, :func:`network_simplex` is used. Default value: None.
+
     Returns
     -------
     flowDict: dictionary
@@ -340,4 +361,5 @@ def max_flow_min_cost(G, s, t, capacity='capacity', weight='weight'):
     H = nx.DiGraph(G)
     H.add_node(s, demand=-maxFlow)
     H.add_node(t, demand=maxFlow)
-    return min_cost_flow(H, capacity=capacity, weight=weight)
+    return min_cost_flow(H, capacity=capacity, weight=weight,
+                         flow_func=flow_func)
@@ -100,9 +100,15 @@ def network_simplex(G, demand='demand', capacity='capacity', weight='weight'):
     multiplying the relevant edge attributes by a convenient
     constant factor (eg 100).
 
+    If NumPy is available and the edge weights are integers or floating
+    point numbers, the reduced costs of each block of candidate entering
+    edges are computed at once in NumPy arrays. The pivots, and thus the
+    flow found, are the same as without NumPy.
+
     See also
     --------
-    cost_of_flow, max_flow_min_cost, min_cost_flow, min_cost_flow_cost
+    cost_of_flow, cost_scaling, max_flow_min_cost, min_cost_flow,
+    min_cost_flow_cost
 
     Examples
     --------
@@ -298,6 +304,46 @@ def network_simplex(G, demand='demand', capacity='capacity', weight='weight'):
         c = C[i] - pi[S[i]] + pi[T[i]]
         return c if x[i] == 0 else -c
 
+    def block_pricing(f, l):
+        """Returns the first edge with the lowest reduced cost among the
+        edges from f up to l, wrapping around after the last edge, and its
+        reduced cost.
+        """
+        if f < l:
+            edges = range(f, l)
+        else:
+            edges = chain(range(f, e), range(l))
+        i = min(edges, key=reduced_cost)
+        return i, reduced_cost(i)
+
+    # Price blocks of edges with NumPy if the costs allow exact arithmetic
+    # in a NumPy dtype. The pivots are the same as with pure Python.
+    dtype = _pricing_dtype(C, faux_inf)
+    if dtype is not None:
+        import numpy as np
+
+        pi = np.array(pi, dtype=dtype)
+        Ca = np.array(C[:e], dtype=dtype)
+        Sa = np.array(S[:e], dtype=np.intp)
+        Ta = np.array(T[:e], dtype=np.intp)
+        at_zero = np.ones(e, dtype=bool)  # edges without flow
+
+        def block_pricing(f, l):
+            """Returns the first edge with the lowest reduced cost among the
+            edges from f up to l, wrapping around after the last edge, and
+            its reduced cost.
+            """
+            if f < l:
+                c = Ca[f:l] - pi[Sa[f:l]] + pi[Ta[f:l]]
+                c = np.where(at_zero[f:l], c, -c)
+                i = int(c.argmin())
+                return f + i, c[i]
+            c = np.concatenate((Ca[f:] - pi[Sa[f:]] + pi[Ta[f:]],
+                                Ca[:l] - pi[Sa[:l]] + pi[Ta[:l]]))
+            c = np.where(np.concatenate((at_zero[f:], at_zero[:l])), c, -c)
+            i = int(c.argmin())
+            return (f + i if i < e - f else i - (e - f)), c[i]
+
     def find_entering_edges():
         """Yield entering edges until none can be found.
         """
@@ -316,15 +362,11 @@ def network_simplex(G, demand='demand', capacity='capacity', weight='weight'):
         while m < M:
             # Determine the next block of edges.
             l = f + B
-            if l <= e:
-                edges = range(f, l)
-            else:
+            if l > e:
                 l -= e
-                edges = chain(range(f, e), range(l))
-            f = l
             # Find the first edge with the lowest reduced cost.
-            i = min(edges, key=reduced_cost)
-            c = reduced_cost(i)
+            i, c = block_pricing(f, l)
+            f = l
             if c >= 0:
                 # No entering edge found in the current block.
                 m += 1
@@ -415,6 +457,10 @@ def network_simplex(G, demand='demand', capacity='capacity', weight='weight'):
                 x[i] += f
             else:
                 x[i] -= f
+        if dtype is not None:
+            for i in We:
+                if i < e:
+                    at_zero[i] = x[i] == 0
 
     def trace_subtree(p):
         """Yield the nodes in the subtree rooted at a node p.
@@ -517,8 +563,17 @@ def network_simplex(G, demand='demand', capacity='capacity', weight='weight'):
             d = pi[p] - C[i] - pi[q]
         else:
             d = pi[p] + C[i] - pi[q]
-        for q in trace_subtree(q):
-            pi[q] += d
+        if dtype is None:
+            for q in trace_subtree(q):
+                pi[q] += d
+        else:
+            subtree = [q]
+            append = subtree.append
+            l = last[q]
+            while q != l:
+                q = next[q]
+                append(q)
+            pi[subtree] += d
 
     # Pivot loop
     for i, p, q in find_entering_edges():
@@ -596,3 +651,28 @@ def network_simplex(G, demand='demand', capacity='capacity', weight='weight'):
                 add_entry(e[:-1] + (u,))
 
     return flow_cost, flow_dict
+
+
+def _pricing_dtype(C, faux_inf):
+    """Returns a NumPy dtype in which the reduced costs of edges with costs
+    C can be computed exactly, or None if there is none or NumPy is not
+    available.
+
+    Node potentials and reduced costs stay within a few times `faux_inf`,
+    so integer costs fit in int64 when `faux_inf` is small enough. Floating
+    point costs are computed in float64 as Python does, provided that the
+    integers among them are exactly representable.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    floating = False
+    for c in C:
+        if isinstance(c, (float, np.floating)):
+            floating = True
+        elif not isinstance(c, (int, np.integer)):
+            return None
+    if floating:
+        return np.float64 if abs(faux_inf) < 2 ** 52 else None
+    return np.int64 if faux_inf < 2 ** 59 else None
@@ -13,6 +13,7 @@ from itertools import islice
 import networkx as nx
 #from networkx.algorithms.flow.utils import *
 from ...utils import arbitrary_element
+from .utils import ArrayResidualNetwork
 from .utils import build_residual_network
 from .utils import CurrentEdge
 from .utils import detect_unboundedness
@@ -45,6 +46,12 @@ def preflow_push_impl(G, s, t, capacity, residual, global_relabel_freq,
 
     detect_unboundedness(R, s, t)
 
+    if isinstance(R, ArrayResidualNetwork):
+        R.reset()
+        R.graph['flow_value'] = preflow_push_array(
+            R, R.index[s], R.index[t], global_relabel_freq, value_only)
+        return R
+
     R_nodes = R.nodes
     R_pred = R.pred
     R_succ = R.succ
@@ -294,6 +301,205 @@ def preflow_push_impl(G, s, t, capacity, residual, global_relabel_freq,
     return R
 
 
+def preflow_push_array(R, s, t, global_relabel_freq, value_only):
+    """Highest-label preflow-push algorithm on an array residual network,
+    with `s` and `t` given as node indices. Returns the flow value.
+
+    Nodes are kept in buckets by height: a stack of the active nodes and
+    a set of all the nodes of each height. The highest active node is
+    popped from its stack, and an emptied set reveals a gap.
+    """
+    head = R.head
+    capacity = R.capacity
+    flow = R.flow
+    succ = R.succ
+    n = len(R.nodes)
+    excess = [0] * n
+
+    def reverse_bfs(src):
+        """Returns the distances to src in the residual network, with -1
+        for the nodes that cannot reach it.
+        """
+        dist = [-1] * n
+        dist[src] = 0
+        q = deque([src])
+        while q:
+            u = q.popleft()
+            d = dist[u] + 1
+            for e in succ[u]:
+                v = head[e]
+                if dist[v] < 0 and flow[e ^ 1] < capacity[e ^ 1]:
+                    dist[v] = d
+                    q.append(v)
+        return dist
+
+    # Initialize heights of the nodes.
+    height = reverse_bfs(t)
+
+    if height[s] < 0:
+        # t is not reachable from s in the residual network. The maximum flow
+        # must be zero.
+        return 0
+
+    height = [h if h >= 0 else n + 1 for h in height]
+    height[s] = n
+
+    # The maximum flow must be nonzero now. Initialize the preflow by
+    # saturating all edges emanating from s.
+    for e in succ[s]:
+        f = capacity[e]
+        if f > 0:
+            flow[e] += f
+            flow[e ^ 1] -= f
+            excess[head[e]] += f
+    excess[s] = 0
+
+    grt = GlobalRelabelThreshold(n, len(head), global_relabel_freq)
+    # curr[u] is the position of the 'current edge' of u in succ[u].
+    curr = [0] * n
+    # members[h] holds the nodes other than s and t of height h, and
+    # active[h] those of them with positive excess.
+    members = [set() for h in range(2 * n)]
+    active = [[] for h in range(2 * n)]
+    # An upper bound on the heights below n of the nodes in members.
+    max_member = 0
+
+    def fill_buckets(low, high):
+        """Put the nodes with heights in [low, high) into the buckets and
+        return the highest height with an active node, or low - 1.
+        """
+        nonlocal max_member
+        for bucket in members:
+            bucket.clear()
+        for bucket in active:
+            del bucket[:]
+        top = low - 1
+        for u in range(n):
+            h = height[u]
+            if u != s and u != t and low <= h < high:
+                members[h].add(u)
+                if excess[u] > 0:
+                    active[h].append(u)
+                    if h > top:
+                        top = h
+        max_member = max((h for h in range(low, min(high, n))
+                          if members[h]), default=0)
+        return top
+
+    def discharge(u, limit):
+        """Push the excess of u to its neighbors, relabeling it as needed.
+
+        Stops early once the height of u reaches limit. Returns the
+        highest height of a node activated by a push.
+        """
+        nonlocal max_member
+        h = height[u]
+        arcs = succ[u]
+        i = curr[u]
+        top = -1
+        while True:
+            e = arcs[i]
+            r = capacity[e] - flow[e]
+            if r > 0:
+                v = head[e]
+                if h == height[v] + 1:
+                    x = excess[u]
+                    f = x if x < r else r
+                    flow[e] += f
+                    flow[e ^ 1] -= f
+                    excess[u] = x - f
+                    if excess[v] == 0 and v != s and v != t:
+                        active[h - 1].append(v)
+                        top = h - 1
+                    excess[v] += f
+                    if x == f:
+                        break
+            i += 1
+            if i == len(arcs):
+                i = 0
+                # Relabel u to create an admissible edge.
+                grt.add_work(len(arcs))
+                members[h].remove(u)
+                if not members[h] and h < n:
+                    # Gap heuristic: nodes above the empty level cannot reach
+                    # t anymore.
+                    gap(h)
+                    h = n + 1
+                    break
+                h = min(height[head[e]] for e in arcs
+                        if flow[e] < capacity[e]) + 1
+                height[u] = h
+                members[h].add(u)
+                if max_member < h < n:
+                    max_member = h
+                if h >= limit:
+                    break
+        curr[u] = i
+        height[u] = h
+        return top
+
+    def gap(h):
+        """Move the nodes above height h and below n to height n + 1.
+        """
+        nonlocal max_member
+        for k in range(h + 1, max_member + 1):
+            bucket = members[k]
+            for u in bucket:
+                height[u] = n + 1
+            members[n + 1].update(bucket)
+            bucket.clear()
+            del active[k][:]
+        max_member = h - 1
+
+    # Phase 1: Find the maximum preflow by pushing as much flow as possible to
+    # t. Only nodes below height n, which can still reach t, are discharged.
+    h = fill_buckets(0, n)
+    while h > 0:
+        bucket = active[h]
+        if not bucket:
+            h -= 1
+            continue
+        u = bucket.pop()
+        top = discharge(u, n)
+        if grt.is_reached():
+            # Global relabeling heuristic: Recompute the exact heights of all
+            # nodes below n.
+            dist = reverse_bfs(t)
+            for v in range(n):
+                if height[v] < n:
+                    height[v] = dist[v] if dist[v] >= 0 else n + 1
+            curr[:] = [0] * n
+            h = fill_buckets(0, n)
+            grt.clear_work()
+        elif top > h:
+            h = top
+
+    # A maximum preflow has been found. The excess at t is the maximum flow
+    # value.
+    if value_only:
+        return excess[t]
+
+    # Phase 2: Convert the maximum preflow into a maximum flow by returning the
+    # excess to s. Heights are the distances to s shifted by n.
+    dist = reverse_bfs(s)
+    for v in range(n):
+        if v != t and dist[v] >= 0:
+            height[v] = n + dist[v]
+    curr[:] = [0] * n
+    h = fill_buckets(n + 1, 2 * n)
+    while h > n:
+        bucket = active[h]
+        if not bucket:
+            h -= 1
+            continue
+        u = bucket.pop()
+        top = discharge(u, 2 * n)
+        if top > h:
+            h = top
+
+    return excess[t]
+
+
 def preflow_push(G, s, t, capacity='capacity', residual=None,
                  global_relabel_freq=1, value_only=False):
     r"""Find a maximum single-commodity flow using the highest-label
@@ -326,9 +532,11 @@ def preflow_push(G, s, t, capacity='capacity', residual=None,
         attribute is not present, the edge is considered to have
         infinite capacity. Default value: 'capacity'.
 
-    residual : NetworkX graph
+    residual : NetworkX graph or ArrayResidualNetwork
         Residual network on which the algorithm is to be executed. If None, a
-        new residual network is created. Default value: None.
+        new residual network is created. If it is an
+        :class:`ArrayResidualNetwork`, the algorithm runs on its arrays and
+        returns it instead of a DiGraph. Default value: None.
 
     global_relabel_freq : integer, float
         Relative frequency of applying the global relabeling heuristic to speed
@@ -342,7 +550,7 @@ def preflow_push(G, s, t, capacity='capacity', residual=None,
 
     Returns
     -------
-    R : NetworkX DiGraph
+    R : NetworkX DiGraph or ArrayResidualNetwork
         Residual network after computing the maximum flow.
 
     Raises
@@ -374,6 +582,11 @@ def preflow_push(G, s, t, capacity='capacity', residual=None,
     :samp:`R.nodes[u]['excess']` represents the difference between flow into
     :samp:`u` and flow out of :samp:`u`.
 
+    On an :class:`ArrayResidualNetwork`, the nodes of each height are kept
+    in a bucket with a stack of its active nodes, so that the highest
+    active node is found without scanning, and the excesses are not
+    stored.
+
     For each edge :samp:`(u, v)` in :samp:`R`, :samp:`R[u][v]['capacity']`
     is equal to the capacity of :samp:`(u, v)` in :samp:`G` if it exists
     in :samp:`G` or zero otherwise. If the capacity is infinite,
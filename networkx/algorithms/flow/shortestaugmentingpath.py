@@ -11,7 +11,7 @@ __author__ = """ysitu <ysitu@users.noreply.github.com>"""
 from collections import deque
 import networkx as nx
 from .utils import *
-from .edmondskarp import edmonds_karp_core
+from .edmondskarp import edmonds_karp_array_core, edmonds_karp_core
 
 __all__ = ['shortest_augmenting_path']
 
@@ -32,6 +32,12 @@ def shortest_augmenting_path_impl(G, s, t, capacity, residual, two_phase,
     else:
         R = residual
 
+    if isinstance(R, ArrayResidualNetwork):
+        R.reset()
+        R.graph['flow_value'] = shortest_augmenting_path_array(
+            R, R.index[s], R.index[t], two_phase, cutoff)
+        return R
+
     R_nodes = R.nodes
     R_pred = R.pred
     R_succ = R.succ
@@ -173,6 +179,133 @@ def shortest_augmenting_path_impl(G, s, t, capacity, residual, two_phase,
     return R
 
 
+def shortest_augmenting_path_array(R, s, t, two_phase, cutoff):
+    """Implementation of the shortest augmenting path algorithm on an array
+    residual network, with `s` and `t` given as node indices. Returns the
+    flow value.
+    """
+    head = R.head
+    capacity = R.capacity
+    flow = R.flow
+    succ = R.succ
+    n = len(R.nodes)
+
+    # Initialize heights of the nodes.
+    heights = [-1] * n
+    heights[t] = 0
+    q = deque([t])
+    while q:
+        u = q.popleft()
+        height = heights[u] + 1
+        for e in succ[u]:
+            v = head[e]
+            if heights[v] < 0 and flow[e ^ 1] < capacity[e ^ 1]:
+                heights[v] = height
+                q.append(v)
+
+    if heights[s] < 0:
+        # t is not reachable from s in the residual network. The maximum flow
+        # must be zero.
+        return 0
+
+    m = len(head) / 2
+    heights = [h if h >= 0 else n for h in heights]
+    # curr[u] is the position of the 'current edge' of u in succ[u].
+    curr = [0] * n
+
+    # Initialize counts of nodes in each level.
+    counts = [0] * (2 * n - 1)
+    for h in heights:
+        counts[h] += 1
+
+    inf = R.graph['inf']
+
+    def augment(path):
+        """Augment flow along a path of arcs from s to t.
+        """
+        # Determine the path residual capacity.
+        f = inf
+        for e in path:
+            f = min(f, capacity[e] - flow[e])
+        if f * 2 > inf:
+            raise nx.NetworkXUnbounded(
+                'Infinite capacity path, flow unbounded above.')
+        # Augment flow along the path.
+        for e in path:
+            flow[e] += f
+            flow[e ^ 1] -= f
+        return f
+
+    def relabel(u):
+        """Relabel a node to create an admissible edge.
+        """
+        height = n - 1
+        for e in succ[u]:
+            if flow[e] < capacity[e]:
+                height = min(height, heights[head[e]])
+        return height + 1
+
+    if cutoff is None:
+        cutoff = float('inf')
+
+    # Phase 1: Look for shortest augmenting paths using depth-first search.
+
+    flow_value = 0
+    path = []
+    u = s
+    d = n if not two_phase else int(min(m ** 0.5, 2 * n ** (2. / 3)))
+    done = heights[s] >= d
+    while not done:
+        height = heights[u]
+        arcs = succ[u]
+        # Depth-first search for the next node on the path to t.
+        while True:
+            e = arcs[curr[u]]
+            v = head[e]
+            if height == heights[v] + 1 and flow[e] < capacity[e]:
+                # Advance to the next node following an admissible edge.
+                path.append(e)
+                u = v
+                break
+            curr[u] += 1
+            if curr[u] == len(arcs):
+                curr[u] = 0
+                counts[height] -= 1
+                if counts[height] == 0:
+                    # Gap heuristic: If relabeling causes a level to become
+                    # empty, a minimum cut has been identified. The algorithm
+                    # can now be terminated.
+                    return flow_value
+                height = relabel(u)
+                if u == s and height >= d:
+                    if not two_phase:
+                        # t is disconnected from s in the residual network. No
+                        # more augmenting paths exist.
+                        return flow_value
+                    else:
+                        # t is at least d steps away from s. End of phase 1.
+                        done = True
+                        break
+                counts[height] += 1
+                heights[u] = height
+                if u != s:
+                    # After relabeling, the last edge on the path is no longer
+                    # admissible. Retreat one step to look for an alternative.
+                    u = head[path.pop() ^ 1]
+                    break
+        if u == t:
+            # t is reached. Augment flow along the path and reset it for a new
+            # depth-first search.
+            flow_value += augment(path)
+            if flow_value >= cutoff:
+                return flow_value
+            path = []
+            u = s
+
+    # Phase 2: Look for shortest augmenting paths using breadth-first search.
+    return flow_value + edmonds_karp_array_core(R, s, t, cutoff - flow_value)
+
+
 def shortest_augmenting_path(G, s, t, capacity='capacity', residual=None,
                              value_only=False, two_phase=False, cutoff=None):
     r"""Find a maximum single-commodity flow using the shortest augmenting path
@@ -205,9 +338,11 @@ def shortest_augmenting_path(G, s, t, capacity='capacity', residual=None,
         attribute is not present, the edge is considered to have
         infinite capacity. Default value: 'capacity'.
 
-    residual : NetworkX graph
+    residual : NetworkX graph or ArrayResidualNetwork
         Residual network on which the algorithm is to be executed. If None, a
-        new residual network is created. Default value: None.
+        new residual network is created. If it is an
+        :class:`ArrayResidualNetwork`, the algorithm runs on its arrays and
+        returns it instead of a DiGraph. Default value: None.
 
     value_only : bool
         If True compute only the value of the maximum flow. This parameter
@@ -225,7 +360,7 @@ def shortest_augmenting_path(G, s, t, capacity='capacity', residual=None,
 
     Returns
     -------
-    R : NetworkX DiGraph
+    R : NetworkX DiGraph or ArrayResidualNetwork
         Residual network after computing the maximum flow.
 
     Raises
@@ -112,6 +112,32 @@ class TestGomoryHuTree:
                 assert_equal(nx.minimum_cut_value(G, u, v, capacity='weight'),
                              cut_value)
 
+    def test_tree_graph(self):
+        G = nx.balanced_tree(3, 3)
+        for i, (u, v) in enumerate(G.edges()):
+            G[u][v]['capacity'] = i % 4 + 1
+        T = nx.gomory_hu_tree(G)
+        assert_equal(sorted(T.edges(data='weight')),
+                     sorted(G.edges(data='capacity')))
+
+    def test_pendant_paths_and_trivial_cuts(self):
+        G = nx.cycle_graph(6)
+        nx.add_path(G, [0, 6, 7, 8])
+        nx.add_path(G, [3, 9, 10])
+        G.add_edges_from([(1, 11), (2, 11), (11, 12), (12, 13), (13, 11)])
+        G.add_node(14)
+        for i, (u, v) in enumerate(G.edges()):
+            G[u][v]['capacity'] = i % 3 + 1
+        for flow_func in flow_funcs:
+            T = nx.gomory_hu_tree(G, flow_func=flow_func)
+            assert_true(nx.is_tree(T))
+            for u, v in combinations(G, 2):
+                cut_value, edge = self.minimum_edge_weight(T, u, v)
+                assert_equal(nx.minimum_cut_value(G, u, v), cut_value)
+                cutset = self.compute_cutset(G, T, edge)
+                assert_equal(cut_value, sum(G[x][y]['capacity']
+                                            for x, y in cutset))
+
     @raises(nx.NetworkXNotImplemented)
     def test_directed_raises(self):
         G = nx.DiGraph()
@@ -5,6 +5,7 @@ from nose.tools import *
 
 import networkx as nx
 from networkx.algorithms.flow import build_flow_dict, build_residual_network
+from networkx.algorithms.flow import build_array_residual_network
 from networkx.algorithms.flow import boykov_kolmogorov
 from networkx.algorithms.flow import edmonds_karp
 from networkx.algorithms.flow import preflow_push
@@ -82,6 +83,17 @@ def compare_flows_and_cuts(G, s, t, solnFlows, solnValue, capacity='capacity'):
         cut_value, partition = nx.minimum_cut(G, s, t, capacity=capacity,
                                               flow_func=flow_func)
         validate_cuts(G, s, t, solnValue, partition, capacity, flow_func)
+        # Array and DiGraph residual networks.
+        R = flow_func(G, s, t, capacity,
+                      residual=build_array_residual_network(G, capacity))
+        assert_equal(R.graph['flow_value'], solnValue,
+                     msg=msg.format(flow_func.__name__))
+        validate_flows(G, s, t, build_flow_dict(G, R), solnValue, capacity,
+                       flow_func)
+        R = build_residual_network(G, capacity)
+        cut_value, partition = nx.minimum_cut(G, s, t, capacity=capacity,
+                                              flow_func=flow_func, residual=R)
+        validate_cuts(G, s, t, solnValue, partition, capacity, flow_func)
 
 
 class TestMaxflowMinCutCommon:
@@ -448,6 +460,147 @@ class TestMaxFlowMinCutInterface:
                                  msg=msgi.format(flow_func.__name__,
                                                  interface_func.__name__))
 
+    def test_reusing_array_residual(self):
+        G = self.G
+        fv = 3.0
+        R = build_array_residual_network(G, 'capacity')
+        for interface_func in interface_funcs:
+            for flow_func in flow_funcs:
+                for i in range(3):
+                    result = interface_func(G, 'x', 'y', flow_func=flow_func,
+                                            residual=R)
+                    if interface_func in max_min_funcs:
+                        result = result[0]
+                    assert_equal(fv, result,
+                                 msg=msgi.format(flow_func.__name__,
+                                                 interface_func.__name__))
+
+
+class TestArrayResidualNetwork:
+
+    def test_same_arcs(self):
+        G = nx.DiGraph()
+        G.add_edge('x', 'a', capacity=3.0)
+        G.add_edge('a', 'x', capacity=1.0)
+        G.add_edge('a', 'b')
+        G.add_edge('b', 'b', capacity=2.0)
+        G.add_edge('b', 'y', capacity=0)
+        G.add_edge('x', 'y', capacity=2.0)
+        R = build_array_residual_network(G, 'capacity')
+        H = build_residual_network(G, 'capacity')
+        assert_equal(len(R), len(G))
+        assert_true('a' in R)
+        assert_equal(len(R.head), H.number_of_edges())
+        for e in range(len(R.head)):
+            assert_equal(R.flow[e], -R.flow[e ^ 1])
+        R = edmonds_karp(G, 'x', 'y', residual=R)
+        H = edmonds_karp(G, 'x', 'y', residual=H)
+        D = R.to_residual_network()
+        assert_equal(sorted(D.edges(data=True)), sorted(H.edges(data=True)))
+        assert_equal(D.graph['flow_value'], 2.0)
+        assert_equal(D.graph['inf'], H.graph['inf'])
+
+    def test_undirected(self):
+        G = nx.cycle_graph(4)
+        nx.set_edge_attributes(G, 1, 'capacity')
+        R = build_array_residual_network(G, 'capacity')
+        assert_equal(R.capacity, [1] * 8)
+        R = preflow_push(G, 0, 2, residual=R)
+        assert_equal(R.graph['flow_value'], 2)
+        assert_equal({R.nodes[u] for u in R.source_side(R.index[2])},
+                     {0, 1, 3})
+
+    def test_trees(self):
+        G = nx.path_graph(4)
+        nx.set_edge_attributes(G, 1, 'capacity')
+        R = build_array_residual_network(G, 'capacity')
+        R = boykov_kolmogorov(G, 0, 3, residual=R)
+        H = boykov_kolmogorov(G, 0, 3)
+        assert_equal(R.graph['trees'], H.graph['trees'])
+
+    def test_multigraph_raises(self):
+        assert_raises(nx.NetworkXError, build_array_residual_network,
+                      nx.MultiGraph(), 'capacity')
+
+
+class TestFlowSession:
+
+    def setup(self):
+        G = nx.DiGraph()
+        G.add_edge('x', 'a', capacity=3.0)
+        G.add_edge('x', 'b', capacity=1.0)
+        G.add_edge('a', 'c', capacity=3.0)
+        G.add_edge('b', 'c', capacity=5.0)
+        G.add_edge('b', 'd', capacity=4.0)
+        G.add_edge('d', 'e', capacity=2.0)
+        G.add_edge('c', 'y', capacity=2.0)
+        G.add_edge('e', 'y', capacity=3.0)
+        self.G = G
+
+    def test_queries(self):
+        G = self.G
+        pairs = [(u, v) for u in G for v in G if u != v]
+        for flow_func in flow_funcs:
+            session = nx.FlowSession(G, flow_func=flow_func)
+            values = session.maximum_flow_values(pairs)
+            for s, t in pairs:
+                value = nx.maximum_flow_value(G, s, t, flow_func=flow_func)
+                assert_equal(values[s, t], value,
+                             msg=msg.format(flow_func.__name__))
+            flow_value, flow_dict = session.maximum_flow('x', 'y')
+            validate_flows(G, 'x', 'y', flow_dict, 3.0, 'capacity',
+                           flow_func)
+            cut_value, partition = session.minimum_cut('x', 'y')
+            validate_cuts(G, 'x', 'y', 3.0, partition, 'capacity',
+                          flow_func)
+            assert_equal(session.minimum_cut_value('x', 'y'), 3.0)
+
+    def test_set_capacity(self):
+        G = self.G
+        session = nx.FlowSession(G, flow_func=edmonds_karp)
+        R = session.residual
+        session.set_capacity('c', 'y', 1.0)
+        assert_equal(G['c']['y']['capacity'], 1.0)
+        assert_equal(session.maximum_flow_value('x', 'y'), 2.0)
+        assert_true(session.residual is R)
+        # Larger than the value standing for infinity allows.
+        session.set_capacity('c', 'y', 1000.0)
+        assert_equal(session.maximum_flow_value('x', 'y'), 4.0)
+        assert_false(session.residual is R)
+        # An edge without arcs in the residual network.
+        G.add_edge('x', 'y', capacity=0)
+        session.set_capacity('x', 'y', 1.0)
+        assert_equal(session.maximum_flow_value('x', 'y'), 5.0)
+        assert_equal(session.maximum_flow_value('x', 'y'),
+                     nx.maximum_flow_value(G, 'x', 'y'))
+
+    def test_set_capacity_undirected(self):
+        G = nx.cycle_graph(4)
+        nx.set_edge_attributes(G, 2, 'capacity')
+        session = nx.FlowSession(G)
+        assert_equal(session.maximum_flow_value(0, 2), 4)
+        session.set_capacity(1, 0, 1)
+        assert_equal(session.maximum_flow_value(0, 2), 3)
+        assert_equal(session.maximum_flow_value(2, 0), 3)
+
+    def test_custom_flow_func(self):
+        def flow_func(G, s, t, **kwargs):
+            return edmonds_karp(G, s, t, **kwargs)
+        G = self.G
+        session = nx.FlowSession(G, flow_func=flow_func)
+        assert_true(isinstance(session.residual, nx.DiGraph))
+        session.set_capacity('c', 'y', 1.0)
+        assert_equal(session.maximum_flow_value('x', 'y'), 2.0)
+        assert_equal(session.residual['c']['y']['capacity'], 1.0)
+
+    def test_errors(self):
+        G = self.G
+        assert_raises(nx.NetworkXError, nx.FlowSession, G, cutoff=1)
+        assert_raises(nx.NetworkXError, nx.FlowSession, G, flow_func=1)
+        assert_raises(nx.NetworkXError, nx.FlowSession, nx.MultiDiGraph())
+        session = nx.FlowSession(G)
+        assert_raises(nx.NetworkXError, session.set_capacity, 'y', 'x', 1)
+
 
 # Tests specific to one algorithm
 def test_preflow_push_global_relabel_freq():
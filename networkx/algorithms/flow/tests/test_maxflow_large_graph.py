@@ -11,6 +11,7 @@ from nose.tools import *
 
 import networkx as nx
 from networkx.algorithms.flow import build_flow_dict, build_residual_network
+from networkx.algorithms.flow import build_array_residual_network
 from networkx.algorithms.flow import boykov_kolmogorov
 from networkx.algorithms.flow import dinitz
 from networkx.algorithms.flow import edmonds_karp
@@ -154,3 +155,38 @@ class TestMaxflowLargeGraph:
         G = read_graph('gw1')
         R = preflow_push(G, 1, len(G), global_relabel_freq=50)
         assert_equal(R.graph['flow_value'], 1202018)
+        R = build_array_residual_network(G, 'capacity')
+        R = preflow_push(G, 1, len(G), residual=R, global_relabel_freq=50)
+        validate_flows(G, 1, len(G), 1202018, R, preflow_push)
+
+    def test_gw1_array(self):
+        G = read_graph('gw1')
+        s = 1
+        t = len(G)
+        R = build_array_residual_network(G, 'capacity')
+        kwargs = dict(residual=R)
+
+        for flow_func in flow_funcs:
+            validate_flows(G, s, t, 1202018, flow_func(G, s, t, **kwargs),
+                           flow_func)
+
+    def test_grid(self):
+        # A segmentation-style network: a 4-connected grid with arcs from
+        # the source and to the sink.
+        G = nx.grid_2d_graph(30, 30).to_directed()
+        for k, (u, v) in enumerate(G.edges()):
+            G[u][v]['capacity'] = 1 + k % 7
+        for k, u in enumerate(nx.grid_2d_graph(30, 30)):
+            if k % 3 == 0:
+                G.add_edge('s', u, capacity=1 + k % 11)
+            elif k % 3 == 1:
+                G.add_edge(u, 't', capacity=1 + k % 13)
+        soln_value = nx.maximum_flow_value(G, 's', 't', flow_func=dinitz)
+        for flow_func in flow_funcs:
+            R = build_array_residual_network(G, 'capacity')
+            validate_flows(G, 's', 't', soln_value,
+                           flow_func(G, 's', 't', residual=R), flow_func)
+        R = build_residual_network(G, 'capacity')
+        validate_flows(G, 's', 't', soln_value,
+                       boykov_kolmogorov(G, 's', 't', residual=R),
+                       boykov_kolmogorov)
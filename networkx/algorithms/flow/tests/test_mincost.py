@@ -29,6 +29,12 @@ class TestMinCostFlow:
         assert_equal(flowCost, 24)
         assert_equal(nx.cost_of_flow(G, H), 24)
         assert_equal(H, soln)
+        assert_equal(nx.min_cost_flow_cost(G, flow_func=nx.cost_scaling), 24)
+        assert_equal(nx.min_cost_flow(G, flow_func=nx.capacity_scaling), soln)
+        flowCost, H = nx.cost_scaling(G)
+        assert_equal(flowCost, 24)
+        assert_equal(nx.cost_of_flow(G, H), 24)
+        assert_equal(H, soln)
 
     def test_negcycle_infcap(self):
         G = nx.DiGraph()
@@ -42,6 +48,7 @@ class TestMinCostFlow:
         G.add_edge('d', 't', weight=1, capacity=3)
         assert_raises(nx.NetworkXUnfeasible, nx.network_simplex, G)
         assert_raises(nx.NetworkXUnbounded, nx.capacity_scaling, G)
+        assert_raises(nx.NetworkXUnbounded, nx.cost_scaling, G)
 
     def test_sum_demands_not_zero(self):
         G = nx.DiGraph()
@@ -55,6 +62,7 @@ class TestMinCostFlow:
         G.add_edge('d', 't', weight=1, capacity=3)
         assert_raises(nx.NetworkXUnfeasible, nx.network_simplex, G)
         assert_raises(nx.NetworkXUnfeasible, nx.capacity_scaling, G)
+        assert_raises(nx.NetworkXUnfeasible, nx.cost_scaling, G)
 
     def test_no_flow_satisfying_demands(self):
         G = nx.DiGraph()
@@ -68,6 +76,7 @@ class TestMinCostFlow:
         G.add_edge('d', 't', weight=1, capacity=3)
         assert_raises(nx.NetworkXUnfeasible, nx.network_simplex, G)
         assert_raises(nx.NetworkXUnfeasible, nx.capacity_scaling, G)
+        assert_raises(nx.NetworkXUnfeasible, nx.cost_scaling, G)
 
     def test_transshipment(self):
         G = nx.DiGraph()
@@ -114,6 +123,10 @@ class TestMinCostFlow:
         assert_equal(flowCost, 41)
         assert_equal(nx.cost_of_flow(G, H), 41)
         assert_equal(H, soln)
+        flowCost, H = nx.cost_scaling(G)
+        assert_equal(flowCost, 41)
+        assert_equal(nx.cost_of_flow(G, H), 41)
+        assert_equal(H, soln)
 
     def test_max_flow_min_cost(self):
         G = nx.DiGraph()
@@ -133,6 +146,9 @@ class TestMinCostFlow:
                                     weight='cost')
         assert_equal(flow, soln)
         assert_equal(nx.cost_of_flow(G, flow, weight='cost'), 90)
+        flow = nx.max_flow_min_cost(G, 's', 't', capacity='bandwidth',
+                                    weight='cost', flow_func=nx.cost_scaling)
+        assert_equal(flow, soln)
 
         G.add_edge('t', 's', cost=-100)
         flowCost, flow = nx.capacity_scaling(G, capacity='bandwidth',
@@ -176,6 +192,10 @@ class TestMinCostFlow:
         assert_equal(flowCost, 150)
         assert_equal(H, soln)
         assert_equal(nx.cost_of_flow(G, H), 150)
+        flowCost, H = nx.cost_scaling(G)
+        assert_equal(flowCost, 150)
+        assert_equal(H, soln)
+        assert_equal(nx.cost_of_flow(G, H), 150)
 
     def test_digraph2(self):
         # Example from ticket #430 from mfrasca. Original source:
@@ -291,6 +311,10 @@ class TestMinCostFlow:
         assert_equal(flowCost, 6)
         assert_equal(H, soln)
         assert_equal(nx.cost_of_flow(G, H), 6)
+        flowCost, H = nx.cost_scaling(G)
+        assert_equal(flowCost, 6)
+        assert_equal(H, soln)
+        assert_equal(nx.cost_of_flow(G, H), 6)
 
     def test_digon(self):
         """Check if digons are handled properly. Taken from ticket
@@ -320,6 +344,27 @@ class TestMinCostFlow:
         assert_equal(flowCost, 2857140)
         assert_equal(H, soln)
         assert_equal(nx.cost_of_flow(G, H), 2857140)
+        flowCost, H = nx.cost_scaling(G)
+        assert_equal(flowCost, 2857140)
+        assert_equal(H, soln)
+        assert_equal(nx.cost_of_flow(G, H), 2857140)
+
+    def test_fraction_weights(self):
+        # Weights that NumPy cannot hold exactly are priced in Python.
+        from fractions import Fraction
+        G = nx.DiGraph()
+        G.add_node('a', demand=-5)
+        G.add_node('d', demand=5)
+        G.add_edge('a', 'b', weight=Fraction(3, 2), capacity=4)
+        G.add_edge('a', 'c', weight=Fraction(6, 2), capacity=10)
+        G.add_edge('b', 'd', weight=Fraction(1, 2), capacity=9)
+        G.add_edge('c', 'd', weight=Fraction(2, 2), capacity=5)
+        flowCost, H = nx.network_simplex(G)
+        assert_equal(flowCost, 12)
+        assert_equal(H, {'a': {'b': 4, 'c': 1},
+                         'b': {'d': 4},
+                         'c': {'d': 1},
+                         'd': {}})
 
     def test_deadend(self):
         """Check if one-node cycles are handled properly. Taken from ticket
@@ -349,6 +394,7 @@ class TestMinCostFlow:
         G.add_nodes_from(nodes)
         assert_raises(nx.NetworkXUnbounded, nx.network_simplex, G)
         assert_raises(nx.NetworkXUnbounded, nx.capacity_scaling, G)
+        assert_raises(nx.NetworkXUnbounded, nx.cost_scaling, G)
 
     def test_finite_capacity_neg_digon(self):
         """The digon should receive the maximum amount of flow it can handle.
@@ -363,6 +409,10 @@ class TestMinCostFlow:
         assert_equal(flowCost, -2)
         assert_equal(H, {'a': {'b': 1}, 'b': {'a': 1}})
         assert_equal(nx.cost_of_flow(G, H), -2)
+        flowCost, H = nx.cost_scaling(G)
+        assert_equal(flowCost, -2)
+        assert_equal(H, {'a': {'b': 1}, 'b': {'a': 1}})
+        assert_equal(nx.cost_of_flow(G, H), -2)
 
     def test_multidigraph(self):
         """Multidigraphs are acceptable."""
@@ -375,6 +425,9 @@ class TestMinCostFlow:
         flowCost, H = nx.capacity_scaling(G)
         assert_equal(flowCost, 0)
         assert_equal(H, {1: {2: {0: 0}}, 2: {3: {0: 0}}, 3: {}})
+        flowCost, H = nx.cost_scaling(G)
+        assert_equal(flowCost, 0)
+        assert_equal(H, {1: {2: {0: 0}}, 2: {3: {0: 0}}, 3: {}})
 
     def test_negative_selfloops(self):
         """Negative selfloops should cause an exception if uncapacitated and
@@ -384,6 +437,7 @@ class TestMinCostFlow:
         G.add_edge(1, 1, weight=-1)
         assert_raises(nx.NetworkXUnbounded, nx.network_simplex, G)
         assert_raises(nx.NetworkXUnbounded, nx.capacity_scaling, G)
+        assert_raises(nx.NetworkXUnbounded, nx.cost_scaling, G)
         G[1][1]['capacity'] = 2
         flowCost, H = nx.network_simplex(G)
         assert_equal(flowCost, -2)
@@ -391,12 +445,16 @@ class TestMinCostFlow:
         flowCost, H = nx.capacity_scaling(G)
         assert_equal(flowCost, -2)
         assert_equal(H, {1: {1: 2}})
+        flowCost, H = nx.cost_scaling(G)
+        assert_equal(flowCost, -2)
+        assert_equal(H, {1: {1: 2}})
 
         G = nx.MultiDiGraph()
         G.add_edge(1, 1, 'x', weight=-1)
         G.add_edge(1, 1, 'y', weight=1)
         assert_raises(nx.NetworkXUnbounded, nx.network_simplex, G)
         assert_raises(nx.NetworkXUnbounded, nx.capacity_scaling, G)
+        assert_raises(nx.NetworkXUnbounded, nx.cost_scaling, G)
         G[1][1]['x']['capacity'] = 2
         flowCost, H = nx.network_simplex(G)
         assert_equal(flowCost, -2)
@@ -404,6 +462,9 @@ class TestMinCostFlow:
         flowCost, H = nx.capacity_scaling(G)
         assert_equal(flowCost, -2)
         assert_equal(H, {1: {1: {'x': 2, 'y': 0}}})
+        flowCost, H = nx.cost_scaling(G)
+        assert_equal(flowCost, -2)
+        assert_equal(H, {1: {1: {'x': 2, 'y': 0}}})
 
     def test_bone_shaped(self):
         # From #1283
@@ -427,37 +488,52 @@ class TestMinCostFlow:
         assert_equal(flowCost, 0)
         assert_equal(
             H, {0: {1: 2, 2: 2, 3: 0}, 1: {}, 2: {}, 3: {}, 4: {3: 2}, 5: {3: 2}})
+        flowCost, H = nx.cost_scaling(G)
+        assert_equal(flowCost, 0)
+        assert_equal(
+            H, {0: {1: 2, 2: 2, 3: 0}, 1: {}, 2: {}, 3: {}, 4: {3: 2}, 5: {3: 2}})
 
     def test_exceptions(self):
         G = nx.Graph()
         assert_raises(nx.NetworkXNotImplemented, nx.network_simplex, G)
         assert_raises(nx.NetworkXNotImplemented, nx.capacity_scaling, G)
+        assert_raises(nx.NetworkXNotImplemented, nx.cost_scaling, G)
         G = nx.MultiGraph()
         assert_raises(nx.NetworkXNotImplemented, nx.network_simplex, G)
         assert_raises(nx.NetworkXNotImplemented, nx.capacity_scaling, G)
+        assert_raises(nx.NetworkXNotImplemented, nx.cost_scaling, G)
         G = nx.DiGraph()
         assert_raises(nx.NetworkXError, nx.network_simplex, G)
         assert_raises(nx.NetworkXError, nx.capacity_scaling, G)
+        assert_raises(nx.NetworkXError, nx.cost_scaling, G)
         G.add_node(0, demand=float('inf'))
         assert_raises(nx.NetworkXError, nx.network_simplex, G)
         assert_raises(nx.NetworkXUnfeasible, nx.capacity_scaling, G)
+        assert_raises(nx.NetworkXError, nx.cost_scaling, G)
         G.nodes[0]['demand'] = 0
         G.add_node(1, demand=0)
         G.add_edge(0, 1, weight=-float('inf'))
         assert_raises(nx.NetworkXError, nx.network_simplex, G)
         assert_raises(nx.NetworkXUnfeasible, nx.capacity_scaling, G)
+        assert_raises(nx.NetworkXError, nx.cost_scaling, G)
+        G[0][1]['weight'] = 0.5
+        assert_raises(nx.NetworkXError, nx.cost_scaling, G)
         G[0][1]['weight'] = 0
         G.add_edge(0, 0, weight=float('inf'))
         assert_raises(nx.NetworkXError, nx.network_simplex, G)
         #assert_raises(nx.NetworkXError, nx.capacity_scaling, G)
+        assert_raises(nx.NetworkXError, nx.cost_scaling, G)
         G[0][0]['weight'] = 0
         G[0][1]['capacity'] = -1
         assert_raises(nx.NetworkXUnfeasible, nx.network_simplex, G)
         #assert_raises(nx.NetworkXUnfeasible, nx.capacity_scaling, G)
+        assert_raises(nx.NetworkXUnfeasible, nx.cost_scaling, G)
         G[0][1]['capacity'] = 0
         G[0][0]['capacity'] = -1
         assert_raises(nx.NetworkXUnfeasible, nx.network_simplex, G)
         #assert_raises(nx.NetworkXUnfeasible, nx.capacity_scaling, G)
+        assert_raises(nx.NetworkXUnfeasible, nx.cost_scaling, G)
+        assert_raises(nx.NetworkXError, nx.cost_scaling, G, alpha=1)
 
     def test_large(self):
         fname = os.path.join(os.path.dirname(__file__), 'netgen-2.gpickle.bz2')
@@ -468,3 +544,6 @@ class TestMinCostFlow:
         flowCost, flowDict = nx.capacity_scaling(G)
         assert_equal(6749969302, flowCost)
         assert_equal(6749969302, nx.cost_of_flow(G, flowDict))
+        flowCost, flowDict = nx.cost_scaling(G)
+        assert_equal(6749969302, flowCost)
+        assert_equal(6749969302, nx.cost_of_flow(G, flowDict))
@@ -12,7 +12,8 @@ from collections import deque
 import networkx as nx
 
 __all__ = ['CurrentEdge', 'Level', 'GlobalRelabelThreshold',
-           'build_residual_network', 'detect_unboundedness', 'build_flow_dict']
+           'build_residual_network', 'detect_unboundedness', 'build_flow_dict',
+           'ArrayResidualNetwork', 'build_array_residual_network']
 
 
 class CurrentEdge(object):
@@ -142,9 +143,169 @@ def build_residual_network(G, capacity):
     return R
 
 
+class ArrayResidualNetwork(object):
+    """Residual network stored in integer-indexed arrays.
+
+    This is the array counterpart of the DiGraph returned by
+    :func:`build_residual_network`. It has the same arcs, in the same
+    order, but nodes are numbered from 0 to n - 1 in the order of
+    `nodes`, and the arcs are numbered so that the reverse of arc `e` is
+    arc ``e ^ 1``. Arc `e` points to node ``head[e]``, starts at node
+    ``head[e ^ 1]`` and has the residual capacity
+    ``capacity[e] - flow[e]``. ``succ[u]`` lists the arcs that start at
+    node `u`; the arcs that end at `u` are their reverses.
+
+    The maximum flow functions of this package run on such a network
+    when it is passed as their `residual` argument, and return it with
+    the same graph attributes they set on a DiGraph residual network.
+    :func:`build_flow_dict` converts the flow back to node labels.
+
+    Attributes
+    ----------
+    nodes : list
+        The nodes of the input graph.
+
+    index : dict
+        The position of each node in `nodes`.
+
+    head : list
+        The node index each arc points to.
+
+    capacity : list
+        The capacity of each arc.
+
+    flow : list
+        The flow on each arc, with ``flow[e] == -flow[e ^ 1]``.
+
+    succ : list of lists
+        The arcs that start at each node.
+
+    graph : dict
+        Graph attributes: 'inf', the finite value standing for infinite
+        capacities, and the attributes set by the flow functions, such as
+        'flow_value'.
+    """
+
+    def __init__(self, nodes, head, capacity, succ, inf):
+        self.nodes = nodes
+        self.index = {u: i for i, u in enumerate(nodes)}
+        self.head = head
+        self.capacity = capacity
+        self.succ = succ
+        self.graph = {'inf': inf}
+        self.reset()
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def __contains__(self, n):
+        return n in self.index
+
+    def reset(self):
+        """Set the flow on all arcs to zero."""
+        self.flow = [0] * len(self.head)
+
+    def source_side(self, t):
+        """Returns the set of node indices that cannot reach `t`.
+
+        Only arcs with positive residual capacity are followed. After a
+        maximum flow, or preflow, to the node of index `t` has been
+        found, these nodes form the source side of a minimum cut.
+        """
+        head = self.head
+        capacity = self.capacity
+        flow = self.flow
+        succ = self.succ
+        seen = {t}
+        q = deque([t])
+        while q:
+            u = q.popleft()
+            for e in succ[u]:
+                v = head[e]
+                e ^= 1
+                if v not in seen and flow[e] < capacity[e]:
+                    seen.add(v)
+                    q.append(v)
+        return set(range(len(self.nodes))) - seen
+
+    def to_residual_network(self):
+        """Returns the residual network as a DiGraph.
+
+        The DiGraph follows the conventions of
+        :func:`build_residual_network` and carries the current flow.
+        """
+        R = nx.DiGraph()
+        nodes = self.nodes
+        R.add_nodes_from(nodes)
+        head = self.head
+        capacity = self.capacity
+        flow = self.flow
+        for u, arcs in zip(nodes, self.succ):
+            for e in arcs:
+                R.add_edge(u, nodes[head[e]], capacity=capacity[e],
+                           flow=flow[e])
+        R.graph.update(self.graph)
+        return R
+
+
+def build_array_residual_network(G, capacity):
+    """Build an array residual network and initialize a zero flow.
+
+    The result has the arcs of :func:`build_residual_network` in integer
+    arrays; see :class:`ArrayResidualNetwork`. It can be passed as the
+    `residual` argument of the maximum flow functions, and is reusable
+    across calls on the same graph.
+    """
+    if G.is_multigraph():
+        raise nx.NetworkXError(
+            'MultiGraph and MultiDiGraph not supported (yet).')
+
+    inf = float('inf')
+    edge_list = [(u, v, attr) for u, v, attr in G.edges(data=True)
+                 if u != v and attr.get(capacity, inf) > 0]
+    # Simulate infinity as in build_residual_network.
+    inf = 3 * sum(attr[capacity] for u, v, attr in edge_list
+                  if capacity in attr and attr[capacity] != inf) or 1
+
+    nodes = list(G)
+    index = {u: i for i, u in enumerate(nodes)}
+    head = []
+    caps = []
+    succ = [[] for u in nodes]
+    directed = G.is_directed()
+    G_succ = G._adj
+    # Arcs (u, v) already created as the reverse of a reciprocal edge.
+    pending = {}
+    for u, v, attr in edge_list:
+        r = min(attr.get(capacity, inf), inf)
+        i = index[u]
+        j = index[v]
+        if directed:
+            e = pending.pop((i, j), None)
+            if e is not None:
+                caps[e] = r
+                continue
+            if u in G_succ[v]:
+                pending[(j, i)] = len(head) + 1
+            rr = 0
+        else:
+            rr = r
+        succ[i].append(len(head))
+        head.append(j)
+        caps.append(r)
+        succ[j].append(len(head))
+        head.append(i)
+        caps.append(rr)
+
+    return ArrayResidualNetwork(nodes, head, caps, succ, inf)
+
+
 def detect_unboundedness(R, s, t):
     """Detect an infinite-capacity s-t path in R.
     """
+    if isinstance(R, ArrayResidualNetwork):
+        _detect_unboundedness_array(R, R.index[s], R.index[t])
+        return
     q = deque([s])
     seen = set([s])
     inf = R.graph['inf']
@@ -159,9 +320,40 @@ def detect_unboundedness(R, s, t):
                 q.append(v)
 
 
+def _detect_unboundedness_array(R, s, t):
+    """Detect an infinite-capacity s-t path in an array residual network.
+    """
+    head = R.head
+    capacity = R.capacity
+    succ = R.succ
+    inf = R.graph['inf']
+    q = deque([s])
+    seen = {s}
+    while q:
+        u = q.popleft()
+        for e in succ[u]:
+            v = head[e]
+            if capacity[e] == inf and v not in seen:
+                if v == t:
+                    raise nx.NetworkXUnbounded(
+                        'Infinite capacity path, flow unbounded above.')
+                seen.add(v)
+                q.append(v)
+
+
 def build_flow_dict(G, R):
     """Build a flow dictionary from a residual network.
     """
+    if isinstance(R, ArrayResidualNetwork):
+        nodes = R.nodes
+        head = R.head
+        flow = R.flow
+        flow_dict = {}
+        for u, arcs in zip(nodes, R.succ):
+            flow_dict[u] = {v: 0 for v in G[u]}
+            flow_dict[u].update((nodes[head[e]], flow[e]) for e in arcs
+                                if flow[e] > 0)
+        return flow_dict
     flow_dict = {}
     for u in G:
         flow_dict[u] = {v: 0 for v in G[u]}
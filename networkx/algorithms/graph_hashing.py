@@ -0,0 +1,452 @@
+# -*- coding: utf-8 -*-
+#    Copyright (C) 2019 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+"""
+Functions for hashing graphs to strings.
+
+Isomorphic graphs have the same hash, so that large collections of graphs
+can be grouped or deduplicated by hash instead of by pairwise calls to
+:func:`~networkx.algorithms.isomorphism.is_isomorphic`.
+
+The Weisfeiler-Lehman hash is fast, but two graphs that are not
+isomorphic may have the same hash. The canonical hash is slower, but it
+is equal exactly for isomorphic graphs, up to hash collisions.
+"""
+from collections import Counter, deque
+import hashlib
+
+import networkx as nx
+from networkx.utils import not_implemented_for, UnionFind
+
+__all__ = ['weisfeiler_lehman_graph_hash',
+           'canonical_labeling',
+           'canonical_graph_hash']
+
+
+def _hash_label(label, digest_size):
+    return hashlib.sha256(label.encode('utf-8')).hexdigest()[:2 * digest_size]
+
+
+def _edge_label(d, edge_attr):
+    return '' if edge_attr is None else str(d.get(edge_attr))
+
+
+@not_implemented_for('multigraph')
+def weisfeiler_lehman_graph_hash(G, edge_attr=None, node_attr=None,
+                                 iterations=3, digest_size=16):
+    """Returns the Weisfeiler-Lehman hash of a graph.
+
+    Each node starts with its `node_attr` attribute as label, or with its
+    degree if `node_attr` is None. At each iteration the label of a node
+    is replaced by a hash of the label together with the sorted labels of
+    its neighbors, combined with the `edge_attr` attribute of the edges to
+    them [1]_. The graph hash is a hash of the counts of the labels found
+    at all iterations.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+        An undirected or directed graph.
+
+    edge_attr : string, optional (default=None)
+        The edge attribute used in the hash. If None, edge attributes
+        are ignored.
+
+    node_attr : string, optional (default=None)
+        The node attribute used in the hash. If None, the initial label
+        of each node is its degree.
+
+    iterations : int, optional (default=3)
+        Number of neighborhood aggregations to perform. More iterations
+        tell more graphs apart, at a higher cost.
+
+    digest_size : int, optional (default=16)
+        Size in bytes of the hash and of the intermediate labels, at
+        most 32.
+
+    Returns
+    -------
+    h : string
+        Hexadecimal string of the hash of the graph.
+
+    Raises
+    ------
+    NetworkXNotImplemented
+        If G is a multigraph.
+
+    Examples
+    --------
+    Isomorphic graphs have the same hash:
+
+    >>> G1 = nx.Graph([(1, 2), (2, 3), (3, 4)])
+    >>> G2 = nx.Graph([('a', 'b'), ('c', 'b'), ('c', 'd')])
+    >>> (nx.weisfeiler_lehman_graph_hash(G1) ==
+    ...  nx.weisfeiler_lehman_graph_hash(G2))
+    True
+
+    Attributes are taken into account when given:
+
+    >>> nx.set_edge_attributes(G1, {(1, 2): 'C-C', (2, 3): 'C=C',
+    ...                             (3, 4): 'C-C'}, 'bond')
+    >>> nx.set_edge_attributes(G2, {('a', 'b'): 'C=C', ('c', 'b'): 'C-C',
+    ...                             ('c', 'd'): 'C-C'}, 'bond')
+    >>> (nx.weisfeiler_lehman_graph_hash(G1, edge_attr='bond') ==
+    ...  nx.weisfeiler_lehman_graph_hash(G2, edge_attr='bond'))
+    False
+
+    Notes
+    -----
+    Attribute values are compared through their string representation,
+    so that for instance the values `1` and `'1'` are not told apart.
+
+    Graphs with different hashes are not isomorphic, but graphs with the
+    same hash may not be isomorphic, for instance two regular graphs
+    with the same degree and number of nodes. Use
+    :func:`canonical_graph_hash` when the hash must tell all
+    non-isomorphic graphs apart.
+
+    See Also
+    --------
+    canonical_graph_hash
+    networkx.algorithms.isomorphism.could_be_isomorphic
+
+    References
+    ----------
+    .. [1] Nino Shervashidze, Pascal Schweitzer, Erik Jan van Leeuwen,
+       Kurt Mehlhorn and Karsten M. Borgwardt,
+       "Weisfeiler Lehman Graph Kernels",
+       Journal of Machine Learning Research, 12, pp. 2539-2561, 2011.
+    """
+    if node_attr is None:
+        labels = {n: str(d) for n, d in G.degree()}
+    else:
+        labels = {n: str(d.get(node_attr)) for n, d in G.nodes(data=True)}
+    # For directed graphs the successors and predecessors of a node are
+    # aggregated apart.
+    adjs = [G._succ, G._pred] if G.is_directed() else [G._adj]
+    items = []
+    for i in range(iterations):
+        new_labels = {}
+        for n, label in labels.items():
+            parts = [label]
+            for adj in adjs:
+                nbrs = sorted(labels[m] + ':' + _edge_label(d, edge_attr)
+                              for m, d in adj[n].items())
+                parts.append('(' + ','.join(nbrs) + ')')
+            new_labels[n] = _hash_label(''.join(parts), digest_size)
+        labels = new_labels
+        items.extend(sorted(Counter(labels.values()).items()))
+    return _hash_label(str(items), digest_size)
+
+
+def _canonical_form(G, edge_attr, node_attr):
+    """Returns the canonical order of the nodes of G and the certificate
+    of the graph relabeled in that order.
+
+    The search individualizes the nodes of the first non-singleton cell
+    of an equitable ordered partition one at a time and refines the
+    partition, until all cells are singletons. Each leaf of this search
+    tree gives an order of the nodes, and the canonical order is the one
+    with the smallest refinement traces and certificate. Branches whose
+    traces already exceed the best leaf, and branches equivalent under an
+    automorphism found between two leaves, are pruned.
+    """
+    nodes = list(G)
+    n = len(nodes)
+    index = {v: i for i, v in enumerate(nodes)}
+    if node_attr is None:
+        nlab = [''] * n
+    else:
+        nlab = [str(G.nodes[v].get(node_attr)) for v in nodes]
+    adjs = [G._succ, G._pred] if G.is_directed() else [G._adj]
+    nbrs = [[[(index[w], _edge_label(d, edge_attr))
+              for w, d in adj[v].items()] for v in nodes] for adj in adjs]
+    directed = G.is_directed()
+
+    def refine(lab, cell_of, size, splitters):
+        # Split the cells of the ordered partition in place by the number
+        # of neighbors their nodes have in each splitter cell, until the
+        # partition is equitable. lab lists the nodes in partition order,
+        # cell_of gives the start of the cell of each node and size the
+        # size of the cell starting at each position. The trace records
+        # the splits, which depend only on the graph and the nodes
+        # individualized so far, not on node names.
+        trace = []
+        queue = deque(splitters)
+        pending = set(splitters)
+        while queue:
+            ws = queue.popleft()
+            pending.discard(ws)
+            counts = {}
+            for x in lab[ws:ws + size[ws]]:
+                for d, nbr in enumerate(nbrs):
+                    for v, el in nbr[x]:
+                        counts.setdefault(v, []).append((d, el))
+            touched = {}
+            for v, key in counts.items():
+                key.sort()
+                touched.setdefault(cell_of[v], []).append(v)
+            for s in sorted(touched):
+                k = size[s]
+                if k == 1:
+                    continue
+                groups = {}
+                for v in touched[s]:
+                    groups.setdefault(tuple(counts[v]), []).append(v)
+                if len(touched[s]) < k:
+                    groups[()] = [v for v in lab[s:s + k] if v not in counts]
+                if len(groups) == 1:
+                    continue
+                keys = sorted(groups)
+                fragments = [groups[key] for key in keys]
+                trace.append((s, tuple((key, len(f))
+                                       for key, f in zip(keys, fragments))))
+                # All fragments but the first largest one are new
+                # splitters, unless the cell was still to be used as one.
+                was_pending = s in pending
+                largest = max(map(len, fragments))
+                skipped = False
+                pos = s
+                for f in fragments:
+                    lab[pos:pos + len(f)] = f
+                    for v in f:
+                        cell_of[v] = pos
+                    size[pos] = len(f)
+                    if not was_pending and not skipped and len(f) == largest:
+                        skipped = True
+                    elif pos not in pending:
+                        queue.append(pos)
+                        pending.add(pos)
+                    pos += len(f)
+        return tuple(trace)
+
+    def certificate(order):
+        pos = [0] * n
+        for i, v in enumerate(order):
+            pos[v] = i
+        edges = []
+        for v in range(n):
+            for w, el in nbrs[0][v]:
+                if directed or pos[v] <= pos[w]:
+                    edges.append((pos[v], pos[w], el))
+        return tuple(nlab[v] for v in order), tuple(sorted(edges))
+
+    initial = {}
+    for v in range(n):
+        initial.setdefault(nlab[v], []).append(v)
+    lab = []
+    cell_of = [0] * n
+    size = [0] * n
+    for key in sorted(initial):
+        for v in initial[key]:
+            cell_of[v] = len(lab)
+        size[len(lab)] = len(initial[key])
+        lab.extend(initial[key])
+    trace = refine(lab, cell_of, size, sorted(set(cell_of)))
+    best_traces = best_cert = best_order = None
+    best_prefix = None
+
+    def frame(lab, cell_of, size, traces, prefix):
+        # The partition, the traces and the individualized nodes that led
+        # to it, the start of its target cell, the position of the next
+        # child to try in that cell, the children tried so far, and the
+        # orbits of the target cell under the automorphisms found that
+        # fix the individualized nodes.
+        t = next((s for s in range(n) if cell_of[lab[s]] == s and
+                  size[s] > 1), None)
+        orbits = None if t is None else UnionFind(lab[t:t + size[t]])
+        return [(lab, cell_of, size), traces, prefix, t, 0, [], orbits]
+
+    stack = [frame(lab, cell_of, size, [trace], [])]
+    while stack:
+        top = stack[-1]
+        partition, traces, prefix, t, i, tried, orbits = top
+        lab, cell_of, size = partition
+        if t is None:
+            # A leaf: all cells are singletons.
+            stack.pop()
+            cert = certificate(lab)
+            if best_traces is None or (traces, cert) < (best_traces,
+                                                         best_cert):
+                best_traces, best_cert = traces, cert
+                best_order, best_prefix = lab, prefix
+            elif cert == best_cert:
+                # The automorphism that maps this leaf to the best one
+                # maps the subtree of the best leaf below the level where
+                # the two paths split onto the current one, which needs
+                # no further search. It fixes the individualized nodes of
+                # every frame left on the stack, so it merges orbits in
+                # all of them and need not be kept. Only the nodes it
+                # moves matter.
+                moved = [(v, w) for v, w in zip(lab, best_order) if v != w]
+                d = 0
+                while prefix[d] == best_prefix[d]:
+                    d += 1
+                del stack[d + 1:]
+                for f in stack:
+                    f_cell_of = f[0][1]
+                    for v, w in moved:
+                        if f_cell_of[v] == f[3]:
+                            f[6].union(v, w)
+            continue
+        if best_traces is not None and traces > best_traces[:len(traces)]:
+            stack.pop()
+            continue
+        k = size[t]
+        if i == k:
+            stack.pop()
+            continue
+        top[4] += 1
+        w = lab[t + i]
+        # Skip w if it is in the orbit of a child already tried.
+        root = orbits[w]
+        if any(orbits[v] == root for v in tried):
+            continue
+        tried.append(w)
+        # Individualize w: it becomes a singleton cell in front of the
+        # rest of the target cell, and the only splitter needed.
+        child_lab = lab[:]
+        child_lab[t:t + k] = [w] + [v for v in lab[t:t + k] if v != w]
+        child_cell_of = cell_of[:]
+        child_size = size[:]
+        for v in child_lab[t + 1:t + k]:
+            child_cell_of[v] = t + 1
+        child_size[t] = 1
+        child_size[t + 1] = k - 1
+        trace = refine(child_lab, child_cell_of, child_size, [t])
+        child_traces = traces + [trace]
+        if (best_traces is not None and
+                child_traces > best_traces[:len(child_traces)]):
+            continue
+        stack.append(frame(child_lab, child_cell_of, child_size,
+                           child_traces, prefix + [w]))
+    return [nodes[v] for v in best_order], best_cert
+
+
+@not_implemented_for('multigraph')
+def canonical_labeling(G, edge_attr=None, node_attr=None):
+    """Returns a canonical numbering of the nodes of G.
+
+    Relabeling two isomorphic graphs with their canonical numberings
+    gives identical graphs, with the same edges and the same attributes
+    on the same nodes. The numbering is found by partition refinement
+    with individualization of nodes, with pruning of the search tree by
+    refinement traces and by automorphisms [1]_.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+        An undirected or directed graph.
+
+    edge_attr : string, optional (default=None)
+        The edge attribute that must be preserved. If None, edge
+        attributes are ignored.
+
+    node_attr : string, optional (default=None)
+        The node attribute that must be preserved. If None, node
+        attributes are ignored.
+
+    Returns
+    -------
+    labeling : dict
+        A dictionary from each node of G to an integer in `0, ..., n - 1`.
+
+    Raises
+    ------
+    NetworkXNotImplemented
+        If G is a multigraph.
+
+    Examples
+    --------
+    >>> G1 = nx.Graph([(0, 1), (1, 2), (1, 3)])
+    >>> G2 = nx.Graph([('a', 'd'), ('b', 'd'), ('c', 'd')])
+    >>> H1 = nx.relabel_nodes(G1, nx.canonical_labeling(G1))
+    >>> H2 = nx.relabel_nodes(G2, nx.canonical_labeling(G2))
+    >>> sorted(map(sorted, H1.edges())) == sorted(map(sorted, H2.edges()))
+    True
+
+    Notes
+    -----
+    Attribute values are compared through their string representation,
+    so that for instance the values `1` and `'1'` are not told apart.
+
+    The running time is exponential in the worst case, and the search is
+    meant for graphs of up to a few hundred nodes. Graphs with many
+    automorphisms, such as stars and complete bipartite graphs, are the
+    slowest. For such graphs the labeling may differ between two
+    isomorphic graphs by an automorphism, which gives the same relabeled
+    graph.
+
+    See Also
+    --------
+    canonical_graph_hash
+
+    References
+    ----------
+    .. [1] Brendan D. McKay and Adolfo Piperno,
+       "Practical graph isomorphism, II",
+       Journal of Symbolic Computation, 60, pp. 94-112, 2014.
+    """
+    order, cert = _canonical_form(G, edge_attr, node_attr)
+    return {v: i for i, v in enumerate(order)}
+
+
+@not_implemented_for('multigraph')
+def canonical_graph_hash(G, edge_attr=None, node_attr=None, digest_size=16):
+    """Returns a hash of the canonical form of a graph.
+
+    Two graphs have the same hash if and only if they are isomorphic,
+    preserving the given attributes, except for hash collisions.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+        An undirected or directed graph.
+
+    edge_attr : string, optional (default=None)
+        The edge attribute used in the hash. If None, edge attributes are
+        ignored.
+
+    node_attr : string, optional (default=None)
+        The node attribute used in the hash. If None, node attributes are
+        ignored.
+
+    digest_size : int, optional (default=16)
+        Size in bytes of the hash, at most 32.
+
+    Returns
+    -------
+    h : string
+        Hexadecimal string of the hash of the graph.
+
+    Raises
+    ------
+    NetworkXNotImplemented
+        If G is a multigraph.
+
+    Examples
+    --------
+    Deduplicate a list of graphs up to isomorphism:
+
+    >>> graphs = [nx.path_graph(4), nx.star_graph(3),
+    ...           nx.relabel_nodes(nx.path_graph(4), {0: 'a', 3: 'b'})]
+    >>> unique = {nx.canonical_graph_hash(G): G for G in graphs}
+    >>> len(unique)
+    2
+
+    Notes
+    -----
+    Directed and undirected graphs with the same edges have different
+    hashes. See :func:`canonical_labeling` for the running time.
+
+    See Also
+    --------
+    canonical_labeling
+    weisfeiler_lehman_graph_hash
+    """
+    order, cert = _canonical_form(G, edge_attr, node_attr)
+    return _hash_label(repr((G.is_directed(), cert)), digest_size)
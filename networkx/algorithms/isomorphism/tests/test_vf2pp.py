@@ -0,0 +1,107 @@
+"""
+    Tests for the VF2++ matchers.
+"""
+
+from nose.tools import assert_equal, assert_true, assert_false, raises
+
+import networkx as nx
+from networkx.algorithms import isomorphism as iso
+
+
+def _mappings(matches):
+    return sorted(sorted(m.items()) for m in matches)
+
+
+def _compare(G1, G2, node_label=None, edge_label=None):
+    if G1.is_directed():
+        GM = iso.DiGraphMatcher
+        PM = iso.VF2ppDiGraphMatcher
+    else:
+        GM = iso.GraphMatcher
+        PM = iso.VF2ppGraphMatcher
+    nm = em = None
+    if node_label is not None:
+        nm = iso.categorical_node_match(node_label, None)
+    if edge_label is not None:
+        em = iso.categorical_edge_match(edge_label, None)
+    vf2 = GM(G1, G2, node_match=nm, edge_match=em)
+    vf2pp = PM(G1, G2, node_label=node_label, edge_label=edge_label)
+    assert_equal(_mappings(vf2pp.subgraph_isomorphisms_iter()),
+                 _mappings(vf2.subgraph_isomorphisms_iter()))
+    assert_equal(vf2pp.subgraph_is_isomorphic(), vf2.subgraph_is_isomorphic())
+    if len(G1) == len(G2):
+        assert_equal(_mappings(vf2pp.isomorphisms_iter()),
+                     _mappings(vf2.isomorphisms_iter()))
+        assert_equal(vf2pp.is_isomorphic(), vf2.is_isomorphic())
+
+
+class TestVF2pp(object):
+
+    def test_isomorphic(self):
+        G1 = nx.petersen_graph()
+        G2 = nx.relabel_nodes(G1, {n: (n * 3) % 10 for n in G1})
+        GM = iso.VF2ppGraphMatcher(G1, G2)
+        assert_true(GM.is_isomorphic())
+        assert_true(all(G2.has_edge(GM.mapping[u], GM.mapping[v])
+                        for u, v in G1.edges()))
+        assert_equal(len(list(GM.isomorphisms_iter())), 120)
+        assert_false(iso.VF2ppGraphMatcher(G1, nx.cycle_graph(10))
+                     .is_isomorphic())
+
+    def test_random_graphs(self):
+        for seed in range(20):
+            G1 = nx.gnp_random_graph(9, 0.4, seed=seed)
+            G2 = G1.subgraph(range(seed % 5, seed % 5 + 4))
+            _compare(G1, G2)
+            _compare(G1, nx.relabel_nodes(G1, {n: 8 - n for n in G1}))
+            D1 = nx.gnp_random_graph(8, 0.3, seed=seed, directed=True)
+            _compare(D1, D1.subgraph(range(4)))
+            _compare(D1, nx.gnp_random_graph(8, 0.3, seed=seed + 1,
+                                             directed=True))
+
+    def test_labels(self):
+        for G in (nx.cycle_graph(6), nx.cycle_graph(6, nx.DiGraph())):
+            for n in G:
+                G.nodes[n]['color'] = n % 2
+            for u, v in G.edges():
+                G.edges[u, v]['weight'] = 1 if u == 0 else 2
+            G.add_edge(2, 2, weight=3)
+            _compare(G, G.copy(), 'color', 'weight')
+            _compare(G, G.subgraph([1, 2, 3]), 'color', 'weight')
+            H = G.copy()
+            H.nodes[0]['color'] = 1
+            _compare(G, H, 'color', 'weight')
+            H = G.copy()
+            H.remove_edge(2, 2)
+            _compare(G, H, 'color', 'weight')
+
+    def test_default_label(self):
+        G1 = nx.path_graph(3)
+        G2 = nx.path_graph(3)
+        G1.nodes[0]['color'] = 'red'
+        GM = iso.VF2ppGraphMatcher(G1, G2, node_label='color',
+                                   default_label='red')
+        assert_equal(_mappings(GM.isomorphisms_iter()),
+                     [[(0, 0), (1, 1), (2, 2)], [(0, 2), (1, 1), (2, 0)]])
+        GM = iso.VF2ppGraphMatcher(G1, G2, node_label='color')
+        assert_false(GM.is_isomorphic())
+
+    def test_empty(self):
+        G = nx.path_graph(3)
+        GM = iso.VF2ppGraphMatcher(G, nx.Graph())
+        assert_equal(list(GM.subgraph_isomorphisms_iter()), [{}])
+        assert_false(GM.is_isomorphic())
+        assert_true(iso.VF2ppGraphMatcher(nx.Graph(), nx.Graph())
+                    .is_isomorphic())
+
+    @raises(nx.NetworkXNotImplemented)
+    def test_multigraph(self):
+        iso.VF2ppGraphMatcher(nx.MultiGraph(), nx.MultiGraph())
+
+    @raises(nx.NetworkXNotImplemented)
+    def test_directed(self):
+        iso.VF2ppGraphMatcher(nx.DiGraph(), nx.DiGraph())
+
+    @raises(nx.NetworkXNotImplemented)
+    def test_undirected(self):
+        iso.VF2ppDiGraphMatcher(nx.Graph(), nx.Graph())
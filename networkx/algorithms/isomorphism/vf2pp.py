@@ -0,0 +1,413 @@
+# -*- coding: utf-8 -*-
+#    Copyright (C) 2019 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+"""
+***************
+VF2++ Algorithm
+***************
+
+A matcher for graph isomorphism and node-induced subgraph isomorphism in
+the style of VF2++ [1]_.
+
+The matchers in this module answer the same questions as
+:class:`~networkx.algorithms.isomorphism.GraphMatcher` and
+:class:`~networkx.algorithms.isomorphism.DiGraphMatcher`, with the same
+methods, but they differ from VF2 in three ways:
+
+* The nodes of G2 are matched in an order fixed before the search: a
+  breadth first search from a node of rarest label and largest degree,
+  where each level is sorted so that nodes with the most neighbors already
+  in the order come first, then nodes of larger degree, then nodes of
+  rarer label. Each node is then tried only against the neighbors in G1 of
+  the image of a neighbor matched before it, which prunes most candidates
+  early.
+
+* The search is iterative, so no recursion limit has to be raised.
+
+* The state is kept in integer arrays: the nodes of both graphs are
+  numbered, and for each node the number of its neighbors already matched
+  is updated as pairs are added and removed, instead of building new
+  terminal sets at each step.
+
+Node and edge attributes are compared by equality of a single attribute,
+given by name, rather than by user functions; for more general semantic
+checks use the VF2 matchers.
+
+Examples
+--------
+>>> from networkx.algorithms import isomorphism
+>>> G1 = nx.path_graph(4)
+>>> G2 = nx.path_graph(4)
+>>> GM = isomorphism.VF2ppGraphMatcher(G1, G2)
+>>> GM.is_isomorphic()
+True
+>>> sorted(GM.mapping.items())
+[(0, 0), (1, 1), (2, 2), (3, 3)]
+
+Node labels restrict the matches:
+
+>>> G1 = nx.Graph([('C1', 'O'), ('C1', 'C2'), ('C2', 'H')])
+>>> nx.set_node_attributes(G1, {'C1': 'C', 'C2': 'C', 'O': 'O', 'H': 'H'},
+...                        'element')
+>>> G2 = nx.Graph([(0, 1)])
+>>> nx.set_node_attributes(G2, {0: 'C', 1: 'O'}, 'element')
+>>> GM = isomorphism.VF2ppGraphMatcher(G1, G2, node_label='element')
+>>> list(GM.subgraph_isomorphisms_iter())
+[{'C1': 0, 'O': 1}]
+
+References
+----------
+.. [1] Alpár Jüttner and Péter Madarasi,
+   "VF2++ -- An improved subgraph isomorphism algorithm",
+   Discrete Applied Mathematics, vol. 242, pp. 69-81, 2018.
+"""
+from collections import Counter
+
+import networkx as nx
+
+__all__ = ['VF2ppGraphMatcher',
+           'VF2ppDiGraphMatcher']
+
+
+class VF2ppGraphMatcher(object):
+    """VF2++ matcher for undirected graphs.
+
+    Suitable for Graph instances.
+    """
+
+    def __init__(self, G1, G2, node_label=None, edge_label=None,
+                 default_label=None):
+        """Initialize the matcher.
+
+        Parameters
+        ----------
+        G1, G2 : NetworkX Graph instances
+           The two graphs to check for isomorphism, or for a node-induced
+           subgraph of G1 isomorphic to G2.
+
+        node_label : string, optional (default=None)
+           Name of a node attribute that must be equal for matched nodes.
+           If None, node attributes are not considered.
+
+        edge_label : string, optional (default=None)
+           Name of an edge attribute that must be equal for matched edges.
+           If None, edge attributes are not considered.
+
+        default_label : optional (default=None)
+           Value used for nodes or edges without the attribute.
+
+        Raises
+        ------
+        NetworkXNotImplemented
+           If a graph is a multigraph, or if its direction does not fit
+           the matcher.
+
+        Examples
+        --------
+        >>> from networkx.algorithms import isomorphism
+        >>> G1 = nx.path_graph(4)
+        >>> G2 = nx.path_graph(4)
+        >>> GM = isomorphism.VF2ppGraphMatcher(G1, G2)
+        """
+        for G in (G1, G2):
+            if G.is_multigraph():
+                raise nx.NetworkXNotImplemented('not implemented for '
+                                                'multigraph type')
+            if G.is_directed() != self._directed:
+                raise nx.NetworkXNotImplemented(
+                    'not implemented for %s type' %
+                    ('directed' if G.is_directed() else 'undirected'))
+        self.G1 = G1
+        self.G2 = G2
+        self.node_label = node_label
+        self.edge_label = edge_label
+        self.default_label = default_label
+        self.test = 'graph'
+        self.mapping = {}
+        self._build()
+
+    _directed = False
+
+    def _build(self):
+        """Number the nodes and labels of both graphs, and store their
+        adjacency as lists of dicts from neighbor index to edge label.
+        """
+        labels = {}
+
+        def label_index(value):
+            return labels.setdefault(value, len(labels))
+
+        def arrays(G):
+            nodes = list(G)
+            index = {n: i for i, n in enumerate(nodes)}
+            if self.node_label is None:
+                nlab = [0] * len(nodes)
+            else:
+                nlab = [label_index(d.get(self.node_label,
+                                          self.default_label))
+                        for n, d in G.nodes(data=True)]
+            # Self loops are kept apart from the adjacency: a node can only
+            # be matched to a node with the same self loop, or none (-1).
+            loop = [-1] * len(nodes)
+            adjs = [G._succ, G._pred] if self._directed else [G._adj]
+            result = []
+            for adj in adjs:
+                nbrs = [{} for n in nodes]
+                for n, i in index.items():
+                    nbrs_i = nbrs[i]
+                    for m, d in adj[n].items():
+                        if self.edge_label is None:
+                            elab = 0
+                        else:
+                            elab = label_index(d.get(self.edge_label,
+                                                     self.default_label))
+                        if m == n:
+                            loop[i] = elab
+                        else:
+                            nbrs_i[index[m]] = elab
+                result.append(nbrs)
+            return nodes, nlab, loop, result
+
+        self._nodes1, self._nlab1, self._loop1, self._adj1 = arrays(self.G1)
+        self._nodes2, self._nlab2, self._loop2, self._adj2 = arrays(self.G2)
+        self._order, self._parent = self._matching_order()
+
+    def _matching_order(self):
+        """Returns the order in which the nodes of G2 are matched, and for
+        each node the index of a neighbor matched before it, or -1.
+        """
+        adj2 = self._adj2
+        nlab2 = self._nlab2
+        n2 = len(nlab2)
+        # Neighbors in either direction.
+        nbrs = [set().union(*(a[u] for a in adj2)) for u in range(n2)]
+        degree = [sum(len(a[u]) for a in adj2) for u in range(n2)]
+        freq = Counter(self._nlab1)
+        rarity = [freq[nlab2[u]] for u in range(n2)]
+
+        def root_key(u):
+            return (rarity[u], -degree[u], u)
+
+        def level_key(u):
+            return (conn[u], degree[u], -rarity[u], -u)
+
+        order = []
+        parent = [-1] * n2
+        conn = [0] * n2
+        seen = [False] * n2
+        for root in sorted(range(n2), key=root_key):
+            if seen[root]:
+                continue
+            seen[root] = True
+            level = [root]
+            while level:
+                next_level = []
+                # Within a level, take first the nodes with the most
+                # neighbors already ordered, then larger degree, then
+                # rarer label.
+                while level:
+                    u = max(level, key=level_key)
+                    level.remove(u)
+                    order.append(u)
+                    for v in nbrs[u]:
+                        conn[v] += 1
+                        if not seen[v]:
+                            seen[v] = True
+                            parent[v] = u
+                            next_level.append(v)
+                level = next_level
+        return order, parent
+
+    def _could_match(self):
+        """Returns False if a quick comparison of the node and degree
+        counts rules out any match for the current test.
+        """
+        n1 = len(self._nodes1)
+        n2 = len(self._nodes2)
+        if self.test == 'graph':
+            if n1 != n2:
+                return False
+            for a1, a2 in zip(self._adj1, self._adj2):
+                if (sorted(map(len, a1)) != sorted(map(len, a2))):
+                    return False
+            return (Counter(zip(self._nlab1, self._loop1)) ==
+                    Counter(zip(self._nlab2, self._loop2)))
+        return n1 >= n2
+
+    def _match(self):
+        """Generate the mappings from nodes of G1 to nodes of G2 for the
+        current test.
+        """
+        if not self._could_match():
+            return
+        nodes1 = self._nodes1
+        nodes2 = self._nodes2
+        nlab1 = self._nlab1
+        nlab2 = self._nlab2
+        loop1 = self._loop1
+        loop2 = self._loop2
+        adj1 = self._adj1
+        adj2 = self._adj2
+        order = self._order
+        parent = self._parent
+        n2 = len(nodes2)
+        induced = self.test == 'subgraph'
+        # core1[v] is the node of G2 matched to node v of G1, or -1, and
+        # core2 the reverse. For each direction, cnt1[d][v] counts the
+        # neighbors of v that are matched.
+        core1 = [-1] * len(nodes1)
+        core2 = [-1] * n2
+        cnt1 = [[0] * len(nodes1) for a in adj1]
+        cnt2 = [[0] * n2 for a in adj2]
+        # Matching v counts it as a matched predecessor of its successors
+        # and as a matched successor of its predecessors.
+        updates1 = list(zip(adj1, reversed(cnt1)))
+        updates2 = list(zip(adj2, reversed(cnt2)))
+        by_label = {}
+        for v, lab in enumerate(nlab1):
+            by_label.setdefault(lab, []).append(v)
+        degree1 = [[len(nbrs) for nbrs in a] for a in adj1]
+        degree2 = [[len(nbrs) for nbrs in a] for a in adj2]
+        # For a node of G2 with a parent, the direction of the edge from
+        # the parent, which gives the neighbors of the parent's image to
+        # try.
+        parent_dir = []
+        for u in order:
+            p = parent[u]
+            if p == -1:
+                parent_dir.append(-1)
+            else:
+                parent_dir.append(0 if u in adj2[0][p] else 1)
+
+        def candidates(depth):
+            u = order[depth]
+            p = parent[u]
+            if p == -1:
+                return iter(by_label.get(nlab2[u], ()))
+            return iter(adj1[parent_dir[depth]][core2[p]])
+
+        def feasible(u, v):
+            if core1[v] != -1 or nlab1[v] != nlab2[u] or loop1[v] != loop2[u]:
+                return False
+            for d in range(len(adj1)):
+                if induced:
+                    if degree1[d][v] < degree2[d][u]:
+                        return False
+                elif degree1[d][v] != degree2[d][u]:
+                    return False
+            for d in range(len(adj1)):
+                nbrs1 = adj1[d][v]
+                # Every matched neighbor of u must be matched to a
+                # neighbor of v through an edge with the same label, and
+                # v must have no other matched neighbor.
+                if cnt1[d][v] != cnt2[d][u]:
+                    return False
+                frontier2 = new2 = 0
+                for w, elab in adj2[d][u].items():
+                    m = core2[w]
+                    if m != -1:
+                        if nbrs1.get(m, -1) != elab:
+                            return False
+                    elif sum(c[w] for c in cnt2):
+                        frontier2 += 1
+                    else:
+                        new2 += 1
+                # Unmatched neighbors of u next to the matched nodes, and
+                # the others, need as many such neighbors of v.
+                frontier1 = new1 = 0
+                for m in nbrs1:
+                    if core1[m] == -1:
+                        if sum(c[m] for c in cnt1):
+                            frontier1 += 1
+                        else:
+                            new1 += 1
+                if induced:
+                    if frontier1 < frontier2 or new1 < new2:
+                        return False
+                elif frontier1 != frontier2 or new1 != new2:
+                    return False
+            return True
+
+        def add(u, v, step):
+            core1[v] = u
+            core2[u] = v
+            for a, c in updates1:
+                for m in a[v]:
+                    c[m] += step
+            for a, c in updates2:
+                for w in a[u]:
+                    c[w] += step
+
+        def remove(u):
+            v = core2[u]
+            add(u, v, -1)
+            core1[v] = -1
+            core2[u] = -1
+
+        if n2 == 0:
+            self.mapping = {}
+            yield self.mapping
+            return
+        stack = [candidates(0)]
+        while stack:
+            depth = len(stack) - 1
+            u = order[depth]
+            for v in stack[-1]:
+                if feasible(u, v):
+                    break
+            else:
+                stack.pop()
+                if stack:
+                    remove(order[depth - 1])
+                continue
+            add(u, v, 1)
+            if depth + 1 == n2:
+                self.mapping = {nodes1[core2[w]]: nodes2[w]
+                                for w in range(n2)}
+                yield self.mapping
+                remove(u)
+            else:
+                stack.append(candidates(depth + 1))
+
+    def is_isomorphic(self):
+        """Returns True if G1 and G2 are isomorphic graphs."""
+        try:
+            next(self.isomorphisms_iter())
+            return True
+        except StopIteration:
+            return False
+
+    def isomorphisms_iter(self):
+        """Generator over isomorphisms between G1 and G2."""
+        self.test = 'graph'
+        for mapping in self._match():
+            yield mapping
+
+    def subgraph_is_isomorphic(self):
+        """Returns True if a node-induced subgraph of G1 is isomorphic
+        to G2."""
+        try:
+            next(self.subgraph_isomorphisms_iter())
+            return True
+        except StopIteration:
+            return False
+
+    def subgraph_isomorphisms_iter(self):
+        """Generator over isomorphisms between node-induced subgraphs of
+        G1 and G2."""
+        self.test = 'subgraph'
+        for mapping in self._match():
+            yield mapping
+
+
+class VF2ppDiGraphMatcher(VF2ppGraphMatcher):
+    """VF2++ matcher for directed graphs.
+
+    Suitable for DiGraph instances.
+    """
+
+    _directed = True
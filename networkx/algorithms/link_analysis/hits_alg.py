@@ -209,8 +209,9 @@ def hits_numpy(G, normalized=True):
     return hubs, authorities
 
 
-def hits_scipy(G, max_iter=100, tol=1.0e-6, normalized=True):
-    """Returns HITS hubs and authorities values for nodes.
+def hits_scipy(G, max_iter=100, tol=1.0e-6, normalized=True, nstart=None,
+               norm='l1'):
+    r"""Returns HITS hubs and authorities values for nodes.
 
     The HITS algorithm computes two numbers for a node.
     Authorities estimates the node value based on the incoming links.
@@ -227,12 +228,20 @@ def hits_scipy(G, max_iter=100, tol=1.0e-6, normalized=True):
     tol : float, optional
       Error tolerance used to check convergence in power method iteration.
 
-    nstart : dictionary, optional
-      Starting value of each node for power method iteration.
-
     normalized : bool (default=True)
        Normalize results by the sum of all of the values.
 
+    nstart : dictionary, optional
+      Starting hub value of each node for power method iteration. Passing
+      the hubs of an earlier result for a similar graph usually saves
+      iterations.
+
+    norm : 'l1' or 'linf' (default='l1')
+       Norm in which the change of the authority vector between two
+       iterations is compared with `tol`. The $L_\infty$ norm bounds the
+       change of each single value and does not grow with the number of
+       nodes.
+
     Returns
     -------
     (hubs,authorities) : two-tuple of dictionaries
@@ -246,12 +255,15 @@ def hits_scipy(G, max_iter=100, tol=1.0e-6, normalized=True):
 
     Notes
     -----
-    This implementation uses SciPy sparse matrices.
+    This implementation uses SciPy sparse matrices. The authority matrix
+    $A^T A$ is never formed; each iteration multiplies by the adjacency
+    matrix $A$ and its transpose instead, so the memory used is that of
+    $A$ alone.
 
     The eigenvector calculation is done by the power iteration method
     and has no guarantee of convergence.  The iteration will stop
-    after max_iter iterations or an error tolerance of
-    number_of_nodes(G)*tol has been reached.
+    after max_iter iterations or when the change of the authority
+    vector, scaled to a maximum of one, is below `tol` in the chosen norm.
 
     The HITS algorithm was designed for directed graphs but this
     algorithm does not check if the input graph is directed and will
@@ -259,6 +271,9 @@ def hits_scipy(G, max_iter=100, tol=1.0e-6, normalized=True):
 
     Raises
     ------
+    NetworkXError
+        If `norm` is not 'l1' or 'linf'.
+
     PowerIterationFailedConvergence
         If the algorithm fails to converge to the specified tolerance
         within the specified number of iterations of the power iteration
@@ -283,32 +298,41 @@ def hits_scipy(G, max_iter=100, tol=1.0e-6, normalized=True):
             "hits_scipy() requires SciPy: http://scipy.org/")
     if len(G) == 0:
         return {}, {}
-    M = nx.to_scipy_sparse_matrix(G, nodelist=list(G))
-    (n, m) = M.shape  # should be square
-    A = M.T * M  # authority matrix
-    x = scipy.ones((n, 1)) / n  # initial guess
-    # power iteration on authority matrix
-    i = 0
-    while True:
+    try:
+        order = {'l1': 1, 'linf': np.inf}[norm]
+    except KeyError:
+        raise nx.NetworkXError("norm must be 'l1' or 'linf'")
+    nodelist = list(G)
+    M = nx.to_scipy_sparse_matrix(G, nodelist=nodelist)
+    MT = M.T  # a view of M, not a copy
+    n = len(nodelist)
+    if nstart is None:
+        x = np.ones(n) / n  # initial guess
+    else:
+        # authorities of the starting hubs
+        x = MT * np.array([nstart.get(v, 0) for v in nodelist], dtype=float)
+        if not x.any():
+            x = np.ones(n) / n
+    # power iteration on the authority matrix M^T M, applied as two
+    # sparse products so that the matrix is never formed
+    for _ in range(max_iter):
         xlast = x
-        x = A * x
+        x = MT * (M * x)
         x = x / x.max()
-        # check convergence, l1 norm
-        err = scipy.absolute(x - xlast).sum()
+        # check convergence
+        err = np.linalg.norm(x - xlast, order)
         if err < tol:
             break
-        if i > max_iter:
-            raise nx.PowerIterationFailedConvergence(max_iter)
-        i += 1
+    else:
+        raise nx.PowerIterationFailedConvergence(max_iter)
 
-    a = np.asarray(x).flatten()
-    # h=M*a
-    h = np.asarray(M * a).flatten()
+    a = x
+    h = M * a
     if normalized:
         h = h / h.sum()
         a = a / a.sum()
-    hubs = dict(zip(G, map(float, h)))
-    authorities = dict(zip(G, map(float, a)))
+    hubs = dict(zip(nodelist, map(float, h)))
+    authorities = dict(zip(nodelist, map(float, a)))
     return hubs, authorities
 
 # fixture for nose tests
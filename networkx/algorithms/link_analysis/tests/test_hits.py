@@ -92,3 +92,56 @@ class TestHITS:
     def test_hits_not_convergent(self):
         G = self.G
         networkx.hits(G, max_iter=0)
+
+    def test_hits_scipy_nstart(self):
+        try:
+            import scipy
+        except ImportError:
+            raise SkipTest('SciPy not available.')
+        G = self.G
+        h, a = networkx.hits_scipy(G, tol=1.e-08)
+        for nstart in (h, dict.fromkeys(G, 1), dict.fromkeys(G, 0)):
+            h2, a2 = networkx.hits_scipy(G, nstart=nstart, tol=1.e-08)
+            for n in G:
+                assert_almost_equal(h2[n], G.h[n], places=4)
+                assert_almost_equal(a2[n], G.a[n], places=4)
+
+    def test_hits_scipy_positional(self):
+        try:
+            import scipy
+        except ImportError:
+            raise SkipTest('SciPy not available.')
+        G = self.G
+        h, a = networkx.hits_scipy(G, 100, 1.e-08, False)
+        assert_almost_equal(max(a.values()), 1.0)
+        hsum = sum(h.values())
+        for n in G:
+            assert_almost_equal(h[n] / hsum, G.h[n], places=4)
+
+    def test_hits_scipy_linf(self):
+        try:
+            import scipy
+        except ImportError:
+            raise SkipTest('SciPy not available.')
+        G = self.G
+        h, a = networkx.hits_scipy(G, tol=1.e-08, norm='linf')
+        for n in G:
+            assert_almost_equal(h[n], G.h[n], places=4)
+        for n in G:
+            assert_almost_equal(a[n], G.a[n], places=4)
+
+    @raises(networkx.NetworkXError)
+    def test_hits_scipy_bad_norm(self):
+        try:
+            import scipy
+        except ImportError:
+            raise SkipTest('SciPy not available.')
+        networkx.hits_scipy(self.G, norm='l2')
+
+    @raises(networkx.PowerIterationFailedConvergence)
+    def test_hits_scipy_not_convergent(self):
+        try:
+            import scipy
+        except ImportError:
+            raise SkipTest('SciPy not available.')
+        networkx.hits_scipy(self.G, max_iter=0)
@@ -139,6 +139,28 @@ class TestCliques:
     def test_directed(self):
         cliques = nx.find_cliques(nx.DiGraph())
 
+    def test_find_cliques_bitset(self):
+        for G in (self.G, self.H, nx.empty_graph(3), nx.Graph()):
+            expected = sorted(map(sorted, nx.find_cliques(G)))
+            actual = sorted(map(sorted, nx.find_cliques_bitset(G)))
+            assert_equal(actual, expected)
+        self.G.add_edge(1, 1)
+        assert_equal(sorted(map(sorted, nx.find_cliques_bitset(self.G))),
+                     sorted(map(sorted, self.cl)))
+
+    def test_find_cliques_bitset_random(self):
+        for seed in range(5):
+            G = nx.gnp_random_graph(40, 0.4, seed=seed)
+            expected = sorted(map(sorted, nx.find_cliques(G)))
+            actual = sorted(map(sorted, nx.find_cliques_bitset(G)))
+            assert_equal(actual, expected)
+            assert_equal(nx.graph_clique_number(G),
+                         max(len(c) for c in expected))
+
+    @raises(nx.NetworkXNotImplemented)
+    def test_clique_number_directed(self):
+        nx.graph_clique_number(nx.DiGraph([(0, 1)]))
+
 
 class TestEnumerateAllCliques:
 
@@ -1,4 +1,6 @@
 #!/usr/bin/env python
+from itertools import combinations
+
 from nose.tools import *
 import networkx as nx
 
@@ -35,6 +37,15 @@ class TestTriangles:
         assert_equal(list(nx.triangles(G).values()), [5, 3, 3, 5, 5])
         assert_equal(nx.triangles(G, 1), 3)
 
+    def test_all_nodes_match_single_nodes(self):
+        G = nx.powerlaw_cluster_graph(100, 4, 0.5, seed=7)
+        G.add_edge(3, 3)
+        assert_equal(nx.triangles(G), nx.triangles(G, list(G)))
+
+    @raises(nx.NetworkXNotImplemented)
+    def test_multigraph(self):
+        nx.triangles(nx.MultiGraph([(0, 1), (1, 2), (2, 0)]))
+
 
 class TestDirectedClustering:
 
@@ -144,6 +155,16 @@ class TestWeightedClustering:
         assert_equal(nx.clustering(G)[0], 1.0 / 3.0)
         assert_equal(nx.clustering(G, weight='weight')[0], 1.0 / 6.0)
 
+    def test_all_nodes_match_single_nodes(self):
+        G = nx.powerlaw_cluster_graph(100, 4, 0.5, seed=7)
+        G.add_edge(3, 3, weight=5)
+        for u, v, d in G.edges(data=True):
+            d.setdefault('weight', (u * v) % 7 + 1)
+        c = nx.clustering(G, weight='weight')
+        c_nodes = nx.clustering(G, list(G), weight='weight')
+        for n in G:
+            assert_almost_equal(c[n], c_nodes[n])
+
 
 class TestClustering:
 
@@ -178,6 +199,11 @@ class TestClustering:
                      [5. / 6., 1.0, 1.0, 5. / 6., 5. / 6.])
         assert_equal(nx.clustering(G, [1, 4]), {1: 1.0, 4: 0.83333333333333337})
 
+    def test_all_nodes_match_single_nodes(self):
+        G = nx.powerlaw_cluster_graph(100, 4, 0.5, seed=7)
+        G.add_edge(3, 3)
+        assert_equal(nx.clustering(G), nx.clustering(G, list(G)))
+
 
 class TestTransitivity:
 
@@ -199,6 +225,12 @@ class TestTransitivity:
         G.remove_edge(1, 2)
         assert_equal(nx.transitivity(G), 0.875)
 
+    def test_triangles_and_triads(self):
+        G = nx.powerlaw_cluster_graph(100, 4, 0.5, seed=7)
+        triangles = sum(nx.triangles(G).values())
+        triads = sum(d * (d - 1) for v, d in G.degree())
+        assert_almost_equal(nx.transitivity(G), 2.0 * triangles / triads)
+
     # def test_clustering_transitivity(self):
     #     # check that weighted average of clustering is transitivity
     #     G = nx.complete_graph(5)
@@ -255,6 +287,34 @@ class TestSquareClustering:
         assert_equal(nx.square_clustering(G1, [1])[1], 2 / 6.0)
         assert_equal(nx.square_clustering(G2, [1])[1], 1 / 5.0)
 
+    def test_definition(self):
+        def c4(G, v):
+            squares = potential = 0
+            for u, w in combinations(G[v], 2):
+                q = len(set(G[u]) & set(G[w]) - {v})
+                theta = 1 if w in G[u] else 0
+                squares += q
+                potential += ((len(G[u]) - 1 - q - theta) *
+                              (len(G[w]) - 1 - q - theta) + q)
+            return squares / potential if potential else 0
+
+        for G in (nx.powerlaw_cluster_graph(100, 3, 0.4, seed=5),
+                  nx.gnm_random_graph(60, 300, seed=5),
+                  nx.algorithms.bipartite.random_graph(30, 40, 0.1, seed=5)):
+            c = nx.square_clustering(G)
+            for v in G:
+                assert_almost_equal(c[v], c4(G, v))
+            c = nx.square_clustering(G, [0, 1, 2])
+            assert_equal(sorted(c), [0, 1, 2])
+            for v in c:
+                assert_almost_equal(c[v], c4(G, v))
+
+    def test_self_loops(self):
+        G = nx.complete_graph(5)
+        G.add_edge(0, 0)
+        c = nx.square_clustering(G)
+        assert_equal(sorted(c), [0, 1, 2, 3, 4])
+
 
 def test_average_clustering():
     G = nx.cycle_graph(3)
@@ -1,4 +1,6 @@
 #!/usr/bin/env python
+import random
+
 from nose.tools import *
 import networkx as nx
 from networkx.testing.utils import *
@@ -124,3 +126,66 @@ class TestCore:
         # k=2
         k_corona_subgraph = nx.k_corona(self.H, k=0)
         assert_equal(sorted(k_corona_subgraph.nodes()), [0])
+
+
+class TestDynamicCoreDecomposition:
+    def test_matches_core_number(self):
+        rng = random.Random(42)
+        for seed in range(5):
+            G = nx.gnm_random_graph(30, 20 * (seed + 1), seed=seed)
+            cores = nx.DynamicCoreDecomposition(G)
+            for _ in range(100):
+                if rng.random() < 0.5 and G.number_of_edges() > 0:
+                    cores.remove_edge(*rng.choice(list(G.edges())))
+                elif rng.random() < 0.05:
+                    cores.remove_node(rng.choice(list(G)))
+                else:
+                    cores.add_edge(*rng.sample(range(35), 2))
+                assert_equal(cores.core_number(), nx.core_number(G))
+
+    def test_subgraphs(self):
+        t = TestCore()
+        t.setUp()
+        G = t.G.copy()
+        cores = nx.DynamicCoreDecomposition(G)
+        cores.add_edges_from([(13, 15), (14, 16)])
+        assert_equal(cores.core_number()[13], 3)
+        assert_nodes_equal(cores.k_core(3), nx.k_core(G, 3))
+        assert_nodes_equal(cores.k_shell(2), nx.k_shell(G, 2))
+        assert_nodes_equal(cores.k_crust(2), nx.k_crust(G, 2))
+        assert_nodes_equal(cores.k_corona(3), nx.k_corona(G, 3))
+        cores.remove_node(13)
+        assert_equal(cores.core_number(), nx.core_number(G))
+
+    def test_add_node(self):
+        G = nx.path_graph(3)
+        cores = nx.DynamicCoreDecomposition(G)
+        cores.add_node(5, color='red')
+        assert_equal(cores.core_number()[5], 0)
+        assert_equal(G.nodes[5]['color'], 'red')
+        cores.add_edge(0, 1, weight=2)
+        assert_equal(G[0][1]['weight'], 2)
+        assert_equal(cores.core_number(), nx.core_number(G))
+
+    @raises(nx.NetworkXNotImplemented)
+    def test_directed(self):
+        nx.DynamicCoreDecomposition(nx.DiGraph())
+
+    @raises(nx.NetworkXNotImplemented)
+    def test_multigraph(self):
+        nx.DynamicCoreDecomposition(nx.MultiGraph())
+
+    @raises(nx.NetworkXError)
+    def test_self_loop(self):
+        cores = nx.DynamicCoreDecomposition(nx.path_graph(3))
+        cores.add_edge(1, 1)
+
+    @raises(nx.NetworkXError)
+    def test_remove_missing_edge(self):
+        cores = nx.DynamicCoreDecomposition(nx.path_graph(3))
+        cores.remove_edge(0, 2)
+
+    @raises(nx.NetworkXError)
+    def test_remove_missing_node(self):
+        cores = nx.DynamicCoreDecomposition(nx.path_graph(3))
+        cores.remove_node(3)
@@ -0,0 +1,126 @@
+from nose.tools import assert_equal, assert_not_equal, assert_raises
+
+import networkx as nx
+from networkx.algorithms import isomorphism as iso
+
+
+def _shuffled(G, seed):
+    nodes = list(G)
+    nx.utils.create_py_random_state(seed).shuffle(nodes)
+    return nx.relabel_nodes(G, dict(zip(G, nodes)))
+
+
+def test_wl_relabeled():
+    for seed in range(10):
+        G = nx.gnp_random_graph(15, 0.3, seed=seed)
+        assert_equal(nx.weisfeiler_lehman_graph_hash(G),
+                     nx.weisfeiler_lehman_graph_hash(_shuffled(G, seed)))
+        D = nx.gnp_random_graph(15, 0.3, seed=seed, directed=True)
+        assert_equal(nx.weisfeiler_lehman_graph_hash(D),
+                     nx.weisfeiler_lehman_graph_hash(_shuffled(D, seed)))
+
+
+def test_wl_attributes():
+    G1 = nx.path_graph(4)
+    G2 = nx.path_graph(4)
+    nx.set_node_attributes(G1, {0: 'C', 1: 'O', 2: 'C', 3: 'C'}, 'element')
+    nx.set_node_attributes(G2, {0: 'C', 1: 'C', 2: 'O', 3: 'C'}, 'element')
+    assert_equal(nx.weisfeiler_lehman_graph_hash(G1, node_attr='element'),
+                 nx.weisfeiler_lehman_graph_hash(G2, node_attr='element'))
+    G2.nodes[2]['element'] = 'N'
+    assert_not_equal(
+        nx.weisfeiler_lehman_graph_hash(G1, node_attr='element'),
+        nx.weisfeiler_lehman_graph_hash(G2, node_attr='element'))
+    assert_equal(nx.weisfeiler_lehman_graph_hash(G1),
+                 nx.weisfeiler_lehman_graph_hash(G2))
+    nx.set_edge_attributes(G1, 1, 'order')
+    nx.set_edge_attributes(G2, 1, 'order')
+    G2.edges[0, 1]['order'] = 2
+    assert_not_equal(nx.weisfeiler_lehman_graph_hash(G1, edge_attr='order'),
+                     nx.weisfeiler_lehman_graph_hash(G2, edge_attr='order'))
+
+
+def test_wl_options():
+    G1 = nx.cycle_graph(6)
+    G2 = nx.Graph([(0, 1), (1, 2), (2, 0), (3, 4), (4, 5), (5, 3)])
+    # Regular graphs of the same degree cannot be told apart.
+    assert_equal(nx.weisfeiler_lehman_graph_hash(G1),
+                 nx.weisfeiler_lehman_graph_hash(G2))
+    assert_equal(len(nx.weisfeiler_lehman_graph_hash(G1, digest_size=8)), 16)
+    G = nx.path_graph(6)
+    assert_not_equal(nx.weisfeiler_lehman_graph_hash(G, iterations=1),
+                     nx.weisfeiler_lehman_graph_hash(G, iterations=2))
+    assert_not_equal(nx.weisfeiler_lehman_graph_hash(G),
+                     nx.weisfeiler_lehman_graph_hash(G.to_directed()))
+
+
+def test_canonical_random_graphs():
+    for seed in range(30):
+        directed = seed % 3 == 0
+        G1 = nx.gnp_random_graph(8, 0.4, seed=seed, directed=directed)
+        G2 = nx.gnp_random_graph(8, 0.4, seed=seed % 5, directed=directed)
+        G2 = _shuffled(G2, seed)
+        assert_equal(nx.is_isomorphic(G1, G2),
+                     nx.canonical_graph_hash(G1) ==
+                     nx.canonical_graph_hash(G2))
+        H = _shuffled(G1, seed)
+        assert_equal(nx.canonical_graph_hash(G1), nx.canonical_graph_hash(H))
+        C1 = nx.relabel_nodes(G1, nx.canonical_labeling(G1))
+        C2 = nx.relabel_nodes(H, nx.canonical_labeling(H))
+        assert_equal(set(C1.edges()), set(C2.edges()))
+
+
+def test_canonical_attributes():
+    nm = iso.categorical_node_match('color', None)
+    em = iso.categorical_edge_match('weight', None)
+    for seed in range(30):
+        rng = nx.utils.create_py_random_state(seed)
+        G1 = nx.gnp_random_graph(7, 0.5, seed=seed)
+        G2 = G1.copy()
+        for G in (G1, G2):
+            for n in G:
+                G.nodes[n]['color'] = rng.choice('rg')
+            for u, v in G.edges():
+                G.edges[u, v]['weight'] = rng.choice([1, 2])
+        G2.add_edge(0, 0, weight=1)
+        G1.add_edge(rng.choice(list(G1)), 0, weight=1)
+        G2 = _shuffled(G2, seed)
+        assert_equal(nx.is_isomorphic(G1, G2, node_match=nm, edge_match=em),
+                     nx.canonical_graph_hash(G1, 'weight', 'color') ==
+                     nx.canonical_graph_hash(G2, 'weight', 'color'))
+
+
+def test_canonical_symmetric_graphs():
+    for G in [nx.empty_graph(20), nx.complete_graph(10),
+              nx.petersen_graph(), nx.hypercube_graph(4),
+              nx.complete_bipartite_graph(5, 5), nx.cycle_graph(30),
+              nx.star_graph(80)]:
+        assert_equal(nx.canonical_graph_hash(G),
+                     nx.canonical_graph_hash(_shuffled(G, 42)))
+        assert_equal(sorted(nx.canonical_labeling(G).values()),
+                     list(range(len(G))))
+    assert_not_equal(nx.canonical_graph_hash(nx.cycle_graph(6)),
+                     nx.canonical_graph_hash(nx.Graph([(0, 1), (1, 2),
+                                                       (2, 0), (3, 4),
+                                                       (4, 5), (5, 3)])))
+    # The 4 x 4 rook's graph and the Shrikhande graph are strongly
+    # regular with the same parameters.
+    rook = nx.cartesian_product(nx.complete_graph(4), nx.complete_graph(4))
+    shrikhande = nx.Graph(((a, b), ((a + x) % 4, (b + y) % 4))
+                          for a in range(4) for b in range(4)
+                          for x, y in [(1, 0), (0, 1), (1, 1)])
+    assert_equal(nx.weisfeiler_lehman_graph_hash(rook),
+                 nx.weisfeiler_lehman_graph_hash(shrikhande))
+    assert_not_equal(nx.canonical_graph_hash(rook),
+                     nx.canonical_graph_hash(shrikhande))
+    assert_equal(nx.canonical_labeling(nx.Graph()), {})
+    assert_not_equal(nx.canonical_graph_hash(nx.path_graph(3)),
+                     nx.canonical_graph_hash(nx.path_graph(3, nx.DiGraph())))
+
+
+def test_multigraph():
+    G = nx.MultiGraph([(0, 1), (0, 1)])
+    assert_raises(nx.NetworkXNotImplemented,
+                  nx.weisfeiler_lehman_graph_hash, G)
+    assert_raises(nx.NetworkXNotImplemented, nx.canonical_labeling, G)
+    assert_raises(nx.NetworkXNotImplemented, nx.canonical_graph_hash, G)
@@ -23,3 +23,20 @@ def test_triadic_census():
                 '111D': 1, '300': 0, '120D': 0, '021C': 2}
     actual = nx.triadic_census(G)
     assert_equal(expected, actual)
+
+
+def test_triadic_census_all_triples():
+    """Compares the census with a count over all triples of nodes."""
+    from itertools import combinations
+    from networkx.algorithms.triads import TRICODE_TO_NAME
+
+    for seed in range(3):
+        G = nx.gnp_random_graph(25, 0.15, seed=seed, directed=True)
+        G.add_edge(0, 0)
+        expected = dict.fromkeys(TRICODE_TO_NAME.values(), 0)
+        for v, u, w in combinations(G, 3):
+            code = sum(x for a, b, x in ((v, u, 1), (u, v, 2), (v, w, 4),
+                                         (w, v, 8), (u, w, 16), (w, u, 32))
+                       if G.has_edge(a, b))
+            expected[TRICODE_TO_NAME[code]] += 1
+        assert_equal(nx.triadic_census(G), expected)
@@ -21,6 +21,7 @@ from networkx.utils import UnionFind, not_implemented_for
 __all__ = [
     'minimum_spanning_edges', 'maximum_spanning_edges',
     'minimum_spanning_tree', 'maximum_spanning_tree',
+    'DynamicMinimumSpanningForest',
 ]
 
 
@@ -299,10 +300,220 @@ def prim_mst_edges(G, minimum, weight='weight',
                     push(frontier, (new_weight, next(c), v, w, d2))
 
 
+def _spanning_edge_arrays(G, minimum, weight, ignore_nan):
+    """Returns the edges of `G` together with NumPy arrays describing them.
+
+    The returned tuple is ``(edges, u, v, w, eid)``, where `edges` is the
+    list of edges of `G` (with keys for multigraphs, always with data),
+    `u` and `v` are the integer indices of the endpoints in ``list(G)``,
+    `w` holds the weights, negated if `minimum` is False, and `eid` is
+    the position of each edge in `edges`. Edges with NaN weights are
+    dropped if `ignore_nan` is True.
+
+    """
+    import numpy as np
+    if G.is_multigraph():
+        edges = list(G.edges(keys=True, data=True))
+    else:
+        edges = list(G.edges(data=True))
+    index = {n: i for i, n in enumerate(G)}
+    m = len(edges)
+    u = np.fromiter((index[e[0]] for e in edges), dtype=np.intp, count=m)
+    v = np.fromiter((index[e[1]] for e in edges), dtype=np.intp, count=m)
+    w = np.fromiter((e[-1].get(weight, 1) for e in edges), dtype=float,
+                    count=m)
+    if not minimum:
+        w = -w
+    eid = np.arange(m)
+    nan = np.isnan(w)
+    if nan.any():
+        if not ignore_nan:
+            msg = "NaN found as an edge weight. Edge %s"
+            raise ValueError(msg % (edges[np.flatnonzero(nan)[0]],))
+        eid = np.flatnonzero(~nan)
+        u, v, w = u[eid], v[eid], w[eid]
+    return edges, u, v, w, eid
+
+
+def _format_spanning_edge(edge, is_multigraph, keys, data):
+    """Returns `edge` in the form requested by `keys` and `data`."""
+    if is_multigraph:
+        u, v, k, d = edge
+        if keys:
+            return (u, v, k, d) if data else (u, v, k)
+    else:
+        u, v, d = edge
+    return (u, v, d) if data else (u, v)
+
+
+def boruvka_numpy_mst_edges(G, minimum=True, weight='weight',
+                            keys=True, data=True, ignore_nan=False):
+    """Iterate over edges of a vectorized Borůvka min/max spanning tree.
+
+    Each round of Borůvka's algorithm selects the optimum edge leaving
+    every component of the current forest. Here a round is carried out
+    for all components at once with NumPy array operations over the
+    edge list, and components are merged with
+    :class:`~networkx.utils.union_find.ArrayUnionFind`. Edges joining two
+    nodes of the same component are discarded as soon as they are seen,
+    so later rounds only scan the remaining edges.
+
+    Parameters
+    ----------
+    G : NetworkX Graph
+        The graph holding the tree of interest. Edge weights must be
+        real numbers.
+
+    minimum : bool (default: True)
+        Find the minimum (True) or maximum (False) spanning tree.
+
+    weight : string (default: 'weight')
+        The name of the edge attribute holding the edge weights.
+
+    keys : bool (default: True)
+        If `G` is a multigraph, `keys` controls whether edge keys ar yielded.
+        Otherwise `keys` is ignored.
+
+    data : bool (default: True)
+        Flag for whether to yield edge attribute dicts.
+        If True, yield edges `(u, v, d)`, where `d` is the attribute dict.
+        If False, yield edges `(u, v)`.
+
+    ignore_nan : bool (default: False)
+        If a NaN is found as an edge weight normally an exception is raised.
+        If `ignore_nan is True` then that edge is ignored instead.
+
+    Notes
+    -----
+    Ties between equal weights are broken by the order of the edges in
+    ``G.edges()``, so, unlike :func:`boruvka_mst_edges`, edge weights do
+    not need to be distinct. The result is then the same forest as the
+    one found by :func:`kruskal_mst_edges`.
+
+    The edges are yielded round by round, not in order of weight.
+
+    """
+    import numpy as np
+    from networkx.utils import ArrayUnionFind
+
+    is_multigraph = G.is_multigraph()
+    edges, u, v, w, eid = _spanning_edge_arrays(G, minimum, weight,
+                                                ignore_nan)
+    # After a stable sort, the position of an edge is a distinct weight.
+    order = np.argsort(w, kind='mergesort')
+    u, v, eid = u[order], v[order], eid[order]
+    n = len(G)
+    forest = ArrayUnionFind(n)
+    pos = np.arange(len(eid))
+    while len(pos):
+        cu = forest.find_many(u[pos])
+        cv = forest.find_many(v[pos])
+        outgoing = cu != cv
+        pos, cu, cv = pos[outgoing], cu[outgoing], cv[outgoing]
+        if not len(pos):
+            break
+        # The optimum edge leaving each component is the one with the
+        # smallest position; an edge may be optimum for both its ends.
+        best = np.full(n, len(eid), dtype=np.intp)
+        np.minimum.at(best, cu, pos)
+        np.minimum.at(best, cv, pos)
+        chosen = np.unique(best[best < len(eid)])
+        forest.union_many(np.column_stack((u[chosen], v[chosen])))
+        for i in eid[chosen].tolist():
+            yield _format_spanning_edge(edges[i], is_multigraph, keys, data)
+
+
+#: Edge subsets at most this large are handled by plain Kruskal in
+#: :func:`filter_kruskal_mst_edges`.
+FILTER_KRUSKAL_THRESHOLD = 1024
+
+
+def filter_kruskal_mst_edges(G, minimum, weight='weight',
+                             keys=True, data=True, ignore_nan=False):
+    """Iterate over edges of a Filter-Kruskal min/max spanning tree.
+
+    Filter-Kruskal [1]_ splits the edges around a pivot weight, solves
+    the light half first and then discards, in one vectorized pass, the
+    heavy edges whose ends are already connected before solving what
+    remains. Only edge subsets of at most
+    :data:`FILTER_KRUSKAL_THRESHOLD` edges are sorted and scanned one
+    edge at a time as in :func:`kruskal_mst_edges`. On large sparse
+    graphs most heavy edges are filtered out without ever being sorted.
+
+    Parameters
+    ----------
+    G : NetworkX Graph
+        The graph holding the tree of interest. Edge weights must be
+        real numbers.
+
+    minimum : bool (default: True)
+        Find the minimum (True) or maximum (False) spanning tree.
+
+    weight : string (default: 'weight')
+        The name of the edge attribute holding the edge weights.
+
+    keys : bool (default: True)
+        If `G` is a multigraph, `keys` controls whether edge keys ar yielded.
+        Otherwise `keys` is ignored.
+
+    data : bool (default: True)
+        Flag for whether to yield edge attribute dicts.
+        If True, yield edges `(u, v, d)`, where `d` is the attribute dict.
+        If False, yield edges `(u, v)`.
+
+    ignore_nan : bool (default: False)
+        If a NaN is found as an edge weight normally an exception is raised.
+        If `ignore_nan is True` then that edge is ignored instead.
+
+    Notes
+    -----
+    Edges are yielded in order of weight, with ties broken by the order
+    of the edges in ``G.edges()``, so the result is the same forest as the
+    one found by :func:`kruskal_mst_edges`.
+
+    References
+    ----------
+    .. [1] Vitaly Osipov, Peter Sanders and Johannes Singler.
+       "The Filter-Kruskal Minimum Spanning Tree Algorithm."
+       Proceedings of ALENEX 2009, pp. 52-61.
+
+    """
+    import numpy as np
+    from networkx.utils import ArrayUnionFind
+
+    is_multigraph = G.is_multigraph()
+    edges, u, v, w, eid = _spanning_edge_arrays(G, minimum, weight,
+                                                ignore_nan)
+    forest = ArrayUnionFind(len(G))
+    # Stack of arrays of edge positions, lightest subset on top.
+    stack = [np.arange(len(eid))]
+    while stack:
+        idx = stack.pop()
+        idx = idx[forest.find_many(u[idx]) != forest.find_many(v[idx])]
+        if len(idx) > FILTER_KRUSKAL_THRESHOLD:
+            wi = w[idx]
+            pivot = np.partition(wi, len(wi) // 2)[len(wi) // 2]
+            light = wi <= pivot
+            if not light.all():
+                stack.append(idx[~light])
+                stack.append(idx[light])
+                continue
+        idx = idx[np.argsort(w[idx], kind='mergesort')]
+        for i, a, b in zip(idx.tolist(), u[idx].tolist(), v[idx].tolist()):
+            ra = forest[a]
+            rb = forest[b]
+            if ra != rb:
+                forest.parents[max(ra, rb)] = min(ra, rb)
+                yield _format_spanning_edge(edges[eid[i]], is_multigraph,
+                                            keys, data)
+
+
 ALGORITHMS = {
     'boruvka': boruvka_mst_edges,
     u'borůvka': boruvka_mst_edges,
+    'boruvka_numpy': boruvka_numpy_mst_edges,
     'kruskal': kruskal_mst_edges,
+    'filter_kruskal': filter_kruskal_mst_edges,
     'prim': prim_mst_edges
 }
 
@@ -325,7 +536,8 @@ def minimum_spanning_edges(G, algorithm='kruskal', weight='weight',
 
     algorithm : string
        The algorithm to use when finding a minimum spanning tree. Valid
-       choices are 'kruskal', 'prim', or 'boruvka'. The default is 'kruskal'.
+       choices are 'kruskal', 'prim', 'boruvka', 'boruvka_numpy', or
+       'filter_kruskal'. The default is 'kruskal'.
 
     weight : string
        Edge data key to use for weight (default 'weight').
@@ -385,6 +597,10 @@ def minimum_spanning_edges(G, algorithm='kruskal', weight='weight',
     For the other algorithms, if the graph edges do not have a weight
     attribute a default weight of 1 will be used.
 
+    The 'boruvka_numpy' and 'filter_kruskal' algorithms require NumPy.
+    They process the edges as arrays rather than one at a time, which
+    makes them much faster on large graphs.
+
     Modified code from David Eppstein, April 2006
     http://www.ics.uci.edu/~eppstein/PADS/
 
@@ -417,7 +633,8 @@ def maximum_spanning_edges(G, algorithm='kruskal', weight='weight',
 
     algorithm : string
        The algorithm to use when finding a maximum spanning tree. Valid
-       choices are 'kruskal', 'prim', or 'boruvka'. The default is 'kruskal'.
+       choices are 'kruskal', 'prim', 'boruvka', 'boruvka_numpy', or
+       'filter_kruskal'. The default is 'kruskal'.
 
     weight : string
        Edge data key to use for weight (default 'weight').
@@ -477,6 +694,10 @@ def maximum_spanning_edges(G, algorithm='kruskal', weight='weight',
     For the other algorithms, if the graph edges do not have a weight
     attribute a default weight of 1 will be used.
 
+    The 'boruvka_numpy' and 'filter_kruskal' algorithms require NumPy.
+    They process the edges as arrays rather than one at a time, which
+    makes them much faster on large graphs.
+
     Modified code from David Eppstein, April 2006
     http://www.ics.uci.edu/~eppstein/PADS/
     """
@@ -505,8 +726,8 @@ def minimum_spanning_tree(G, weight='weight', algorithm='kruskal',
 
     algorithm : string
        The algorithm to use when finding a minimum spanning tree. Valid
-       choices are 'kruskal', 'prim', or 'boruvka'. The default is
-       'kruskal'.
+       choices are 'kruskal', 'prim', 'boruvka', 'boruvka_numpy', or
+       'filter_kruskal'. The default is 'kruskal'.
 
     ignore_nan : bool (default: False)
         If a NaN is found as an edge weight normally an exception is raised.
@@ -534,6 +755,10 @@ def minimum_spanning_tree(G, weight='weight', algorithm='kruskal',
     For the other algorithms, if the graph edges do not have a weight
     attribute a default weight of 1 will be used.
 
+    The 'boruvka_numpy' and 'filter_kruskal' algorithms require NumPy.
+    They process the edges as arrays rather than one at a time, which
+    makes them much faster on large graphs.
+
     There may be more than one tree with the same minimum or maximum weight.
     See :mod:`networkx.tree.recognition` for more detailed definitions.
 
@@ -564,8 +789,8 @@ def maximum_spanning_tree(G, weight='weight', algorithm='kruskal',
 
     algorithm : string
        The algorithm to use when finding a maximum spanning tree. Valid
-       choices are 'kruskal', 'prim', or 'boruvka'. The default is
-       'kruskal'.
+       choices are 'kruskal', 'prim', 'boruvka', 'boruvka_numpy', or
+       'filter_kruskal'. The default is 'kruskal'.
 
     ignore_nan : bool (default: False)
         If a NaN is found as an edge weight normally an exception is raised.
@@ -595,6 +820,10 @@ def maximum_spanning_tree(G, weight='weight', algorithm='kruskal',
     For the other algorithms, if the graph edges do not have a weight
     attribute a default weight of 1 will be used.
 
+    The 'boruvka_numpy' and 'filter_kruskal' algorithms require NumPy.
+    They process the edges as arrays rather than one at a time, which
+    makes them much faster on large graphs.
+
     There may be more than one tree with the same minimum or maximum weight.
     See :mod:`networkx.tree.recognition` for more detailed definitions.
 
@@ -609,3 +838,234 @@ def maximum_spanning_tree(G, weight='weight', algorithm='kruskal',
     T.add_nodes_from(G.nodes.items())
     T.add_edges_from(edges)
     return T
+
+
+class DynamicMinimumSpanningForest(object):
+    """Minimum spanning forest maintained under edge updates.
+
+    The structure owns the updates of an undirected graph `G` and keeps
+    ``self.tree`` equal to a minimum spanning forest of `G` after each
+    one, by repairing the forest locally instead of running
+    :func:`minimum_spanning_tree` again:
+
+    - An edge that is added, or whose weight decreases, enters the forest
+      if it joins two trees, or if it is lighter than the heaviest edge
+      on the forest path between its ends, which it then replaces.
+    - A forest edge that is removed, or whose weight increases, is taken
+      out of the forest and the lightest edge of `G` reconnecting the two
+      resulting trees is put back in. Only the edges of the smaller tree
+      are scanned to find it.
+    - Other updates cannot change the forest.
+
+    `G` must only be modified through the methods of this class.
+
+    Parameters
+    ----------
+    G : undirected Graph
+        The graph to maintain a minimum spanning forest of.
+
+    weight : string (default: 'weight')
+        Edge data key to use for weight. Edges without this key have a
+        weight of 1.
+
+    ignore_nan : bool (default: False)
+        If a NaN is found as an edge weight normally an exception is raised.
+        If `ignore_nan is True` then that edge is never part of the forest.
+
+    Attributes
+    ----------
+    graph : Graph
+        The graph `G`.
+
+    tree : Graph
+        A minimum spanning forest of `G`, as returned by
+        :func:`minimum_spanning_tree`.
+
+    Raises
+    ------
+    NetworkXNotImplemented
+        If `G` is directed or a multigraph.
+
+    Examples
+    --------
+    >>> G = nx.Graph()
+    >>> G.add_weighted_edges_from([(0, 1, 1), (1, 2, 2), (2, 3, 3), (3, 0, 4)])
+    >>> msf = nx.DynamicMinimumSpanningForest(G)
+    >>> sorted(msf.tree.edges(data='weight'))
+    [(0, 1, 1), (1, 2, 2), (2, 3, 3)]
+    >>> msf.add_edge(0, 2, weight=0.5)
+    >>> sorted(msf.tree.edges(data='weight'))
+    [(0, 1, 1), (0, 2, 0.5), (2, 3, 3)]
+    >>> msf.remove_edge(0, 1)
+    >>> sorted(msf.tree.edges(data='weight'))
+    [(0, 2, 0.5), (1, 2, 2), (2, 3, 3)]
+
+    Notes
+    -----
+    Adding an edge costs a search of the forest path between its ends
+    and removing a forest edge costs a scan of the edges incident to the
+    smaller of the two trees it separates. Both are usually far cheaper
+    than recomputing the forest, but can be linear in the size of `G` in
+    the worst case; structures such as link-cut trees bound the path
+    search but have much higher constant factors in Python.
+
+    See Also
+    --------
+    minimum_spanning_tree
+
+    """
+
+    def __init__(self, G, weight='weight', ignore_nan=False):
+        if G.is_directed():
+            raise nx.NetworkXNotImplemented('not implemented for directed '
+                                            'type')
+        if G.is_multigraph():
+            raise nx.NetworkXNotImplemented('not implemented for multigraph '
+                                            'type')
+        self.graph = G
+        self.weight = weight
+        self.ignore_nan = ignore_nan
+        self.tree = minimum_spanning_tree(G, weight=weight,
+                                          ignore_nan=ignore_nan)
+
+    def _weight(self, d):
+        """Returns the weight in `d`, or None if it is an ignored NaN."""
+        wt = d.get(self.weight, 1)
+        if isnan(wt):
+            return None
+        return wt
+
+    def _check_nan(self, u, v, d):
+        if isnan(d.get(self.weight, 1)) and not self.ignore_nan:
+            msg = "NaN found as an edge weight. Edge %s"
+            raise ValueError(msg % ((u, v, d),))
+
+    def _link(self, u, v):
+        """Updates the forest for a new or lighter non-forest edge."""
+        if u == v:
+            return
+        G = self.graph
+        T = self.tree
+        wt = self._weight(G.adj[u][v])
+        if wt is None:
+            return
+        try:
+            path = nx.bidirectional_shortest_path(T, u, v)
+        except nx.NetworkXNoPath:
+            T.add_edge(u, v, **G.adj[u][v])
+            return
+        heaviest = max(zip(path, path[1:]),
+                       key=lambda e: self._weight(G.adj[e[0]][e[1]]))
+        if self._weight(G.adj[heaviest[0]][heaviest[1]]) > wt:
+            T.remove_edge(*heaviest)
+            T.add_edge(u, v, **G.adj[u][v])
+
+    def _cut(self, u, v):
+        """Updates the forest after removing forest edge `(u, v)` from it.
+
+        The edge may still be in the graph, in which case it is a
+        candidate to reconnect the two trees.
+        """
+        G = self.graph
+        T = self.tree
+        T.remove_edge(u, v)
+        # Explore both trees in lockstep until the smaller one is done.
+        sides = [set(), set()]
+        searches = [nx.dfs_preorder_nodes(T, u), nx.dfs_preorder_nodes(T, v)]
+        i = 0
+        while True:
+            try:
+                sides[i].add(next(searches[i]))
+            except StopIteration:
+                side = sides[i]
+                break
+            i = 1 - i
+        best = None
+        minwt = float('inf')
+        for a in side:
+            for b, d in G.adj[a].items():
+                if b in side:
+                    continue
+                wt = self._weight(d)
+                if wt is not None and wt < minwt:
+                    minwt = wt
+                    best = a, b
+        if best is not None:
+            a, b = best
+            T.add_edge(a, b, **G.adj[a][b])
+
+    def add_node(self, n, **attr):
+        """Add the isolated node `n`, updating node attributes if present."""
+        self.graph.add_node(n, **attr)
+        self.tree.add_node(n, **attr)
+
+    def add_edge(self, u, v, **attr):
+        """Add an edge between `u` and `v`, or update its attributes.
+
+        Updating the weight of an existing edge updates the forest.
+
+        Raises
+        ------
+        ValueError
+            If the new weight is NaN and `ignore_nan` is False.
+        """
+        G = self.graph
+        T = self.tree
+        existed = G.has_edge(u, v)
+        d = dict(G.adj[u][v]) if existed else {}
+        old = self._weight(d) if existed else None
+        d.update(attr)
+        self._check_nan(u, v, d)
+        new = self._weight(d)
+        for n in (u, v):
+            if n not in G:
+                self.add_node(n)
+        G.add_edge(u, v, **attr)
+        if T.has_edge(u, v):
+            T.adj[u][v].update(attr)
+            if new is None or new > old:
+                self._cut(u, v)
+        elif new is not None and (old is None or new < old):
+            self._link(u, v)
+
+    def add_edges_from(self, ebunch_to_add, **attr):
+        """Add or update all the edges in `ebunch_to_add`.
+
+        Edges may be given as 2-tuples `(u, v)` or 3-tuples `(u, v, d)`
+        as for :meth:`Graph.add_edges_from`.
+        """
+        for e in ebunch_to_add:
+            dd = dict(attr)
+            if len(e) == 3:
+                dd.update(e[2])
+            self.add_edge(e[0], e[1], **dd)
+
+    def remove_edge(self, u, v):
+        """Remove the edge between `u` and `v`.
+
+        Raises
+        ------
+        NetworkXError
+            If there is not an edge between `u` and `v`.
+        """
+        self.graph.remove_edge(u, v)
+        if self.tree.has_edge(u, v):
+            self._cut(u, v)
+
+    def remove_node(self, n):
+        """Remove node `n` and its incident edges.
+
+        Raises
+        ------
+        NetworkXError
+            If `n` is not in the graph.
+        """
+        G = self.graph
+        if n not in G:
+            raise nx.NetworkXError("The node %s is not in the graph." % (n,))
+        # Remove non-forest edges first, as they never need a repair.
+        nbrs = sorted(G.adj[n], key=lambda m: self.tree.has_edge(n, m))
+        for m in nbrs:
+            self.remove_edge(n, m)
+        G.remove_node(n)
+        self.tree.remove_node(n)
@@ -8,8 +8,10 @@
 # NetworkX is distributed under a BSD license; see LICENSE.txt for more
 # information.
 """Unit tests for the :mod:`networkx.algorithms.tree.mst` module."""
+import random
 from unittest import TestCase
 
+from nose import SkipTest
 from nose.tools import assert_equal
 from nose.tools import raises, assert_raises
 
@@ -225,3 +227,114 @@ class TestPrim(MultigraphMSTTestBase, TestCase):
         G.add_edge(0, 1, key='b', weight=1)
         T = nx.maximum_spanning_tree(G)
         assert_edges_equal([(0, 1, 2)], list(T.edges(data='weight')))
+
+
+class NumpyMSTTestBase(MultigraphMSTTestBase):
+    # Abstract class
+
+    @classmethod
+    def setUpClass(cls):
+        try:
+            import numpy
+        except ImportError:
+            raise SkipTest('NumPy not available.')
+
+    def test_matches_kruskal(self):
+        """Tests that ties and large edge sets give Kruskal's forest."""
+        G = nx.gnm_random_graph(300, 3000, seed=42)
+        G.add_edges_from([(300, 301), (302, 303)])
+        rng = random.Random(42)
+        for u, v, d in G.edges(data=True):
+            d['weight'] = rng.randint(1, 20)
+        for find in (nx.minimum_spanning_edges, nx.maximum_spanning_edges):
+            expected = list(find(G, algorithm='kruskal', data=False))
+            actual = list(find(G, algorithm=self.algo, data=False))
+            assert_edges_equal(actual, expected)
+
+
+class TestBoruvkaNumpy(NumpyMSTTestBase, TestCase):
+    """Unit tests for computing a minimum (or maximum) spanning tree
+    using the vectorized version of Borůvka's algorithm.
+
+    """
+    algorithm = 'boruvka_numpy'
+
+
+class TestFilterKruskal(NumpyMSTTestBase, TestCase):
+    """Unit tests for computing a minimum (or maximum) spanning tree
+    using the Filter-Kruskal algorithm.
+
+    """
+    algorithm = 'filter_kruskal'
+
+    def test_edge_order(self):
+        G = nx.gnm_random_graph(200, 2000, seed=7)
+        rng = random.Random(7)
+        for u, v, d in G.edges(data=True):
+            d['weight'] = rng.random()
+        expected = list(nx.minimum_spanning_edges(G, data=False))
+        actual = list(nx.minimum_spanning_edges(G, algorithm=self.algo,
+                                                data=False))
+        assert_equal(actual, expected)
+
+
+class TestDynamicMinimumSpanningForest(object):
+
+    def assert_forest(self, msf):
+        expected = nx.minimum_spanning_tree(msf.graph, ignore_nan=True)
+        assert_graphs_equal(msf.tree, expected)
+
+    def test_random_updates(self):
+        rng = random.Random(42)
+        G = nx.gnm_random_graph(30, 60, seed=42)
+        for u, v, d in G.edges(data=True):
+            d['weight'] = rng.random()
+        msf = nx.DynamicMinimumSpanningForest(G)
+        self.assert_forest(msf)
+        for i in range(300):
+            op = rng.random()
+            edges = list(G.edges())
+            if op < 0.3 and edges:
+                msf.remove_edge(*rng.choice(edges))
+            elif op < 0.6 and edges:
+                u, v = rng.choice(edges)
+                msf.add_edge(u, v, weight=rng.random())
+            elif op < 0.97:
+                u, v = rng.randrange(32), rng.randrange(32)
+                msf.add_edge(u, v, weight=rng.random())
+            else:
+                msf.remove_node(rng.choice(list(G)))
+            self.assert_forest(msf)
+
+    def test_tree_edge_updates(self):
+        G = nx.Graph()
+        G.add_weighted_edges_from([(0, 1, 1), (1, 2, 2), (0, 2, 3)])
+        msf = nx.DynamicMinimumSpanningForest(G)
+        msf.add_edge(1, 2, weight=5, color='red')
+        assert_edges_equal(msf.tree.edges(data=True),
+                           [(0, 1, {'weight': 1}), (0, 2, {'weight': 3})])
+        msf.add_edge(0, 1, color='blue')
+        assert_equal(msf.tree[0][1], {'weight': 1, 'color': 'blue'})
+        msf.add_edges_from([(1, 2, {'weight': 0}), (3, 4)])
+        self.assert_forest(msf)
+        msf.add_node(5)
+        assert_nodes_equal(msf.tree, range(6))
+
+    def test_nan_weights(self):
+        G = nx.path_graph(3)
+        msf = nx.DynamicMinimumSpanningForest(G)
+        assert_raises(ValueError, msf.add_edge, 0, 1, weight=float('nan'))
+        assert_equal(G[0][1], {})
+        msf = nx.DynamicMinimumSpanningForest(G, ignore_nan=True)
+        msf.add_edge(0, 1, weight=float('nan'))
+        msf.add_edge(0, 2, weight=float('nan'))
+        assert_edges_equal(msf.tree.edges(), [(1, 2)])
+
+    @raises(nx.NetworkXError)
+    def test_remove_missing_edge(self):
+        msf = nx.DynamicMinimumSpanningForest(nx.path_graph(3))
+        msf.remove_edge(0, 2)
+
+    @raises(nx.NetworkXNotImplemented)
+    def test_multigraph(self):
+        nx.DynamicMinimumSpanningForest(nx.MultiGraph())
@@ -1,4 +1,5 @@
 from nose.tools import *
+from nose import SkipTest
 
 import networkx as nx
 
@@ -12,3 +13,52 @@ def test_unionfind():
     # Now we just make sure that no exception is raised.
     x = nx.utils.UnionFind()
     x.union(0, 'a')
+
+
+class TestArrayUnionFind(object):
+    numpy = 1  # nosetests attribute, use nosetests -a 'not numpy' to skip test
+
+    @classmethod
+    def setupClass(cls):
+        global np
+        try:
+            import numpy as np
+        except ImportError:
+            raise SkipTest('NumPy not available.')
+
+    def test_matches_unionfind(self):
+        G = nx.gnm_random_graph(100, 80, seed=17)
+        edges = np.array(list(G.edges()))
+        x = nx.utils.ArrayUnionFind(len(G))
+        x.union_many(edges)
+        expected = {frozenset(c) for c in nx.connected_components(G)}
+        assert_equal({frozenset(c) for c in x.to_sets()}, expected)
+        labels = x.to_groups()
+        assert_equal(labels.max() + 1, len(expected))
+        for c in expected:
+            assert_equal(len({labels[i] for i in c}), 1)
+            # sets are named by their smallest member
+            assert_true(all(x[i] == min(c) for i in c))
+
+    def test_find_many(self):
+        x = nx.utils.ArrayUnionFind(5)
+        x.union(4, 3)
+        x.union(3, 2)
+        assert_equal(x.find_many([0, 1, 2, 3, 4]).tolist(), [0, 1, 2, 2, 2])
+        assert_equal(x.find_many(np.array([], dtype=int)).tolist(), [])
+        assert_equal(len(x), 5)
+        assert_equal(list(x), [0, 1, 2, 3, 4])
+
+    def test_union_many_path(self):
+        # A long path given in the worst order for hooking.
+        n = 1000
+        x = nx.utils.ArrayUnionFind(n)
+        x.union_many([(i + 1, i) for i in reversed(range(n - 1))])
+        assert_equal(x.to_groups().tolist(), [0] * n)
+        x.union_many([])
+        assert_equal(x[n - 1], 0)
+
+    def test_to_groups(self):
+        x = nx.utils.ArrayUnionFind(6)
+        x.union_many([(5, 2), (4, 0)])
+        assert_equal(x.to_groups().tolist(), [0, 1, 2, 3, 0, 2])
@@ -103,3 +103,152 @@ class UnionFind:
             if r != heaviest:
                 self.weights[heaviest] += self.weights[r]
                 self.parents[r] = heaviest
+
+
+class ArrayUnionFind(object):
+    """Union-find data structure over the integers ``0, ..., n - 1``.
+
+    This is a variant of :class:`UnionFind` that stores the forest in a
+    NumPy array instead of a dictionary, so that whole arrays of items
+    can be found or merged at once with :meth:`find_many` and
+    :meth:`union_many`. It is intended for graphs whose nodes have been
+    relabeled to consecutive integers, for instance with
+    :func:`~networkx.relabel.convert_node_labels_to_integers`.
+
+    Each set is named by its smallest member, so the name of a set does
+    not depend on the order in which unions were performed.
+
+    Parameters
+    ----------
+    n : int
+        Number of items. The structure is initialized with the discrete
+        partition of ``range(n)``.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> partition = ArrayUnionFind(6)
+    >>> partition.union_many(np.array([[4, 5], [1, 3], [3, 0]]))
+    >>> partition.find_many([0, 1, 2, 3, 4, 5]).tolist()
+    [0, 0, 2, 0, 4, 4]
+    >>> partition.to_groups().tolist()
+    [0, 0, 1, 0, 2, 2]
+
+    Notes
+    -----
+    :meth:`union_many` merges all the given pairs in rounds: every round
+    finds the roots of all endpoints, attaches each larger root to the
+    smallest root it is paired with, and drops the pairs whose endpoints
+    already share a root. This is the hooking scheme of parallel
+    connected-components algorithms [1]_, and performs the same number
+    of array operations whatever the number of pairs in a round.
+
+    References
+    ----------
+    .. [1] Yossi Shiloach and Uzi Vishkin.
+       "An O(log n) parallel connectivity algorithm."
+       Journal of Algorithms 3.1 (1982): 57-67.
+
+    """
+
+    def __init__(self, n):
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError('ArrayUnionFind requires NumPy: '
+                              'http://scipy.org/')
+        # Invariant: parents[x] <= x, hence roots are the smallest members.
+        self.parents = np.arange(n, dtype=np.intp)
+
+    def __len__(self):
+        return len(self.parents)
+
+    def __iter__(self):
+        """Iterate through all items of this structure."""
+        return iter(range(len(self.parents)))
+
+    def __getitem__(self, object):
+        """Find and return the name of the set containing the object."""
+        parents = self.parents
+        path = [object]
+        root = parents[object]
+        while root != path[-1]:
+            path.append(root)
+            root = parents[root]
+        parents[path] = root
+        return int(root)
+
+    def find_many(self, objects):
+        """Returns an array with the name of the set of each object.
+
+        The found items are compressed to point directly to their root.
+        """
+        import numpy as np
+        objects = np.asarray(objects, dtype=np.intp)
+        parents = self.parents
+        roots = parents[objects]
+        while True:
+            next_roots = parents[roots]
+            if np.array_equal(next_roots, roots):
+                break
+            roots = next_roots
+        parents[objects] = roots
+        return roots
+
+    def union(self, *objects):
+        """Find the sets containing the objects and merge them all."""
+        if not objects:
+            return
+        roots = self.find_many(objects)
+        self.parents[roots] = roots.min()
+
+    def union_many(self, edges):
+        """Merge the sets containing the two ends of each pair in `edges`.
+
+        Parameters
+        ----------
+        edges : array_like
+            An integer array of shape ``(m, 2)``, or an iterable of
+            pairs of integers.
+        """
+        import numpy as np
+        edges = np.asarray(edges, dtype=np.intp).reshape(-1, 2)
+        u = edges[:, 0]
+        v = edges[:, 1]
+        parents = self.parents
+        while len(u):
+            ru = self.find_many(u)
+            rv = self.find_many(v)
+            keep = ru != rv
+            u, v, ru, rv = u[keep], v[keep], ru[keep], rv[keep]
+            # Hooking larger roots onto smaller ones cannot create cycles;
+            # concurrent hooks of the same root keep the smallest target.
+            np.minimum.at(parents, np.maximum(ru, rv), np.minimum(ru, rv))
+
+    def to_groups(self):
+        """Returns an array of compact labels, one per item.
+
+        Items in the same set share a label, and labels are consecutive
+        integers starting at 0, ordered by the smallest member of each
+        set.
+
+        """
+        import numpy as np
+        roots = self.find_many(np.arange(len(self.parents)))
+        return np.unique(roots, return_inverse=True)[1]
+
+    def to_sets(self):
+        """Iterates over the sets stored in this structure."""
+        import numpy as np
+        roots = self.find_many(np.arange(len(self.parents)))
+        for block in groups(dict(enumerate(roots.tolist()))).values():
+            yield block
+
+
+# fixture for nose tests
+def setup_module(module):
+    from nose import SkipTest
+    try:
+        import numpy
+    except ImportError:
+        raise SkipTest("NumPy not available")